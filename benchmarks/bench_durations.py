@@ -0,0 +1,62 @@
+"""
+Compares the vectorized duration parser with the row-wise isodate conversion.
+
+Usage: python benchmarks/bench_durations.py [--rows 200000] [--distinct 20000]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'yt_pipe_airflow', 'dags'))
+from durations import parse_durations, parse_duration_isodate  # noqa: E402
+
+
+def synthetic_durations(rows: int, distinct: int, seed: int = 0) -> pd.Series:
+    """
+    Duration strings shaped like the API output: mostly PT#M#S, some hours, days,
+    P0D, missing values and a few values only isodate understands.
+    """
+    rng = np.random.default_rng(seed)
+    seconds = rng.integers(0, 3 * 86400, distinct)
+    days, rest = np.divmod(seconds, 86400)
+    hours, rest = np.divmod(rest, 3600)
+    minutes, secs = np.divmod(rest, 60)
+
+    def fmt(d, h, m, s):
+        time_part = ''.join(f'{v}{u}' for v, u in ((h, 'H'), (m, 'M'), (s, 'S')) if v)
+        return (f'P{d}D' if d else 'P') + (f'T{time_part}' if time_part else ('' if d else '0D'))
+
+    pool = [fmt(*parts) for parts in zip(days, hours, minutes, secs)]
+    pool += ['P0D', 'PT1,5S', 'P1Y', None]
+    return pd.Series(np.asarray(pool, dtype=object)[rng.integers(0, len(pool), rows)])
+
+
+def timed(func, *args, repeat: int = 3) -> tuple:
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark ISO 8601 duration parsing')
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--distinct', type=int, default=20_000, help='Number of distinct duration strings')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    durations = synthetic_durations(args.rows, args.distinct)
+    row_wise, expected = timed(lambda s: s.apply(parse_duration_isodate).astype('float64'), durations, repeat=args.repeat)
+    vectorized, result = timed(parse_durations, durations, repeat=args.repeat)
+
+    assert result.equals(expected), 'vectorized parser differs from isodate'
+    print(f"rows={args.rows} distinct={args.distinct}")
+    print(f"isodate row-wise: {row_wise:.3f}s ({args.rows / row_wise:,.0f} rows/s)")
+    print(f"vectorized:       {vectorized:.3f}s ({args.rows / vectorized:,.0f} rows/s)")
+    print(f"speedup:          {row_wise / vectorized:.1f}x")
@@ -0,0 +1,80 @@
+"""
+Compares the vectorized salary parser with a row-by-row Python regex loop.
+
+Usage: python benchmarks/bench_salary.py [--rows 2000000] [--distinct 50000]
+"""
+import os
+import re
+import sys
+import argparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'jobs_dash'))
+from salary import SALARY_PATTERN, PERIOD_ALIASES, PERIODS_PER_YEAR, parse_salaries  # noqa: E402
+from bench_durations import timed  # noqa: E402
+
+PERIOD_TEXT = {'hour': 'an hour', 'day': 'a day', 'week': 'a week', 'month': 'a month', 'year': 'a year'}
+# Typical pay per period, used to draw realistic amounts
+PERIOD_SCALE = {'hour': 50, 'day': 400, 'week': 2000, 'month': 9000, 'year': 120000}
+
+
+def synthetic_salaries(rows: int, distinct: int, seed: int = 0) -> pd.Series:
+    """
+    Salary text shaped like Indeed's: mostly yearly ranges, some hourly/daily/monthly
+    pay, single amounts, "Up to"/"From" bounds, other currencies and missing values.
+    """
+    rng = np.random.default_rng(seed)
+    periods = rng.choice(list(PERIOD_TEXT), distinct, p=[0.15, 0.03, 0.02, 0.05, 0.75])
+    shapes = rng.choice(['range', 'single', 'up to', 'from'], distinct, p=[0.8, 0.1, 0.05, 0.05])
+    currencies = rng.choice(['$', '£', '€'], distinct, p=[0.9, 0.05, 0.05])
+
+    pool = []
+    for period, shape, currency in zip(periods, shapes, currencies):
+        low = rng.uniform(0.5, 1.2) * PERIOD_SCALE[period]
+        high = low * rng.uniform(1.05, 1.8)
+        fmt = '{:,.2f}' if period == 'hour' and rng.random() < 0.3 else '{:,.0f}'
+        amount = f"{currency}{fmt.format(low)}"
+        if shape == 'range':
+            amount += f" - {currency}{fmt.format(high)}"
+        prefix = {'up to': 'Up to ', 'from': 'From '}.get(shape, '')
+        pool.append(f"{prefix}{amount} {PERIOD_TEXT[period]}")
+    pool += [None, 'Competitive']
+    return pd.Series(np.asarray(pool, dtype=object)[rng.integers(0, len(pool), rows)])
+
+
+def parse_row_wise(salary: pd.Series) -> pd.Series:
+    """
+    Annual minimum (or maximum for "Up to") with one regex match per row.
+    """
+    pattern = re.compile(SALARY_PATTERN)
+
+    def parse(text):
+        match = pattern.match(text.lower()) if isinstance(text, str) else None
+        if match is None:
+            return np.nan
+        amount = float(match['low'].replace(',', '')) * (1000 if match['low_k'] else 1)
+        per_year = PERIODS_PER_YEAR[PERIOD_ALIASES.get(match['period'], 'year')]
+        return round(amount * per_year, 2)
+
+    return salary.map(parse).astype('float64')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark salary text parsing')
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--distinct', type=int, default=50_000, help='Number of distinct salary strings')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    salaries = synthetic_salaries(args.rows, args.distinct)
+    row_wise, expected = timed(parse_row_wise, salaries, repeat=args.repeat)
+    vectorized, result = timed(parse_salaries, salaries, repeat=args.repeat)
+
+    annual = result['Annual Min'].fillna(result['Annual Max']).rename(None)
+    assert annual.equals(expected), 'vectorized parser differs from the row-wise parser'
+    print(f"rows={args.rows} distinct={args.distinct}")
+    print(f"row-wise:   {row_wise:.3f}s ({args.rows / row_wise:,.0f} rows/s)")
+    print(f"vectorized: {vectorized:.3f}s ({args.rows / vectorized:,.0f} rows/s)")
+    print(f"speedup:    {row_wise / vectorized:.1f}x")
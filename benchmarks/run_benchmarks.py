@@ -0,0 +1,403 @@
+"""
+Reproducible performance benchmarks for the YouTube pipeline and both dashboards.
+
+Every benchmark runs on synthetic data from synthetic.py at each requested size
+and records its best wall time over --repeat runs, rows per second and the peak
+memory allocated while it runs. Results are written to JSON; passing a previous
+result file with --compare exits with status 1 when a benchmark got slower (or
+used more memory) than --max-slowdown allows, so regressions are caught before
+deploying.
+
+Usage:
+python benchmarks/run_benchmarks.py --sizes 1k 100k 1M --output results.json
+python benchmarks/run_benchmarks.py --suite jobs --compare baseline.json
+
+The etl suite imports youtube_etl, so it needs the pipeline's requirements
+(yt_pipe_airflow/requirements.txt) installed.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import subprocess
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+for module_dir in (os.path.join('yt_pipe_airflow', 'dags'), 'yt_dashboard', 'jobs_dash'):
+    sys.path.insert(0, os.path.join(REPO_DIR, module_dir))
+
+from synthetic import youtube_extract, job_postings  # noqa: E402
+
+DEFAULT_SIZES = ['1k', '10k', '100k']
+DEFAULT_CHUNK_SIZE = 100_000
+SIZE_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_size(text: str) -> int:
+    """
+    Parses "5000", "10k" or "10M" into a row count.
+    """
+    suffix = text[-1].lower()
+    if suffix in SIZE_SUFFIXES:
+        return int(float(text[:-1]) * SIZE_SUFFIXES[suffix])
+    return int(text)
+
+
+class Fixtures:
+    """
+    Input files for one size, created on first use and shared by every benchmark
+    of that size. Building them is never part of a timed run.
+    """
+
+    def __init__(self, workdir: str, rows: int, seed: int, chunk_size: int):
+        self.workdir = workdir
+        self.rows = rows
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self._cache = {}
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.workdir, name)
+
+    def _once(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def youtube_raw(self, extension: str = '.csv') -> str:
+        def build():
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            df = self._once('youtube_frame', lambda: youtube_extract(self.rows, self.seed))
+            path = self.path(f'raw{extension}')
+            if extension == '.parquet':
+                pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path)
+            else:
+                df.to_csv(path, index=False)
+            return path
+        return self._once(('youtube_raw', extension), build)
+
+    def youtube_transformed(self) -> str:
+        def build():
+            from youtube_etl import transform_youtube_data
+
+            path = self.path('transformed.parquet')
+            transform_youtube_data(self.youtube_raw('.parquet'), path, chunk_size=self.chunk_size)
+            return path
+        return self._once('youtube_transformed', build)
+
+    def channel_dataset(self) -> str:
+        def build():
+            from youtube_etl import load_youtube_data
+
+            output_folder = self.path('dataset')
+            load_youtube_data(self.youtube_transformed(), output_folder, 'bench', chunk_size=self.chunk_size)
+            return os.path.join(output_folder, 'bench_channel.csv')
+        return self._once('channel_dataset', build)
+
+    def channel_frame(self) -> pd.DataFrame:
+        from data import prepare_channel_data
+
+        return self._once('channel_frame', lambda: prepare_channel_data(self.channel_dataset()))
+
+    def jobs_raw(self) -> str:
+        def build():
+            path = self.path('jobs.csv')
+            job_postings(self.rows, self.seed).to_csv(path, index=False)
+            return path
+        return self._once('jobs_raw', build)
+
+    def jobs_frame(self) -> pd.DataFrame:
+        def build():
+            from build_dataset import build_job_dataset
+
+            artifact_path = self.path('job_data.parquet')
+            build_job_dataset(self.jobs_raw(), artifact_path, offline_geocoding=True)
+            return pd.read_parquet(artifact_path)
+        return self._once('jobs_frame', build)
+
+
+# Each benchmark takes the fixtures and returns the function to time
+
+def bench_transform_csv(fx: Fixtures):
+    from youtube_etl import transform_youtube_data
+    raw = fx.youtube_raw('.csv')
+    return lambda: transform_youtube_data(raw, fx.path('out.csv'), chunk_size=fx.chunk_size)
+
+
+def bench_transform_parquet(fx: Fixtures):
+    from youtube_etl import transform_youtube_data
+    raw = fx.youtube_raw('.parquet')
+    return lambda: transform_youtube_data(raw, fx.path('out.parquet'), chunk_size=fx.chunk_size)
+
+
+def bench_load(fx: Fixtures):
+    from youtube_etl import load_youtube_data
+    transformed = fx.youtube_transformed()
+    return lambda: load_youtube_data(transformed, fx.path('load'), 'bench', chunk_size=fx.chunk_size)
+
+
+def bench_transform_and_load(fx: Fixtures):
+    from youtube_etl import transform_and_load_youtube_data
+    raw = fx.youtube_raw('.parquet')
+    return lambda: transform_and_load_youtube_data(raw, fx.path('fused'), 'bench', chunk_size=fx.chunk_size)
+
+
+def bench_salary_parse(fx: Fixtures):
+    from build_dataset import parse_salary
+    salary = pd.read_csv(fx.jobs_raw(), usecols=['Salary'])['Salary']
+    return lambda: parse_salary(salary)
+
+
+def bench_jobs_prepare(fx: Fixtures):
+    from build_dataset import build_job_dataset
+    raw = fx.jobs_raw()
+    return lambda: build_job_dataset(raw, fx.path('job_data_bench.parquet'), offline_geocoding=True)
+
+
+def bench_search_build(fx: Fixtures):
+    from search_index import SearchIndex
+    df = fx.jobs_frame()
+    return lambda: SearchIndex.build(df)
+
+
+def bench_search_query(fx: Fixtures):
+    from search_index import SearchIndex
+    index = SearchIndex.build(fx.jobs_frame())
+    queries = ['data scientist', 'engineer remote', 'analy', 'machine learning pipelines']
+    return lambda: [index.search(query) for query in queries]
+
+
+def bench_salary_stats(fx: Fixtures):
+    from salary_stats import compute_salary_stats
+    df = fx.jobs_frame()
+    return lambda: compute_salary_stats(df)
+
+
+def bench_map_aggregate(fx: Fixtures):
+    from map_view import aggregate_locations
+    df = fx.jobs_frame().dropna(subset=['Latitude', 'Longitude'])
+    return lambda: aggregate_locations(df)
+
+
+def bench_filter_build(fx: Fixtures):
+    from filters import FilterIndex
+    df = fx.jobs_frame()
+    return lambda: FilterIndex(df)
+
+
+def bench_filter_query(fx: Fixtures):
+    from filters import FilterIndex, JobFilters
+    # max_entries=0 disables the result cache, so every call intersects the bitmaps
+    index = FilterIndex(fx.jobs_frame(), max_entries=0)
+    filters = JobFilters(states=('CA', 'WA', 'NY'), profiles=('Data Scientist', 'Data Engineer'),
+                         companies=('Amazon', 'Google'), salary_range=(90000, 150000))
+    return lambda: index.rows(filters)
+
+
+def bench_channel_load(fx: Fixtures):
+    from data import prepare_channel_data
+    path = fx.channel_dataset()
+    return lambda: prepare_channel_data(path)
+
+
+def bench_channel_aggregations(fx: Fixtures):
+    from data import DAY_ORDER, summarize_channel
+    df = fx.channel_frame()
+
+    def run():
+        # The groupbys behind the day-of-week plots plus the comparison summary
+        grouped = df.groupby('day_of_week', observed=False)
+        return (
+            grouped['viewCount'].mean().reindex(DAY_ORDER),
+            grouped['likeCount'].mean().reindex(DAY_ORDER),
+            summarize_channel(df),
+        )
+    return run
+
+
+def bench_channel_cube(fx: Fixtures):
+    from data import DAY_ORDER, bucket_means, load_channel_aggregates
+    path = fx.channel_dataset()
+
+    def run():
+        # What the day-of-week views read since the pipeline publishes the aggregates cube
+        cube = load_channel_aggregates(path)
+        return [bucket_means(cube, 'day_of_week', column).reindex(DAY_ORDER) for column in ('viewCount', 'likeCount')]
+    return run
+
+
+def bench_channel_sampling(fx: Fixtures):
+    from sampling import top_k, downsample_points
+    df = fx.channel_frame()
+    return lambda: (top_k(df, 'viewCount', 10), downsample_points(df, 'duration_minutes', 'viewCount'))
+
+
+SUITES = {
+    'etl': {
+        'transform_csv': bench_transform_csv,
+        'transform_parquet': bench_transform_parquet,
+        'load': bench_load,
+        'transform_and_load': bench_transform_and_load,
+    },
+    'jobs': {
+        'salary_parse': bench_salary_parse,
+        'jobs_prepare': bench_jobs_prepare,
+        'search_build': bench_search_build,
+        'search_query': bench_search_query,
+        'salary_stats': bench_salary_stats,
+        'map_aggregate': bench_map_aggregate,
+        'filter_build': bench_filter_build,
+        'filter_query': bench_filter_query,
+    },
+    'dashboard': {
+        'channel_load': bench_channel_load,
+        'channel_aggregations': bench_channel_aggregations,
+        'channel_cube': bench_channel_cube,
+        'channel_sampling': bench_channel_sampling,
+    },
+}
+
+
+def measure(run, repeat: int) -> dict:
+    """
+    Best wall time over repeat runs, then one more run under tracemalloc for peak memory.
+
+    tracemalloc sees Python and NumPy/pandas allocations but not buffers held by
+    Arrow's memory pool, so Parquet reads and writes are under-counted.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': best, 'peak_mb': peak / 2 ** 20}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def run_benchmarks(sizes: list, suites: list, repeat: int = 3, seed: int = 0,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, only: list = None) -> dict:
+    """
+    Runs the selected suites at every size.
+
+    Parameters:
+    sizes (list): Row counts
+    suites (list): Names from SUITES
+    repeat (int): Timed runs per benchmark; the fastest is reported
+    seed (int): Seed for the synthetic data
+    chunk_size (int): Chunk size passed to the ETL stages
+    only (list): Benchmark names to run (default: all in the suites)
+
+    Returns:
+    dict: 'meta' (environment) and 'results' (one entry per benchmark and size)
+    """
+    results = []
+    lookup_path = os.path.join(REPO_DIR, 'jobs_dash', 'geocode_lookup.csv')
+    previous_dir = os.getcwd()
+    for rows in sizes:
+        workdir = tempfile.mkdtemp(prefix=f'bench-{rows}-')
+        try:
+            # The jobs code resolves its geocoding lookup table and cache relative to the working directory
+            os.chdir(workdir)
+            if os.path.exists(lookup_path):
+                shutil.copy(lookup_path, workdir)
+            fixtures = Fixtures(workdir, rows, seed, chunk_size)
+
+            for suite in suites:
+                for name, benchmark in SUITES[suite].items():
+                    if only and name not in only:
+                        continue
+                    run = benchmark(fixtures)
+                    result = {'suite': suite, 'name': name, 'rows': rows, **measure(run, repeat)}
+                    result['rows_per_second'] = rows / result['seconds'] if result['seconds'] else None
+                    results.append(result)
+                    print(f"{suite:<10} {name:<22} {rows:>10,} rows  {result['seconds']:8.3f}s  "
+                          f"{result['rows_per_second']:>14,.0f} rows/s  {result['peak_mb']:9.1f} MB", flush=True)
+        finally:
+            os.chdir(previous_dir)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    meta = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'repeat': repeat,
+        'seed': seed,
+        'chunk_size': chunk_size,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def compare_results(current: dict, baseline: dict, max_slowdown: float) -> list:
+    """
+    Returns a message for every benchmark whose time or peak memory grew by more
+    than max_slowdown (0.2 = 20%) over the baseline with the same name and size.
+    """
+    previous = {(r['suite'], r['name'], r['rows']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        base = previous.get((result['suite'], result['name'], result['rows']))
+        if base is None:
+            continue
+        for metric in ('seconds', 'peak_mb'):
+            if base[metric] and result[metric] > base[metric] * (1 + max_slowdown):
+                regressions.append(
+                    f"{result['suite']}/{result['name']} at {result['rows']:,} rows: "
+                    f"{metric} {base[metric]:.3f} -> {result[metric]:.3f}"
+                )
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the YouTube pipeline and the dashboards')
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help='Row counts, e.g. 1k 100k 10M')
+    parser.add_argument('--suite', nargs='+', choices=list(SUITES), default=list(SUITES))
+    parser.add_argument('--only', nargs='+', help='Run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--output', default='benchmark_results.json', help='Where to write the results')
+    parser.add_argument('--compare', help='Baseline results JSON to check for regressions')
+    parser.add_argument('--max-slowdown', type=float, default=0.2,
+                        help='Allowed relative increase in time or memory before failing (default 0.2)')
+    args = parser.parse_args()
+
+    current = run_benchmarks([parse_size(size) for size in args.sizes], args.suite, args.repeat,
+                             args.seed, args.chunk_size, args.only)
+    with open(args.output, 'w') as f:
+        json.dump(current, f, indent=2)
+    print(f"Saved {len(current['results'])} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_results(current, json.load(f), args.max_slowdown)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,130 @@
+"""
+Synthetic datasets shaped like the repo's real inputs, for benchmarks.
+
+youtube_extract() mimics the raw extract written by collect_youtube_channel_data()
+(and, after the transform, dataset/mrbeast_channel.csv); job_postings() mimics
+jobs_dash/indeed_data_science_jobs.csv. Values are drawn from small pools with
+NumPy, so millions of rows are generated in seconds and the same seed always
+gives the same data.
+"""
+import numpy as np
+import pandas as pd
+
+CHANNELS = ['MrBeast', '5-Minute Crafts', 'Veritasium', 'Kurzgesagt']
+
+TITLE_WORDS = [
+    'Survive', '100', 'Days', 'In', 'Nuclear', 'Bunker', 'Win', '$500,000', 'World\'s', 'Largest',
+    'Lego', 'Tower', 'Hacks', 'Every', 'Parent', 'Should', 'Know', 'Why', 'The', 'Universe',
+    'Is', 'Bigger', 'Than', 'You', 'Think', 'I', 'Built', 'A', 'Secret', 'City',
+]
+
+DESCRIPTION = (
+    "This video was really fun to make, I hope you enjoy it :)\n"
+    "New Merch - https://example.store\n\nSUBSCRIBE OR I TAKE YOUR DOG\n"
+    "For any questions or inquiries regarding this video, please reach out to someone@example.com\n"
+    "----------------------------------------------------------------\n"
+    "follow all of these or i will kick you\n"
+    "• Facebook - https://www.facebook.com/example/\n• Twitter - https://twitter.com/example\n"
+)
+
+JOB_TITLES = [
+    'Data Scientist', 'Senior Data Scientist', 'Data Analyst', 'Business Data Analyst',
+    'Data Engineer', 'Senior Data Engineer', 'Machine Learning Engineer', 'Analytics Manager',
+    'Research Scientist', 'Data Science Intern', 'Lead Data Analyst', 'Statistician',
+]
+
+COMPANIES = [
+    'Robert Half', 'Amazon', 'Google', 'Meta', 'Microsoft', 'Netflix', 'Capital One', 'Deloitte',
+    'Kaiser Permanente', 'Walmart', 'Target', 'Humana', 'IBM', 'Oracle', 'Salesforce', 'Adobe',
+]
+
+LOCATIONS = [
+    'Remote in Los Angeles, CA 90024', 'Seattle, WA 98148', 'Troy, MI 48083',
+    'Hybrid work in Irvine, CA 92618', 'Arlington, VA', 'New York, NY', 'Austin, TX 78701',
+    'Chicago, IL', 'Boston, MA 02110', 'San Francisco, CA', 'Denver, CO', 'Atlanta, GA 30301',
+    'Remote', 'Wisconsin', 'United States',
+]
+
+SALARIES = [
+    '$120,000 - $140,000 a year', '$90,000 - $100,000 a year', '$135,000 - $216,000 a year',
+    '$155,000 - $191,500 a year', '$37 an hour', '$45 - $60 an hour', '$8,000 - $10,000 a month',
+    '$110,000 a year', 'From $95,000 a year', 'Up to $160,000 a year', '$300 - $400 a day', None,
+]
+
+SHORT_DESCRIPTIONS = [
+    'The ideal candidate should be highly skilled in all aspects of data analytics, including mining, generation, and visualization.',
+    'Build and maintain scalable data pipelines and ETL processes for analytics and machine learning.',
+    'Develop statistical models and machine learning algorithms to solve business problems.',
+    'Partner with stakeholders to define metrics, build dashboards and communicate insights.',
+]
+
+
+def _iso_durations(seconds: np.ndarray) -> np.ndarray:
+    # Distinct ISO 8601 strings for a pool of lengths, like the API's contentDetails.duration
+    days, rest = np.divmod(seconds, 86400)
+    hours, rest = np.divmod(rest, 3600)
+    minutes, secs = np.divmod(rest, 60)
+    pool = []
+    for d, h, m, s in zip(days, hours, minutes, secs):
+        time_part = ''.join(f'{v}{u}' for v, u in ((h, 'H'), (m, 'M'), (s, 'S')) if v)
+        pool.append((f'P{d}D' if d else 'P') + (f'T{time_part}' if time_part else ('' if d else '0D')))
+    return np.asarray(pool, dtype=object)
+
+
+def _pool(rng: np.random.Generator, values, rows: int) -> np.ndarray:
+    return np.asarray(values, dtype=object)[rng.integers(0, len(values), rows)]
+
+
+def _numbered(prefix: str, rows: int) -> pd.Series:
+    return prefix + pd.Series(np.arange(rows)).astype(str)
+
+
+def _counts(rng: np.random.Generator, rows: int, scale: float, missing: float = 0.0) -> pd.Series:
+    # Heavy-tailed counts as text, like the API's statistics fields
+    values = pd.Series(np.floor(rng.lognormal(np.log(scale), 1.5, rows)).astype(np.int64)).astype(str)
+    return values.where(rng.random(rows) >= missing)
+
+
+def youtube_extract(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    A raw extract of rows videos with the columns and text values of collect_youtube_channel_data().
+    """
+    rng = np.random.default_rng(seed)
+    titles = np.array([' '.join(rng.choice(TITLE_WORDS, 6)) for _ in range(256)], dtype=object)
+    tags = np.array([None] + [str([str(word) for word in rng.choice(TITLE_WORDS, 4)]) for _ in range(63)], dtype=object)
+    published = (np.datetime64('2012-01-01T00:00:00') + rng.integers(0, 12 * 365 * 86400, rows).astype('timedelta64[s]'))
+    collected = np.datetime64('2024-10-06T00:00:00') + rng.integers(0, 86400, rows).astype('timedelta64[s]')
+
+    return pd.DataFrame({
+        'video_id': _numbered('vid', rows),
+        'channelTitle': _pool(rng, CHANNELS, rows),
+        'title': titles[rng.integers(0, len(titles), rows)],
+        'description': np.where(rng.random(rows) < 0.9, DESCRIPTION, None),
+        'tags': tags[rng.integers(0, len(tags), rows)],
+        'publishedAt': pd.Series(np.datetime_as_string(published)) + 'Z',
+        'viewCount': _counts(rng, rows, 1e6),
+        'likeCount': _counts(rng, rows, 3e4, missing=0.01),
+        'favouriteCount': '0',
+        'commentCount': _counts(rng, rows, 2e3, missing=0.02),
+        'duration': _iso_durations(rng.integers(0, 4 * 3600, 5000))[rng.integers(0, 5000, rows)],
+        'definition': np.where(rng.random(rows) < 0.95, 'hd', 'sd'),
+        'caption': np.where(rng.random(rows) < 0.3, 'true', 'false'),
+        'data_collected_at': pd.Series(np.datetime_as_string(collected, unit='us')) + '+00:00',
+    })
+
+
+def job_postings(rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    rows job postings with the columns and text formats of indeed_data_science_jobs.csv.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Position': np.arange(1, rows + 1),
+        'Job Title': _pool(rng, JOB_TITLES, rows),
+        'Company': _pool(rng, COMPANIES, rows),
+        'Location': _pool(rng, LOCATIONS, rows),
+        'Salary': _pool(rng, SALARIES, rows),
+        'Short Description': _pool(rng, SHORT_DESCRIPTIONS, rows),
+        'Posted At': _pool(rng, ['Employer\nActive 4 days ago', 'Posted 30+ days ago', None], rows),
+        'Job link': _numbered('https://www.indeed.com/viewjob?jk=', rows),
+    })
@@ -1,38 +1,70 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import folium
-from geopy.geocoders import Nominatim
-from streamlit_folium import folium_static
-from folium.plugins import MarkerCluster
+import os
+import streamlit.components.v1 as components
+from salary_stats import compute_salary_stats, salary_box_figure, salary_histogram_figure
+from search_index import load_or_build_index
+from build_dataset import ARTIFACT_PATH, RAW_PATH, build_job_dataset, read_manifest
+from filters import FilterIndex, JobFilters
+from warmup import (
+    DASHBOARD_COLUMNS, MAP_MODES, SEARCH_COLUMNS, SEARCH_INDEX_PATH, load_dashboard_frame, read_warm_map,
+    render_location_map
+)
 
 # Page configuration
 st.set_page_config(page_title="Job Data Dashboard", layout="wide")
 
-# Load data
-@st.cache_data
-def load_data():
-    return pd.read_csv('final_job_data.csv')
-
-df = load_data()
+# The dataset (salary, City/State, coordinates) is built offline by build_dataset.py.
+# If the artifact is missing it is built once here, geocoding only from the bundled lookup
+# table and local cache, so the first page never waits on the geocoder's rate limit
+# (python warmup.py builds it, the search index and the unfiltered maps before the server starts).
+@st.cache_resource
+def ensure_artifact():
+    if not os.path.exists(ARTIFACT_PATH):
+        build_job_dataset(RAW_PATH, ARTIFACT_PATH, offline_geocoding=True)
 
-# Function to get coordinates (cached for performance)
+# Load data (cached per dataset version and column set)
 @st.cache_data
-def get_coordinates(location):
-    geolocator = Nominatim(user_agent="job_locator")
-    try:
-        return geolocator.geocode(location)
-    except Exception as e:
-        st.error(f"Error getting coordinates for {location}: {e}")
-        return None
-
-# Get coordinates for each job location
-df['Coordinates'] = df['City'].apply(lambda city: get_coordinates(city) if pd.notna(city) else None)
-df['Latitude'] = df['Coordinates'].apply(lambda x: x.latitude if x else None)
-df['Longitude'] = df['Coordinates'].apply(lambda x: x.longitude if x else None)
-
-# Drop rows with invalid coordinates
-df = df.dropna(subset=['Latitude', 'Longitude'])
+def load_data(version, columns):
+    return load_dashboard_frame(ARTIFACT_PATH, columns)
+
+ensure_artifact()
+dataset_version = read_manifest(ARTIFACT_PATH)['version']
+df = load_data(dataset_version, tuple(DASHBOARD_COLUMNS))
+
+# Categorical bitmaps and sorted salaries for the sidebar filters, built once per dataset version
+@st.cache_resource(max_entries=2)
+def get_filter_index(version):
+    return FilterIndex(df)
+
+# Rows of df matching the filters; every view below works on this one row set
+def filtered_rows(version, filters):
+    return get_filter_index(version).rows(filters)
+
+# Build the map once per (dataset version, map mode, filters) and reuse the rendered HTML.
+# Unfiltered maps prerendered by warmup.py are read from disk; folium is only imported for the others
+@st.cache_data(max_entries=16)
+def location_map_html(version, map_mode, filters):
+    if filters.is_empty():
+        html = read_warm_map(version, map_mode)
+        if html is not None:
+            return html
+    return render_location_map(df.iloc[filtered_rows(version, filters)], map_mode)
+
+# Search index, built once per dataset version and shared by all sessions
+SEARCH_PAGE_SIZE = 25
+
+@st.cache_resource(max_entries=2)
+def get_search_index(version):
+    return load_or_build_index(load_data(version, tuple(SEARCH_COLUMNS)), SEARCH_INDEX_PATH, version)
+
+# Salary statistics for every view, computed in one grouped pass per dataset version and filters
+@st.cache_data(max_entries=32)
+def get_salary_stats(version, filters):
+    return compute_salary_stats(df.iloc[filtered_rows(version, filters)])
+
+def format_salary(value):
+    return f"${value:,.2f}" if pd.notna(value) else "n/a"
 
 # Main title
 st.title("Job Data Dashboard")
@@ -44,54 +76,69 @@ selected_view = st.sidebar.radio(
     ["Location Map", "Salary Distribution", "Salary Distribution by Profile", "Job Search"]
 )
 
+# Sidebar filters, applied to every view
+filter_index = get_filter_index(dataset_version)
+st.sidebar.subheader("Filters")
+states = st.sidebar.multiselect("State", filter_index.values('states'))
+profiles = st.sidebar.multiselect("Job Profile", filter_index.values('profiles'))
+companies = st.sidebar.multiselect("Company", filter_index.values('companies'))
+salary_range = None
+salary_bounds = filter_index.salary_bounds()
+if salary_bounds and salary_bounds[0] < salary_bounds[1]:
+    selected_range = st.sidebar.slider("Salary range", *salary_bounds, value=salary_bounds, step=1000.0)
+    # The full range means no salary filter, so jobs without a salary stay visible
+    if tuple(selected_range) != salary_bounds:
+        salary_range = tuple(selected_range)
+filters = JobFilters(tuple(states), tuple(profiles), tuple(companies), salary_range).normalized()
+rows = filtered_rows(dataset_version, filters)
+stats = get_salary_stats(dataset_version, filters)
+
 # Display selected view
 if selected_view == "Location Map":
     st.subheader("Job Locations Map")
-    m = folium.Map(location=[df['Latitude'].mean(), df['Longitude'].mean()], zoom_start=4)
-    marker_cluster = MarkerCluster().add_to(m)
-
-    for i, row in df.iterrows():
-        folium.Marker(
-            location=[row['Latitude'], row['Longitude']],
-            popup=f"<b>{row['Company']}</b><br>{row['Job Title']}<br>${row['Salary']:,.2f}",
-            tooltip=row['Company']
-        ).add_to(marker_cluster)
-
-    folium_static(m, width=800, height=600)
+    map_mode = st.radio("Map mode:", list(MAP_MODES), horizontal=True)
+    html = location_map_html(dataset_version, map_mode, filters)
+    components.html(html, width=800, height=600)
 
 elif selected_view == "Salary Distribution":
     st.subheader("Salary Distribution")
-    fig = px.histogram(df, x="Salary", nbins=10, marginal="box")
+    fig = salary_histogram_figure(stats['histogram'])
     st.plotly_chart(fig, use_container_width=True)
 
     # Salary statistics
     col1, col2, col3 = st.columns(3)
-    col1.metric("Average Salary", f"${df['Salary'].mean():,.2f}")
-    col2.metric("Highest Salary", f"${df['Salary'].max():,.2f}")
-    col3.metric("Lowest Salary", f"${df['Salary'].min():,.2f}")
+    col1.metric("Average Salary", format_salary(stats['overall']['mean']))
+    col2.metric("Highest Salary", format_salary(stats['overall']['max']))
+    col3.metric("Lowest Salary", format_salary(stats['overall']['min']))
 
 elif selected_view == "Salary Distribution by Profile":
     st.subheader("Salary Distribution by Profile")
-    fig = px.box(df, x="Job Profile", y="Salary", color="Job Profile")
+    fig = salary_box_figure(stats['by_profile'])
     st.plotly_chart(fig, use_container_width=True)
 
     # Statistics by profile
-    for profile in df['Job Profile'].unique():
+    for profile, profile_stats in stats['by_profile'].iterrows():
         st.subheader(f"Statistics for {profile}")
-        df_profile = df[df['Job Profile'] == profile]
         col1, col2, col3 = st.columns(3)
-        col1.metric("Average Salary", f"${df_profile['Salary'].mean():,.2f}")
-        col2.metric("Highest Salary", f"${df_profile['Salary'].max():,.2f}")
-        col3.metric("Lowest Salary", f"${df_profile['Salary'].min():,.2f}")
+        col1.metric("Average Salary", format_salary(profile_stats['mean']))
+        col2.metric("Highest Salary", format_salary(profile_stats['max']))
+        col3.metric("Lowest Salary", format_salary(profile_stats['min']))
 
 else:  # Job Search
     st.subheader("Job Search")
-    search_query = st.text_input("Search by job title or company:")
+    search_query = st.text_input("Search by job title, company, city or description:")
     
     if search_query:
-        df_filtered = df[df["Job Title"].str.contains(search_query, case=False) | df["Company"].str.contains(search_query, case=False)]
-        if not df_filtered.empty:
-            st.dataframe(df_filtered[["Job Title", "Company", "City", "State", "Salary", "Job Profile"]])
+        index = get_search_index(dataset_version)
+        within = None if filters.is_empty() else rows
+        results, total = index.search(search_query, page=1, page_size=SEARCH_PAGE_SIZE, within=within)
+        if total:
+            n_pages = (total - 1) // SEARCH_PAGE_SIZE + 1
+            page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1)
+            if page > 1:
+                results, _ = index.search(search_query, page=page, page_size=SEARCH_PAGE_SIZE, within=within)
+            st.write(f"{total} jobs found")
+            st.dataframe(df.iloc[results][["Job Title", "Company", "City", "State", "Salary", "Job Profile"]])
         else:
             st.write("No results found for the search.")
     else:
@@ -99,8 +146,6 @@ else:  # Job Search
 
 # General statistics
 st.sidebar.subheader("Labor Market Statistics")
-st.sidebar.metric("Average Salary", f"${df['Salary'].mean():,.2f}")
-st.sidebar.metric("Highest Salary", f"${df['Salary'].max():,.2f}")
-st.sidebar.metric("Number of Jobs", len(df))
-
-
+st.sidebar.metric("Average Salary", format_salary(stats['overall']['mean']))
+st.sidebar.metric("Highest Salary", format_salary(stats['overall']['max']))
+st.sidebar.metric("Number of Jobs", int(stats['overall']['jobs']))
@@ -0,0 +1,347 @@
+import os
+import glob
+import json
+import hashlib
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from geocoding import add_coordinates
+from salary import parse_salaries
+
+logger = logging.getLogger(__name__)
+
+RAW_PATH = 'indeed_data_science_jobs.csv'
+ARTIFACT_PATH = 'job_data.parquet'
+
+# Bump when the artifact layout or the cleaning rules change so old artifacts get a new version
+BUILD_VERSION = 4
+
+# Job Profile rules from eda_tl.ipynb, checked in order
+PROFILE_PATTERNS = [
+    ('Data Scientist', 'scien'),
+    ('Data Analyst', 'analy'),
+    ('Data Engineer', 'engineer'),
+]
+
+ARTIFACT_COLUMNS = [
+    'Position', 'Job Title', 'Company', 'Salary', 'Job link', 'Job Profile',
+    'City', 'State', 'Latitude', 'Longitude', 'Short Description'
+]
+
+JOB_SCHEMA = pa.schema([
+    ('Position', pa.int32()),
+    ('Job Title', pa.string()),
+    ('Company', pa.dictionary(pa.int32(), pa.string())),
+    ('Salary', pa.float64()),
+    ('Job link', pa.string()),
+    ('Job Profile', pa.dictionary(pa.int32(), pa.string())),
+    ('City', pa.string()),
+    ('State', pa.dictionary(pa.int32(), pa.string())),
+    ('Latitude', pa.float64()),
+    ('Longitude', pa.float64()),
+    ('Short Description', pa.string()),
+])
+
+
+def manifest_path(artifact_path: str) -> str:
+    return os.path.splitext(artifact_path)[0] + '.json'
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def geocoding_mode(offline_geocoding: bool) -> str:
+    return 'offline' if offline_geocoding else 'online'
+
+
+def dataset_version(sources: dict, offline_geocoding: bool = False) -> str:
+    """
+    Returns a short hash of BUILD_VERSION, the geocoding mode and the ingested files
+    (name -> content digest, in ingestion order). The same scrapes geocoded online
+    resolve more locations than offline, so the two builds get different versions.
+    """
+    digest = hashlib.sha256(f"build-{BUILD_VERSION}-{geocoding_mode(offline_geocoding)}".encode())
+    for name, content_digest in sources.items():
+        digest.update(f"{name}:{content_digest}".encode())
+    return digest.hexdigest()[:16]
+
+
+def classify_job_profiles(titles: pd.Series) -> pd.Series:
+    """
+    Vectorized version of classify_job_title() from the notebook.
+    """
+    lowered = titles.fillna('').str.lower()
+    conditions = [lowered.str.contains(pattern, regex=False) for _, pattern in PROFILE_PATTERNS]
+    choices = [profile for profile, _ in PROFILE_PATTERNS]
+    return pd.Series(np.select(conditions, choices, default='Other'), index=titles.index)
+
+
+def parse_salary(salary: pd.Series) -> pd.Series:
+    """
+    Parses Indeed salary text ("$120,000 - $140,000 a year", "$37 an hour") into the
+    annual lower bound of the range, or the upper bound for "Up to" salaries.
+    Missing or unparseable values stay NaN. See salary.parse_salaries() for the full range.
+    """
+    parsed = parse_salaries(salary)
+    return parsed['Annual Min'].fillna(parsed['Annual Max'])
+
+
+def split_location(location: pd.Series) -> pd.DataFrame:
+    """
+    Splits "City, ST 12345" into City and State with the notebook's regex.
+    """
+    parts = location.str.extract(r'(?P<City>[A-Za-z\s]+),\s*(?P<State>[A-Z]{2})')
+    parts['City'] = parts['City'].str.strip()
+    return parts
+
+
+def clean_postings(raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Applies the notebook's cleaning to one raw Indeed scrape: typed columns, parsed
+    salary, Job Profile and City/State. Coordinates are added later by the caller.
+    """
+    df = pd.DataFrame({
+        'Position': raw['Position'].astype('int32'),
+        'Job Title': raw['Job Title'].astype('string'),
+        'Company': raw['Company'].astype('category'),
+        'Salary': parse_salary(raw['Salary']).astype('float64'),
+        'Job link': raw['Job link'].astype('string'),
+        'Job Profile': classify_job_profiles(raw['Job Title']).astype('category'),
+        'Short Description': raw['Short Description'].astype('string'),
+    })
+    df = df.join(split_location(raw['Location']))
+    df['City'] = df['City'].astype('string')
+    df['State'] = df['State'].astype('category')
+    return df
+
+
+def _clean_file(raw_path: str) -> pd.DataFrame:
+    # Runs in the worker processes, so it must stay a module-level function
+    return clean_postings(pd.read_csv(raw_path))
+
+
+def _clean_files(raw_paths: list, max_workers: Optional[int]):
+    """
+    Yields the cleaned postings of every file, in the order of raw_paths.
+    Several files are cleaned in parallel by a process pool, with at most one
+    file per worker in flight, so finished frames don't pile up while the caller
+    geocodes and writes the previous ones.
+    """
+    if len(raw_paths) <= 1 or max_workers == 1:
+        for raw_path in raw_paths:
+            yield _clean_file(raw_path)
+        return
+    workers = max_workers or os.cpu_count() or 1
+    remaining = iter(raw_paths)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque(pool.submit(_clean_file, raw_path) for _, raw_path in zip(range(workers), remaining))
+        while in_flight:
+            df = in_flight.popleft().result()
+            # Refill the window before handing the frame over, so the workers stay busy
+            for raw_path in remaining:
+                in_flight.append(pool.submit(_clean_file, raw_path))
+                break
+            yield df
+
+
+def _new_postings(df: pd.DataFrame, seen: set) -> pd.DataFrame:
+    # Drops postings whose Job link was already written; rows without a link are always kept
+    links = df['Job link']
+    duplicate = links.notna() & (links.duplicated() | links.isin(seen))
+    df = df[~duplicate.to_numpy()]
+    seen.update(df['Job link'].dropna())
+    return df
+
+
+def ingest_job_files(raw_paths: list, artifact_path: str = ARTIFACT_PATH,
+                     offline_geocoding: bool = False, incremental: bool = True,
+                     max_workers: Optional[int] = None) -> dict:
+    """
+    Builds (or updates) the typed job dataset artifact from many raw scrape files.
+
+    Files are cleaned in parallel, one file per worker process. Postings are
+    deduplicated by Job link, later files in raw_paths winning over earlier ones,
+    so pass the scrapes oldest first. Results are geocoded in this process (the
+    geocoding cache is not safe for concurrent writers) and written to the
+    artifact as they arrive, one row group per file. Workers only get a new file
+    when a result is taken, so memory holds at most about max_workers + 1
+    cleaned files.
+
+    With incremental, files already recorded in the manifest with the same
+    content are skipped, and the postings of the existing artifact that none of
+    the new files contain are carried over. That keeps later files winning only
+    while the new or changed files are the newest ones, so a changed file
+    followed by an unchanged one triggers a full rebuild, as does a different
+    BUILD_VERSION or geocoding mode.
+
+    Parameters:
+    raw_paths (list): Raw Indeed CSV files, oldest first
+    artifact_path (str): Path where the Parquet artifact should be saved
+    offline_geocoding (bool): Resolve coordinates only from the lookup table and cache
+    incremental (bool): Only ingest new or changed files and keep the existing postings
+    max_workers (int): Worker processes (default: one per CPU)
+
+    Returns:
+    dict: The manifest written next to the artifact (version, sources, rows, built_at)
+
+    Raises:
+    ValueError: If raw_paths is empty
+    FileNotFoundError: If a raw file doesn't exist
+    """
+    if not raw_paths:
+        raise ValueError("No input files to ingest")
+    for raw_path in raw_paths:
+        if not os.path.exists(raw_path):
+            raise FileNotFoundError(f"Input file not found: {raw_path}")
+
+    previous = None
+    if incremental and os.path.exists(artifact_path) and os.path.exists(manifest_path(artifact_path)):
+        previous = read_manifest(artifact_path)
+        if (previous.get('build_version') != BUILD_VERSION or 'sources' not in previous
+                or previous.get('geocoding') != geocoding_mode(offline_geocoding)):
+            previous = None
+
+    digests = {raw_path: file_digest(raw_path) for raw_path in raw_paths}
+    sources = dict(previous['sources']) if previous else {}
+    pending = [raw_path for raw_path in raw_paths if sources.get(os.path.basename(raw_path)) != digests[raw_path]]
+    if previous and pending != raw_paths[len(raw_paths) - len(pending):]:
+        # The carried-over postings would override those of the changed files, even where
+        # a changed file is older than the file they came from
+        logger.info("A changed file precedes unchanged ones, rebuilding from all files")
+        previous, sources, pending = None, {}, list(raw_paths)
+    for raw_path in raw_paths:
+        # Re-insert so the manifest lists files in ingestion order
+        name = os.path.basename(raw_path)
+        sources.pop(name, None)
+        sources[name] = digests[raw_path]
+
+    if previous and not pending:
+        logger.info(f"Job dataset {previous['version']} is up to date")
+        return previous
+
+    version = dataset_version(sources, offline_geocoding)
+    logger.info(f"Building job dataset {version} from {len(pending)} new file(s)")
+
+    directory = os.path.dirname(artifact_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Write to a temporary file first so readers never see a half-written artifact
+    tmp_path = f"{artifact_path}.tmp"
+    seen, rows, writer = set(), 0, None
+    try:
+        # Newest file first, so the first copy of a posting that gets written is the latest one
+        for raw_path, df in zip(pending[::-1], _clean_files(pending[::-1], max_workers)):
+            df = _new_postings(df, seen)
+            df = add_coordinates(df, offline=offline_geocoding)[ARTIFACT_COLUMNS]
+            table = pa.Table.from_pandas(df, schema=JOB_SCHEMA, preserve_index=False)
+            if writer is None:
+                # The first table's schema carries the pandas metadata (string/category dtypes)
+                writer = pq.ParquetWriter(tmp_path, table.schema)
+            writer.write_table(table)
+            rows += len(df)
+            logger.info(f"Added {len(df)} postings from {raw_path}")
+
+        if previous:
+            kept = 0
+            for batch in pq.ParquetFile(artifact_path).iter_batches(columns=ARTIFACT_COLUMNS):
+                keep = pc.invert(pc.is_in(batch.column('Job link'), value_set=pa.array(list(seen), pa.string())))
+                table = pa.Table.from_batches([batch]).filter(keep).cast(JOB_SCHEMA)
+                writer.write_table(table.replace_schema_metadata(writer.schema.metadata))
+                kept += table.num_rows
+            rows += kept
+            logger.info(f"Kept {kept} postings from dataset {previous['version']}")
+    except Exception:
+        # Don't leave a partial artifact behind; the existing one stays as it was
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    writer.close()
+    os.replace(tmp_path, artifact_path)
+
+    manifest = {
+        'version': version,
+        'build_version': BUILD_VERSION,
+        'geocoding': geocoding_mode(offline_geocoding),
+        'sources': sources,
+        'rows': rows,
+        'built_at': datetime.now(timezone.utc).isoformat(),
+    }
+    with open(manifest_path(artifact_path), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    logger.info(f"Saved {rows} job postings to {artifact_path}")
+    return manifest
+
+
+def build_job_dataset(raw_path: str = RAW_PATH, artifact_path: str = ARTIFACT_PATH,
+                      offline_geocoding: bool = False) -> dict:
+    """
+    Builds the typed job dataset artifact the dashboard loads from a single scrape.
+
+    Parameters:
+    raw_path (str): Path to the raw Indeed scrape
+    artifact_path (str): Path where the Parquet artifact should be saved
+    offline_geocoding (bool): Resolve coordinates only from the lookup table and cache
+
+    Returns:
+    dict: The manifest written next to the artifact (version, sources, rows, built_at)
+
+    Raises:
+    FileNotFoundError: If the raw file doesn't exist
+    """
+    return ingest_job_files([raw_path], artifact_path, offline_geocoding, incremental=False)
+
+
+def expand_inputs(inputs: list) -> list:
+    """
+    Expands directories and glob patterns to the CSV files they contain, sorted by name.
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(glob.glob(os.path.join(item, '*.csv'))))
+        elif glob.has_magic(item):
+            paths.extend(sorted(glob.glob(item)))
+        else:
+            paths.append(item)
+    return paths
+
+
+def read_manifest(artifact_path: str = ARTIFACT_PATH) -> dict:
+    with open(manifest_path(artifact_path)) as f:
+        return json.load(f)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build the job dashboard dataset artifact')
+    parser.add_argument('--input', nargs='+', default=[RAW_PATH],
+                        help='Raw Indeed CSV files, directories or glob patterns (ingested in name order)')
+    parser.add_argument('--output', default=ARTIFACT_PATH, help='Parquet artifact path')
+    parser.add_argument('--offline', action='store_true',
+                        help='Do not call the geocoder, use the lookup table and cache only')
+    parser.add_argument('--full', action='store_true', help='Rebuild from all inputs instead of adding new files')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: one per CPU)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    ingest_job_files(expand_inputs(args.input), args.output, offline_geocoding=args.offline,
+                     incremental=not args.full, max_workers=args.workers)
@@ -0,0 +1,172 @@
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Filterable categorical columns, by JobFilters field
+FILTER_COLUMNS = {
+    'states': 'State',
+    'profiles': 'Job Profile',
+    'companies': 'Company',
+}
+
+# Columns with at most this many values get a bitmap per value up front (State, Job Profile);
+# larger ones (Company) build the bitmap of a selection from their posting lists
+DENSE_BITMAP_MAX_VALUES = 64
+
+
+class JobFilters(NamedTuple):
+    """
+    One combination of filters. Empty selections and a missing salary range mean "no filter".
+    Hashable, so it can be used as a cache key.
+    """
+    states: Tuple[str, ...] = ()
+    profiles: Tuple[str, ...] = ()
+    companies: Tuple[str, ...] = ()
+    salary_range: Optional[Tuple[float, float]] = None
+
+    def normalized(self) -> 'JobFilters':
+        # The same selection in another order must hit the same cache entry
+        return JobFilters(
+            tuple(sorted(set(self.states))),
+            tuple(sorted(set(self.profiles))),
+            tuple(sorted(set(self.companies))),
+            tuple(self.salary_range) if self.salary_range is not None else None,
+        )
+
+    def is_empty(self) -> bool:
+        return not (self.states or self.profiles or self.companies or self.salary_range is not None)
+
+
+def _to_bitmap(rows: np.ndarray, n_rows: int) -> np.ndarray:
+    mask = np.zeros(n_rows, dtype=bool)
+    mask[rows] = True
+    return np.packbits(mask)
+
+
+class _ColumnIndex:
+    """
+    Categorical codes of one column with CSR posting lists: the rows holding value
+    code c are rows[offsets[c]:offsets[c + 1]].
+    """
+
+    def __init__(self, values: pd.Series, dense_max_values: int):
+        # Only the values present in these rows: a categorical column keeps the categories of
+        # rows dropped upstream, which would be offered as filter values matching nothing
+        categorical = values.astype('category').cat.remove_unused_categories()
+        codes = categorical.cat.codes.to_numpy()
+        self.n_rows = len(codes)
+        self.categories = categorical.cat.categories
+        order = np.argsort(codes, kind='stable')
+        # Missing values have code -1 and sort first
+        self.rows = order[np.count_nonzero(codes < 0):]
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.categories))
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+
+        self.bitmaps = None
+        if len(self.categories) <= dense_max_values:
+            self.bitmaps = np.zeros((len(self.categories), (self.n_rows + 7) // 8), dtype=np.uint8)
+            for code in range(len(self.categories)):
+                self.bitmaps[code] = self._posting_bitmap([code])
+
+    def _posting_bitmap(self, codes) -> np.ndarray:
+        rows = [self.rows[self.offsets[code]:self.offsets[code + 1]] for code in codes]
+        return _to_bitmap(np.concatenate(rows) if rows else np.empty(0, dtype=np.int64), self.n_rows)
+
+    def bitmap(self, values: Tuple[str, ...]) -> np.ndarray:
+        """
+        Packed bitmap of the rows holding any of values (unknown values match nothing).
+        """
+        codes = self.categories.get_indexer(list(values))
+        codes = codes[codes >= 0]
+        if self.bitmaps is None:
+            return self._posting_bitmap(codes)
+        if not len(codes):
+            return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        return np.bitwise_or.reduce(self.bitmaps[codes], axis=0)
+
+
+class FilterIndex:
+    """
+    Precomputed indexes for filtering the job postings without scanning them.
+
+    State, Job Profile and Company are stored as categorical codes with packed
+    bitmaps (one bit per row) per value; salaries as a sorted array, so a range is
+    two binary searches. A filter combination is the bitwise AND of the bitmaps of
+    its parts. Results are row positions in df, cached per normalized JobFilters
+    (LRU), so every view of a rerun and every session with the same filters shares
+    one row set.
+    """
+
+    def __init__(self, df: pd.DataFrame, salary_column: str = 'Salary', max_entries: int = 128,
+                 dense_max_values: int = DENSE_BITMAP_MAX_VALUES):
+        self.n_rows = len(df)
+        self.columns = {
+            field: _ColumnIndex(df[column], dense_max_values)
+            for field, column in FILTER_COLUMNS.items() if column in df.columns
+        }
+
+        salary = df[salary_column].to_numpy(dtype=float, na_value=np.nan)
+        valid = np.flatnonzero(~np.isnan(salary))
+        self.salary_rows = valid[np.argsort(salary[valid], kind='stable')]
+        self.salary_sorted = salary[self.salary_rows]
+
+        self.max_entries = max_entries
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def values(self, field: str) -> list:
+        """
+        Distinct values of a filter field ('states', 'profiles' or 'companies'), sorted.
+        """
+        return list(self.columns[field].categories) if field in self.columns else []
+
+    def salary_bounds(self) -> Optional[Tuple[float, float]]:
+        if not len(self.salary_sorted):
+            return None
+        return float(self.salary_sorted[0]), float(self.salary_sorted[-1])
+
+    def _salary_bitmap(self, low: Optional[float], high: Optional[float]) -> np.ndarray:
+        start = 0 if low is None else np.searchsorted(self.salary_sorted, low, side='left')
+        end = len(self.salary_sorted) if high is None else np.searchsorted(self.salary_sorted, high, side='right')
+        return _to_bitmap(self.salary_rows[start:end], self.n_rows)
+
+    def _compute(self, filters: JobFilters) -> np.ndarray:
+        bitmaps = [
+            self.columns[field].bitmap(getattr(filters, field))
+            for field in FILTER_COLUMNS
+            if getattr(filters, field) and field in self.columns
+        ]
+        if filters.salary_range is not None:
+            bitmaps.append(self._salary_bitmap(*filters.salary_range))
+        if not bitmaps:
+            return np.arange(self.n_rows)
+
+        combined = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            combined = np.bitwise_and(combined, bitmap)
+        return np.flatnonzero(np.unpackbits(combined, count=self.n_rows))
+
+    def rows(self, filters: JobFilters) -> np.ndarray:
+        """
+        Sorted row positions of df matching every filter. The returned array is read-only.
+        """
+        key = filters.normalized()
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._results[key]
+
+        result = self._compute(key)
+        result.flags.writeable = False
+        with self._lock:
+            self.misses += 1
+            self._results[key] = result
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return result
@@ -0,0 +1,284 @@
+import os
+import re
+import time
+import sqlite3
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Default locations of the persistent cache and the bundled lookup table
+CACHE_PATH = 'geocode_cache.sqlite'
+LOOKUP_PATH = 'geocode_lookup.csv'
+
+# Cache policy: entries expire after TTL and the table is trimmed (least recently used first)
+DEFAULT_TTL_DAYS = 90
+MAX_CACHE_ENTRIES = 50000
+
+# Nominatim usage policy allows at most one request per second
+MIN_DELAY_SECONDS = 1.0
+
+Coordinates = Optional[Tuple[float, float]]
+
+# Prefixes Indeed adds to the city name (e.g. "Remote in Los Angeles")
+_LOCATION_PREFIX = re.compile(r'^(remote in|hybrid work in)\s+', re.IGNORECASE)
+
+
+def normalize_location(city: Optional[str], state: Optional[str] = None) -> Optional[str]:
+    """
+    Builds the geocoding query for a City/State pair.
+
+    Parameters:
+    city (str): City as stored in the job dataset
+    state (str): Two-letter state code, if known
+
+    Returns:
+    str: Query such as "Los Angeles, CA", or None if there is no city
+    """
+    if city is None or pd.isna(city) or not str(city).strip():
+        return None
+    city = _LOCATION_PREFIX.sub('', str(city).strip())
+    if state is not None and not pd.isna(state) and str(state).strip():
+        return f"{city}, {str(state).strip()}"
+    return city
+
+
+def _connect(cache_path: str) -> sqlite3.Connection:
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS geocode (
+            query TEXT PRIMARY KEY,
+            latitude REAL,
+            longitude REAL,
+            fetched_at REAL NOT NULL,
+            last_used REAL NOT NULL
+        )
+        """
+    )
+    return conn
+
+
+def read_lookup_table(lookup_path: str = LOOKUP_PATH) -> Dict[str, Coordinates]:
+    """
+    Reads the bundled lookup table (query, latitude, longitude) used in offline mode.
+    """
+    if not os.path.exists(lookup_path):
+        return {}
+    lookup = pd.read_csv(lookup_path)
+    return {
+        query: (lat, lon)
+        for query, lat, lon in zip(lookup['query'], lookup['latitude'], lookup['longitude'])
+        if pd.notna(lat) and pd.notna(lon)
+    }
+
+
+def read_cache(queries: Iterable[str], cache_path: str = CACHE_PATH,
+               ttl_days: float = DEFAULT_TTL_DAYS) -> Dict[str, Coordinates]:
+    """
+    Returns the non-expired cache entries for the given queries.
+    Negative results (location not found) are cached as None.
+    """
+    queries = list(queries)
+    if not queries:
+        return {}
+
+    now = time.time()
+    min_fetched_at = now - ttl_days * 86400
+    hits = {}
+    with _connect(cache_path) as conn:
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(queries), 500):
+            batch = queries[i:i+500]
+            placeholders = ','.join('?' * len(batch))
+            rows = conn.execute(
+                f"SELECT query, latitude, longitude FROM geocode "
+                f"WHERE query IN ({placeholders}) AND fetched_at >= ?",
+                (*batch, min_fetched_at)
+            ).fetchall()
+            for query, lat, lon in rows:
+                hits[query] = (lat, lon) if lat is not None else None
+            conn.executemany(
+                "UPDATE geocode SET last_used = ? WHERE query = ?",
+                [(now, query) for query, _, _ in rows]
+            )
+    conn.close()
+    return hits
+
+
+def write_cache(results: Dict[str, Coordinates], cache_path: str = CACHE_PATH,
+                max_entries: int = MAX_CACHE_ENTRIES) -> None:
+    """
+    Stores geocoding results and evicts the least recently used entries above max_entries.
+    """
+    if not results:
+        return
+
+    now = time.time()
+    with _connect(cache_path) as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO geocode (query, latitude, longitude, fetched_at, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (query, coords[0] if coords else None, coords[1] if coords else None, now, now)
+                for query, coords in results.items()
+            ]
+        )
+        conn.execute(
+            "DELETE FROM geocode WHERE query NOT IN "
+            "(SELECT query FROM geocode ORDER BY last_used DESC LIMIT ?)",
+            (max_entries,)
+        )
+    conn.close()
+
+
+def evict_expired(cache_path: str = CACHE_PATH, ttl_days: float = DEFAULT_TTL_DAYS) -> int:
+    """
+    Deletes expired cache entries and returns how many were removed.
+    """
+    with _connect(cache_path) as conn:
+        cursor = conn.execute(
+            "DELETE FROM geocode WHERE fetched_at < ?",
+            (time.time() - ttl_days * 86400,)
+        )
+        removed = cursor.rowcount
+    conn.close()
+    return removed
+
+
+def _geocode_batch(queries: Iterable[str], user_agent: str,
+                   min_delay_seconds: float) -> Dict[str, Coordinates]:
+    # geopy is only needed when we actually go to the network
+    from geopy.geocoders import Nominatim
+    from geopy.extra.rate_limiter import RateLimiter
+
+    geolocator = Nominatim(user_agent=user_agent)
+    geocode = RateLimiter(
+        geolocator.geocode,
+        min_delay_seconds=min_delay_seconds,
+        max_retries=2,
+        swallow_exceptions=False
+    )
+
+    results = {}
+    for query in queries:
+        try:
+            location = geocode(query, country_codes='us')
+        except Exception as e:
+            # Leave the query out so it is retried on the next run instead of cached as missing
+            logger.error(f"Error getting coordinates for {query}: {str(e)}")
+            continue
+        results[query] = (location.latitude, location.longitude) if location else None
+    return results
+
+
+def geocode_locations(queries: Iterable[str], offline: bool = False,
+                      cache_path: str = CACHE_PATH, lookup_path: str = LOOKUP_PATH,
+                      ttl_days: float = DEFAULT_TTL_DAYS,
+                      min_delay_seconds: float = MIN_DELAY_SECONDS,
+                      user_agent: str = 'job_locator') -> Dict[str, Coordinates]:
+    """
+    Resolves a set of location queries to (latitude, longitude).
+
+    Queries are deduplicated and resolved from the bundled lookup table first, then
+    from the on-disk cache. Only the remaining misses are sent to Nominatim, one
+    rate-limited batch per call, and the results are written back to the cache.
+
+    Parameters:
+    queries (Iterable[str]): Location queries, see normalize_location()
+    offline (bool): Never call the network; unresolved queries map to None
+    cache_path (str): Path to the SQLite cache
+    lookup_path (str): Path to the bundled lookup table
+    ttl_days (float): Age after which cached entries are fetched again
+    min_delay_seconds (float): Minimum delay between two Nominatim requests
+    user_agent (str): User agent reported to Nominatim
+
+    Returns:
+    Dict[str, Coordinates]: Coordinates per query, None when not found
+    """
+    unique_queries = {q for q in queries if q}
+    resolved = {}
+
+    lookup = read_lookup_table(lookup_path)
+    for query in unique_queries:
+        if query in lookup:
+            resolved[query] = lookup[query]
+
+    misses = unique_queries - resolved.keys()
+    # In offline mode an existing cache is still used, but never created
+    if misses and (not offline or os.path.exists(cache_path)):
+        resolved.update(read_cache(misses, cache_path, ttl_days))
+        misses = unique_queries - resolved.keys()
+
+    if misses and not offline:
+        logger.info(f"Geocoding {len(misses)} uncached locations")
+        fetched = _geocode_batch(sorted(misses), user_agent, min_delay_seconds)
+        write_cache(fetched, cache_path)
+        resolved.update(fetched)
+        misses = unique_queries - resolved.keys()
+
+    for query in misses:
+        resolved[query] = None
+    return resolved
+
+
+def add_coordinates(df: pd.DataFrame, city_column: str = 'City', state_column: str = 'State',
+                    **kwargs) -> pd.DataFrame:
+    """
+    Returns a copy of df with Latitude/Longitude columns resolved through geocode_locations().
+    Extra keyword arguments are forwarded to geocode_locations().
+    """
+    states = df[state_column] if state_column in df.columns else [None] * len(df)
+    queries = pd.Series(
+        [normalize_location(city, state) for city, state in zip(df[city_column], states)],
+        index=df.index
+    )
+    coordinates = geocode_locations(queries.dropna().unique(), **kwargs)
+
+    df = df.copy()
+    df['Latitude'] = queries.map(lambda q: coordinates[q][0] if q and coordinates.get(q) else None)
+    df['Longitude'] = queries.map(lambda q: coordinates[q][1] if q and coordinates.get(q) else None)
+    return df
+
+
+def export_lookup_table(cache_path: str = CACHE_PATH, lookup_path: str = LOOKUP_PATH) -> int:
+    """
+    Merges the resolved cache entries into the bundled lookup table.
+    Returns the number of rows in the updated table.
+    """
+    with _connect(cache_path) as conn:
+        cached = pd.read_sql_query(
+            "SELECT query, latitude, longitude FROM geocode WHERE latitude IS NOT NULL", conn
+        )
+    conn.close()
+
+    if os.path.exists(lookup_path):
+        cached = pd.concat([pd.read_csv(lookup_path), cached], ignore_index=True)
+    lookup = cached.drop_duplicates('query', keep='last').sort_values('query')
+    lookup.to_csv(lookup_path, index=False)
+    return len(lookup)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Maintain the job dashboard geocode cache')
+    parser.add_argument('--input', default='final_job_data.csv', help='Job dataset to geocode')
+    parser.add_argument('--cache', default=CACHE_PATH, help='SQLite cache path')
+    parser.add_argument('--lookup', default=LOOKUP_PATH, help='Bundled lookup table path')
+    parser.add_argument('--ttl-days', type=float, default=DEFAULT_TTL_DAYS)
+    parser.add_argument('--export-lookup', action='store_true',
+                        help='Write resolved cache entries into the lookup table')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    logger.info(f"Evicted {evict_expired(args.cache, args.ttl_days)} expired entries")
+    add_coordinates(pd.read_csv(args.input), cache_path=args.cache,
+                    lookup_path=args.lookup, ttl_days=args.ttl_days)
+    if args.export_lookup:
+        logger.info(f"Lookup table now has {export_lookup_table(args.cache, args.lookup)} entries")
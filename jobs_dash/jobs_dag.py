@@ -0,0 +1,63 @@
+from airflow import DAG
+from airflow.decorators import task
+from airflow.exceptions import AirflowSkipException
+from datetime import datetime, timedelta
+import os
+import sys
+
+# The DAG file may be symlinked into the Airflow dags folder; import the pipeline from jobs_dash itself
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+from build_dataset import ARTIFACT_PATH, expand_inputs, ingest_job_files  # noqa: E402
+
+
+# Folder the Indeed scrapes are dropped into, one CSV per scrape, named so they sort oldest first
+SCRAPE_DIR = os.getenv('JOBS_SCRAPE_DIR', 'job_scrapes')
+
+# Artifact read by the job dashboard (its manifest is written next to it)
+JOB_ARTIFACT_PATH = os.getenv('JOBS_ARTIFACT_PATH', ARTIFACT_PATH)
+
+# Resolve coordinates only from the bundled lookup table and the local cache
+GEOCODE_OFFLINE = os.getenv('GEOCODE_OFFLINE', '0') == '1'
+
+# Worker processes used to clean the scrape files (None: one per CPU)
+INGEST_WORKERS = None
+
+
+# Define default arguments for the DAG
+default_args = {
+    'owner': 'airflow',
+    'start_date': datetime(2024, 10, 6),
+    'retries': 1,
+    'retry_delay': timedelta(minutes=5),
+    'email_on_failure': True,
+    'email_on_retry': False,
+    'depends_on_past': False,
+}
+
+# Define the DAG
+with DAG(
+    'jobs_ingestion',
+    default_args=default_args,
+    schedule_interval='@daily',
+    catchup=False,
+    max_active_runs=1,
+    description='Cleans new Indeed scrapes into the job dashboard dataset',
+    tags=['etl', 'streamlit', 'jobs']
+) as dag:
+
+    # Task to add new scrapes to the artifact; files already ingested are skipped, and a run
+    # without any scrape is skipped rather than failed
+    @task
+    def ingest_job_scrapes() -> dict:
+        raw_paths = expand_inputs([SCRAPE_DIR]) if os.path.isdir(SCRAPE_DIR) else []
+        if not raw_paths:
+            raise AirflowSkipException(f"No scrapes in {SCRAPE_DIR}")
+        return ingest_job_files(
+            raw_paths=raw_paths,
+            artifact_path=JOB_ARTIFACT_PATH,
+            offline_geocoding=GEOCODE_OFFLINE,
+            incremental=True,
+            max_workers=INGEST_WORKERS
+        )
+
+    ingest_job_scrapes()
@@ -0,0 +1,144 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+# folium is only imported by the functions that build a map; loading the
+# precomputed or prerendered maps doesn't pay for it
+if TYPE_CHECKING:
+    import folium
+
+# Marker radius range (pixels) for grouped locations, scaled by posting count
+MIN_RADIUS = 5
+MAX_RADIUS = 30
+
+# Map center used when there is nothing to show (contiguous US)
+DEFAULT_CENTER = [39.8, -98.6]
+
+# Client-side marker for FastMarkerCluster; row = [lat, lon, tooltip]
+_FAST_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.marker(new L.LatLng(row[0], row[1]));
+    marker.bindTooltip(row[2]);
+    return marker;
+};
+"""
+
+
+def aggregate_locations(df: pd.DataFrame, max_companies: int = 3) -> pd.DataFrame:
+    """
+    Groups job postings by coordinates in a single pass.
+
+    Parameters:
+    df (pd.DataFrame): Job postings with Latitude, Longitude, City, State, Company and Salary
+    max_companies (int): Number of most frequent companies listed per location
+
+    Returns:
+    pd.DataFrame: One row per location with jobs, salary count/mean/min/max and top companies
+    """
+    grouped = df.groupby(['Latitude', 'Longitude'], sort=False, observed=True)
+    locations = grouped.agg(
+        City=('City', 'first'),
+        State=('State', 'first'),
+        jobs=('Company', 'size'),
+        salary_count=('Salary', 'count'),
+        salary_mean=('Salary', 'mean'),
+        salary_min=('Salary', 'min'),
+        salary_max=('Salary', 'max'),
+    )
+
+    top_companies = (
+        df.groupby(['Latitude', 'Longitude', 'Company'], sort=False, observed=True)
+        .size()
+        .sort_values(ascending=False)
+        .groupby(level=['Latitude', 'Longitude'], sort=False)
+        .head(max_companies)
+        .reset_index()
+        .groupby(['Latitude', 'Longitude'], sort=False)['Company']
+        .agg(', '.join)
+    )
+    locations['companies'] = top_companies
+    return locations.reset_index()
+
+
+def _map_center(df: pd.DataFrame) -> list:
+    if df.empty:
+        return DEFAULT_CENTER
+    return [df['Latitude'].mean(), df['Longitude'].mean()]
+
+
+def _format_salary(values: pd.Series) -> pd.Series:
+    return values.map(lambda v: f"${v:,.0f}" if pd.notna(v) else "n/a")
+
+
+def build_grouped_map(locations: pd.DataFrame, width: int = 800, height: int = 600) -> 'folium.Map':
+    """
+    Builds a map with one circle per location, sized by the number of postings.
+    All locations are sent as a single GeoJSON layer.
+    """
+    import folium
+
+    m = folium.Map(location=_map_center(locations), zoom_start=4, width=width, height=height)
+    if locations.empty:
+        return m
+
+    scale = np.sqrt(locations['jobs'] / locations['jobs'].max())
+    radius = MIN_RADIUS + (MAX_RADIUS - MIN_RADIUS) * scale
+    properties = pd.DataFrame({
+        'location': locations['City'].astype(str) + ', ' + locations['State'].astype(str),
+        'jobs': locations['jobs'].astype(int),
+        'salaries': locations['salary_count'].astype(int),
+        'mean_salary': _format_salary(locations['salary_mean']),
+        'salary_range': _format_salary(locations['salary_min']) + ' - ' + _format_salary(locations['salary_max']),
+        'companies': locations['companies'].fillna(''),
+        'radius': radius.round(1),
+    })
+
+    features = [
+        {
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+            'properties': props,
+        }
+        for lat, lon, props in zip(
+            locations['Latitude'], locations['Longitude'], properties.to_dict('records')
+        )
+    ]
+
+    folium.GeoJson(
+        {'type': 'FeatureCollection', 'features': features},
+        name='Jobs by location',
+        marker=folium.CircleMarker(fill=True, fill_opacity=0.6, weight=1),
+        style_function=lambda feature: {'radius': feature['properties']['radius']},
+        tooltip=folium.GeoJsonTooltip(fields=['location', 'jobs'], aliases=['Location', 'Jobs']),
+        popup=folium.GeoJsonPopup(
+            fields=['location', 'jobs', 'salaries', 'mean_salary', 'salary_range', 'companies'],
+            aliases=['Location', 'Jobs', 'With salary', 'Average salary', 'Salary range', 'Top companies'],
+        ),
+    ).add_to(m)
+    return m
+
+
+def build_cluster_map(df: pd.DataFrame, width: int = 800, height: int = 600) -> 'folium.Map':
+    """
+    Builds a map with every posting as a client-side clustered marker.
+    Points are passed as one array instead of one folium.Marker per row.
+    """
+    import folium
+    from folium.plugins import FastMarkerCluster
+
+    m = folium.Map(location=_map_center(df), zoom_start=4, width=width, height=height)
+    data = pd.DataFrame({
+        'lat': df['Latitude'],
+        'lon': df['Longitude'],
+        'tooltip': df['Company'].astype(str) + ' - ' + df['Job Title'].astype(str),
+    }).values.tolist()
+    FastMarkerCluster(data, callback=_FAST_MARKER_CALLBACK).add_to(m)
+    return m
+
+
+def render_map_html(m: 'folium.Map') -> str:
+    """
+    Renders a folium map to a standalone HTML document.
+    """
+    return m.get_root().render()
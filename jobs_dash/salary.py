@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+# Working time used to annualize pay quoted per hour, day, week or month
+HOURS_PER_YEAR = 2080
+PERIODS_PER_YEAR = {
+    'hour': HOURS_PER_YEAR,
+    'day': 260,
+    'week': 52,
+    'month': 12,
+    'year': 1,
+}
+
+# Spellings of each period found in salary text
+PERIOD_ALIASES = {
+    'hour': 'hour', 'hourly': 'hour', 'hr': 'hour',
+    'day': 'day', 'daily': 'day',
+    'week': 'week', 'weekly': 'week', 'wk': 'week',
+    'month': 'month', 'monthly': 'month', 'mo': 'month',
+    'year': 'year', 'yearly': 'year', 'annually': 'year', 'annum': 'year', 'yr': 'year',
+}
+
+CURRENCY_SYMBOLS = {'$': 'USD', '£': 'GBP', '€': 'EUR', '₹': 'INR'}
+
+_PERIOD_WORDS = '|'.join(sorted(PERIOD_ALIASES, key=len, reverse=True))
+
+# Matched against lower-cased text, e.g. "$120,000 - $140,000 a year", "up to $37 an hour",
+# "from £3k per month", "usd 90,000 to 110,000" or Indeed's "estimated $100k - $120k a year"
+SALARY_PATTERN = (
+    r'^\s*(?:estimated\b:?\s*)?(?P<qualifier>from|starting at|up to)?\s*'
+    r'(?P<currency>[$£€₹]|[a-z]{3}(?=\s?\d))?\s*'
+    r'(?P<low>\d[\d,]*(?:\.\d+)?)\s*(?P<low_k>k)?'
+    r'(?:\s*(?:-|–|to)\s*(?:[$£€₹]|[a-z]{3})?\s*(?P<high>\d[\d,]*(?:\.\d+)?)\s*(?P<high_k>k)?)?'
+    r'\s*(?:an?|per|/)?\s*(?P<period>' + _PERIOD_WORDS + r')?\b'
+)
+
+SALARY_COLUMNS = ['Salary Min', 'Salary Max', 'Salary Period', 'Salary Currency', 'Annual Min', 'Annual Max']
+
+
+def _numbers(number: pd.Series) -> np.ndarray:
+    return pd.to_numeric(number.str.replace(',', '', regex=False), errors='coerce').to_numpy(dtype=float)
+
+
+def parse_salaries(salary: pd.Series) -> pd.DataFrame:
+    """
+    Normalizes free-text salaries into numeric ranges.
+
+    Each distinct text is parsed once by a single regex extraction, and the
+    results are spread back to the rows with NumPy indexing, so the cost grows
+    with the number of distinct salaries rather than the number of postings.
+
+    "From"/"Starting at" give only a minimum and "Up to" only a maximum; a single
+    amount is both. A leading "Estimated" is ignored. When only the upper bound has
+    a "k" and the lower bound is the smaller number ("$50 - 60k"), the "k" applies
+    to both. Text without a period is taken as yearly pay. Missing or unparseable
+    values are NaN in every column, never 0.
+
+    Parameters:
+    salary (pd.Series): Salary text such as "$120,000 - $140,000 a year" or "$37 an hour"
+
+    Returns:
+    pd.DataFrame: SALARY_COLUMNS with the index of salary: the amounts as quoted, the period
+    (hour/day/week/month/year), the ISO currency code and both bounds annualized
+    """
+    codes, uniques = pd.factorize(salary)
+    parts = pd.Series(uniques, dtype='string').str.lower().str.extract(SALARY_PATTERN)
+
+    low, high = _numbers(parts['low']), _numbers(parts['high'])
+    high_k = parts['high_k'].notna().to_numpy()
+    low_k = parts['low_k'].notna().to_numpy() | (high_k & (low <= high))
+    low = np.where(low_k, low * 1000, low)
+    high = np.where(high_k, high * 1000, high)
+    qualifier = parts['qualifier'].fillna('').to_numpy(dtype=object)
+    upper_bound_only = qualifier == 'up to'
+    lower_bound_only = (qualifier == 'from') | (qualifier == 'starting at')
+    salary_min = np.where(upper_bound_only, np.nan, low)
+    salary_max = np.where(lower_bound_only, np.nan, np.where(np.isnan(high), low, high))
+
+    period = parts['period'].map(PERIOD_ALIASES).fillna('year').where(~np.isnan(low))
+    currency = parts['currency'].replace(CURRENCY_SYMBOLS).str.upper()
+    per_year = period.map(PERIODS_PER_YEAR).to_numpy(dtype=float, na_value=np.nan)
+
+    distinct = pd.DataFrame({
+        'Salary Min': salary_min,
+        'Salary Max': salary_max,
+        'Salary Period': pd.Categorical(period, categories=list(PERIODS_PER_YEAR)),
+        'Salary Currency': currency.astype(object).astype('category'),
+        'Annual Min': np.round(salary_min * per_year, 2),
+        'Annual Max': np.round(salary_max * per_year, 2),
+    })
+
+    # Missing salaries (code -1) take the all-missing row added after the distinct values
+    rows = np.where(codes < 0, len(distinct), codes)
+    distinct = distinct.reindex(np.arange(len(distinct) + 1))
+    return distinct.take(rows).set_axis(salary.index)
@@ -0,0 +1,83 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+# plotly is only imported to build the figures; the statistics don't need it
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+STAT_COLUMNS = ['count', 'mean', 'min', 'q1', 'median', 'q3', 'max', 'lower_fence', 'upper_fence']
+
+
+def _finish_stats(described: pd.DataFrame) -> pd.DataFrame:
+    stats = described.rename(columns={'25%': 'q1', '50%': 'median', '75%': 'q3'})
+    iqr = stats['q3'] - stats['q1']
+    # Box plot whiskers: Tukey fences clipped to the observed range
+    stats['lower_fence'] = np.maximum(stats['min'], stats['q1'] - 1.5 * iqr)
+    stats['upper_fence'] = np.minimum(stats['max'], stats['q3'] + 1.5 * iqr)
+    stats['count'] = stats['count'].astype(int)
+    return stats[STAT_COLUMNS]
+
+
+def compute_salary_stats(df: pd.DataFrame, profile_column: str = 'Job Profile',
+                         nbins: int = 10) -> dict:
+    """
+    Computes every salary statistic the dashboard shows.
+
+    Parameters:
+    df (pd.DataFrame): Job postings with Salary and Job Profile columns
+    profile_column (str): Column to group by
+    nbins (int): Number of histogram bins for the overall distribution
+
+    Returns:
+    dict: 'overall' (pd.Series of STAT_COLUMNS plus 'jobs'), 'by_profile' (pd.DataFrame,
+    one row per profile) and 'histogram' (pd.DataFrame with bin edges and counts)
+    """
+    salary = df['Salary']
+
+    # One grouped pass gives count/mean/min/quartiles/max for every profile
+    by_profile = _finish_stats(
+        salary.groupby(df[profile_column], observed=True).describe()
+    )
+    overall = _finish_stats(salary.describe().to_frame().T).iloc[0]
+    overall['jobs'] = len(df)
+
+    values = salary.dropna().to_numpy()
+    counts, edges = np.histogram(values, bins=nbins) if len(values) else (np.zeros(0), np.zeros(1))
+    histogram = pd.DataFrame({'start': edges[:-1], 'end': edges[1:], 'count': counts})
+
+    return {'overall': overall, 'by_profile': by_profile, 'histogram': histogram}
+
+
+def salary_histogram_figure(histogram: pd.DataFrame) -> 'go.Figure':
+    """
+    Bar chart of the precomputed salary histogram.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(
+        x=(histogram['start'] + histogram['end']) / 2,
+        y=histogram['count'],
+        width=histogram['end'] - histogram['start'],
+    ))
+    fig.update_layout(xaxis_title='Salary', yaxis_title='count', bargap=0.05)
+    return fig
+
+
+def salary_box_figure(by_profile: pd.DataFrame) -> 'go.Figure':
+    """
+    Box plot per profile drawn from precomputed quartiles and fences.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for profile, stats in by_profile[by_profile['count'] > 0].iterrows():
+        fig.add_trace(go.Box(
+            name=str(profile), x=[str(profile)],
+            q1=[stats['q1']], median=[stats['median']], q3=[stats['q3']],
+            lowerfence=[stats['lower_fence']], upperfence=[stats['upper_fence']],
+            mean=[stats['mean']],
+        ))
+    fig.update_layout(xaxis_title='Job Profile', yaxis_title='Salary')
+    return fig
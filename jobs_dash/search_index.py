@@ -0,0 +1,187 @@
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Indexed columns and their ranking weight (a title match counts more than a description match)
+SEARCH_FIELDS = {
+    'Job Title': 3.0,
+    'Company': 2.0,
+    'City': 1.0,
+    'Short Description': 0.5,
+}
+
+# Extra score factor when a query term matches a token exactly rather than as a prefix
+EXACT_MATCH_BOOST = 1.5
+
+_TOKEN_PATTERN = r'[a-z0-9]+'
+
+
+def tokenize(text: str) -> List[str]:
+    return re.findall(_TOKEN_PATTERN, text.lower())
+
+
+class SearchIndex:
+    """
+    Token inverted index over the job postings.
+
+    The vocabulary is a sorted array, so a prefix maps to a contiguous range of
+    token ids. For every field the postings are stored CSR-style: the documents
+    containing token t are docs[offsets[t]:offsets[t + 1]], sorted by row.
+    """
+
+    def __init__(self, vocabulary: np.ndarray, idf: np.ndarray,
+                 postings: Dict[str, Tuple[np.ndarray, np.ndarray]], n_docs: int, version: str = '',
+                 weights: Optional[Dict[str, float]] = None):
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.postings = postings
+        self.n_docs = n_docs
+        self.version = version
+        # Ranking weight of each indexed field, as given to build()
+        self.weights = weights if weights is not None else {field: SEARCH_FIELDS.get(field, 1.0) for field in postings}
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, version: str = '',
+              fields: Dict[str, float] = SEARCH_FIELDS) -> 'SearchIndex':
+        """
+        Builds the index over the given DataFrame. Results refer to row positions in df.
+        """
+        fields = {field: weight for field, weight in fields.items() if field in df.columns}
+        field_tokens = {}
+        for field in fields:
+            tokens = (
+                df[field].astype('string').fillna('').str.lower()
+                .str.findall(_TOKEN_PATTERN)
+                .reset_index(drop=True)
+                .explode()
+                .dropna()
+            )
+            # One posting per (token, row) pair
+            pairs = pd.DataFrame({'token': tokens.to_numpy(), 'doc': tokens.index.to_numpy()})
+            field_tokens[field] = pairs.drop_duplicates()
+
+        all_tokens = pd.concat([pairs['token'] for pairs in field_tokens.values()], ignore_index=True)
+        vocabulary = np.sort(all_tokens.unique().astype(str)).astype(object)
+
+        postings = {}
+        doc_frequency = np.zeros(len(vocabulary), dtype=np.int64)
+        for field, pairs in field_tokens.items():
+            token_ids = np.searchsorted(vocabulary, pairs['token'].to_numpy())
+            order = np.lexsort((pairs['doc'].to_numpy(), token_ids))
+            docs = pairs['doc'].to_numpy()[order].astype(np.int64)
+            counts = np.bincount(token_ids, minlength=len(vocabulary))
+            offsets = np.concatenate(([0], np.cumsum(counts)))
+            postings[field] = (offsets, docs)
+            # Approximation: a token's document frequency is taken from its most common field
+            doc_frequency = np.maximum(doc_frequency, counts)
+
+        idf = np.log1p(len(df) / np.maximum(doc_frequency, 1))
+        return cls(vocabulary, idf, postings, len(df), version, fields)
+
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        start = np.searchsorted(self.vocabulary, prefix, side='left')
+        end = np.searchsorted(self.vocabulary, prefix + '\uffff', side='left')
+        return int(start), int(end)
+
+    def _match_term(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        # Returns matching rows and their score for one query term (prefix match)
+        start, end = self._prefix_range(term)
+        if start == end:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        docs, scores = [], []
+        exact = self.vocabulary[start:end] == term
+        for field, (offsets, field_docs) in self.postings.items():
+            weight = self.weights[field]
+            # Postings of a token range are contiguous, so one slice covers every expansion
+            counts = np.diff(offsets[start:end + 1])
+            if not counts.sum():
+                continue
+            token_scores = weight * self.idf[start:end] * np.where(exact, EXACT_MATCH_BOOST, 1.0)
+            docs.append(field_docs[offsets[start]:offsets[end]])
+            scores.append(np.repeat(token_scores, counts))
+
+        if not docs:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        rows, inverse = np.unique(np.concatenate(docs), return_inverse=True)
+        return rows, np.bincount(inverse, weights=np.concatenate(scores))
+
+    def search(self, query: str, page: int = 1, page_size: int = 25,
+               within: Optional[np.ndarray] = None) -> Tuple[np.ndarray, int]:
+        """
+        Runs an AND query where every term is matched as a token prefix.
+
+        Parameters:
+        query (str): Free-text query, e.g. "senior data sci"
+        page (int): 1-based page number
+        page_size (int): Results per page
+        within (np.ndarray): Sorted row positions to restrict the results to (e.g. from FilterIndex.rows())
+
+        Returns:
+        Tuple[np.ndarray, int]: Row positions for the requested page (best first) and total hits
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return np.empty(0, dtype=np.int64), 0
+
+        rows, scores = None, None
+        # Start with the rarest-looking term (longest) to keep intersections small
+        for term in sorted(terms, key=len, reverse=True):
+            term_rows, term_scores = self._match_term(term)
+            if rows is None:
+                rows, scores = term_rows, term_scores
+            else:
+                rows, left, right = np.intersect1d(rows, term_rows, assume_unique=True, return_indices=True)
+                scores = scores[left] + term_scores[right]
+            if not len(rows):
+                return rows, 0
+
+        if within is not None:
+            keep = np.isin(rows, within, assume_unique=True)
+            rows, scores = rows[keep], scores[keep]
+
+        # Best score first, ties keep dataset order
+        order = np.lexsort((rows, -scores))
+        start = (max(page, 1) - 1) * page_size
+        return rows[order][start:start + page_size], len(rows)
+
+    def save(self, path: str) -> None:
+        arrays = {'vocabulary': self.vocabulary.astype(str), 'idf': self.idf,
+                  'n_docs': np.array(self.n_docs), 'version': np.array(self.version),
+                  'fields': np.array(list(self.postings)),
+                  'weights': np.array([self.weights[field] for field in self.postings], dtype=float)}
+        for i, (offsets, docs) in enumerate(self.postings.values()):
+            arrays[f'offsets_{i}'] = offsets
+            arrays[f'docs_{i}'] = docs
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchIndex':
+        with np.load(path, allow_pickle=False) as data:
+            postings = {
+                str(field): (data[f'offsets_{i}'], data[f'docs_{i}'])
+                for i, field in enumerate(data['fields'])
+            }
+            # Indexes saved before the weights were stored use the default weights
+            weights = dict(zip(postings, data['weights'].tolist())) if 'weights' in data else None
+            return cls(data['vocabulary'].astype(object), data['idf'], postings,
+                       int(data['n_docs']), str(data['version']), weights)
+
+
+def load_or_build_index(df: pd.DataFrame, path: str, version: str) -> SearchIndex:
+    """
+    Loads the index saved at path if it matches the dataset version, otherwise
+    rebuilds it from df and saves it for the next process.
+    """
+    if os.path.exists(path):
+        index = SearchIndex.load(path)
+        if index.version == version and index.n_docs == len(df):
+            return index
+    index = SearchIndex.build(df, version)
+    index.save(path)
+    return index
@@ -0,0 +1,169 @@
+from concurrent.futures import Future
+
+import pandas as pd
+import pytest
+
+import build_dataset
+from build_dataset import _clean_files, ingest_job_files, read_manifest
+
+RAW_COLUMNS = ['Position', 'Job Title', 'Company', 'Location', 'Salary', 'Short Description', 'Posted At', 'Job link']
+
+
+def write_scrape(path, postings):
+    """
+    Writes a raw Indeed scrape; postings are (job link, title, salary) tuples.
+    """
+    pd.DataFrame([
+        {'Position': i + 1, 'Job Title': title, 'Company': 'Acme', 'Location': 'Austin, TX 78701',
+         'Salary': salary, 'Short Description': 'Build models', 'Posted At': None, 'Job link': link}
+        for i, (link, title, salary) in enumerate(postings)
+    ], columns=RAW_COLUMNS).to_csv(path, index=False)
+    return str(path)
+
+
+class FakePool:
+    """
+    Synchronous stand-in for ProcessPoolExecutor that records how many
+    submitted files have not had their result taken yet.
+    """
+    instances = []
+
+    def __init__(self, max_workers=None):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        FakePool.instances.append(self)
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        result = future.result
+
+        def take():
+            self.in_flight -= 1
+            return result()
+        future.result = take
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_clean_files_bounds_the_files_in_flight(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_dataset, 'ProcessPoolExecutor', FakePool)
+    paths = [write_scrape(tmp_path / f'scrape_{i}.csv', [(f'link-{i}', 'Data Scientist', None)]) for i in range(7)]
+
+    frames = list(_clean_files(paths, max_workers=2))
+
+    assert [df['Job link'].iloc[0] for df in frames] == [f'link-{i}' for i in range(7)]
+    # One file per worker
+    assert FakePool.instances[-1].max_in_flight == 2
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # The geocoding cache and lookup table are relative paths
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def read_artifact(path):
+    return pd.read_parquet(path).set_index('Job link')
+
+
+def test_ingest_keeps_the_newest_posting(workdir):
+    old = write_scrape(workdir / 'scrape_1.csv', [('a', 'Data Analyst', '$80,000 a year'), ('b', 'Data Engineer', None)])
+    new = write_scrape(workdir / 'scrape_2.csv', [('a', 'Data Analyst', '$90,000 a year'), ('c', 'ML Engineer', None)])
+
+    manifest = ingest_job_files([old, new], 'job_data.parquet', offline_geocoding=True, max_workers=2)
+
+    df = read_artifact('job_data.parquet')
+    assert sorted(df.index) == ['a', 'b', 'c']
+    assert df.loc['a', 'Salary'] == 90000
+    assert manifest['rows'] == 3
+    assert list(manifest['sources']) == ['scrape_1.csv', 'scrape_2.csv']
+
+
+def test_parallel_and_serial_ingestion_match(workdir):
+    paths = [
+        write_scrape(workdir / f'scrape_{i}.csv', [(f'link-{j}', 'Data Scientist', f'${50 + i + j},000 a year')
+                                                   for j in range(i, i + 5)])
+        for i in range(4)
+    ]
+
+    ingest_job_files(paths, 'serial.parquet', offline_geocoding=True, max_workers=1)
+    ingest_job_files(paths, 'parallel.parquet', offline_geocoding=True, max_workers=3)
+
+    pd.testing.assert_frame_equal(pd.read_parquet('parallel.parquet'), pd.read_parquet('serial.parquet'))
+
+
+def test_incremental_ingestion(workdir):
+    first = write_scrape(workdir / 'scrape_1.csv', [('a', 'Data Analyst', None), ('b', 'Data Engineer', None)])
+    manifest = ingest_job_files([first], 'job_data.parquet', offline_geocoding=True)
+
+    # Unchanged input is a no-op
+    assert ingest_job_files([first], 'job_data.parquet', offline_geocoding=True) == manifest
+
+    second = write_scrape(workdir / 'scrape_2.csv', [('b', 'Data Engineer', '$100,000 a year'), ('c', 'Data Scientist', None)])
+    updated = ingest_job_files([first, second], 'job_data.parquet', offline_geocoding=True)
+
+    df = read_artifact('job_data.parquet')
+    assert updated['version'] != manifest['version']
+    assert sorted(df.index) == ['a', 'b', 'c']
+    assert df.loc['b', 'Salary'] == 100000
+    assert read_manifest('job_data.parquet') == updated
+
+
+def test_changed_older_file_does_not_override_newer_postings(workdir):
+    old = write_scrape(workdir / 'scrape_1.csv', [('a', 'Data Analyst', '$80,000 a year')])
+    new = write_scrape(workdir / 'scrape_2.csv', [('a', 'Data Analyst', '$90,000 a year')])
+    ingest_job_files([old, new], 'job_data.parquet', offline_geocoding=True)
+
+    # Only the older scrape changes; the newer one's posting must still win
+    write_scrape(workdir / 'scrape_1.csv', [('a', 'Data Analyst', '$70,000 a year'), ('b', 'Data Engineer', None)])
+    ingest_job_files([old, new], 'job_data.parquet', offline_geocoding=True)
+
+    df = read_artifact('job_data.parquet')
+    assert sorted(df.index) == ['a', 'b']
+    assert df.loc['a', 'Salary'] == 90000
+
+
+def test_failed_build_leaves_no_partial_artifact(workdir, monkeypatch):
+    scrape = write_scrape(workdir / 'scrape_1.csv', [('a', 'Data Analyst', None)])
+    manifest = ingest_job_files([scrape], 'job_data.parquet', offline_geocoding=True)
+    before = pd.read_parquet('job_data.parquet')
+
+    def failing_coordinates(df, offline):
+        raise RuntimeError('geocoder down')
+    monkeypatch.setattr(build_dataset, 'add_coordinates', failing_coordinates)
+    write_scrape(workdir / 'scrape_2.csv', [('b', 'Data Engineer', None)])
+    with pytest.raises(RuntimeError):
+        ingest_job_files([scrape, str(workdir / 'scrape_2.csv')], 'job_data.parquet', offline_geocoding=True)
+
+    assert not (workdir / 'job_data.parquet.tmp').exists()
+    pd.testing.assert_frame_equal(pd.read_parquet('job_data.parquet'), before)
+    assert read_manifest('job_data.parquet') == manifest
+
+
+def test_geocoding_mode_changes_the_version(workdir, monkeypatch):
+    def fake_coordinates(df, offline):
+        # Online lookups resolve a location the offline build leaves off the map
+        return df.assign(Latitude=None if offline else 30.27, Longitude=None if offline else -97.74)
+    monkeypatch.setattr(build_dataset, 'add_coordinates', fake_coordinates)
+    scrape = write_scrape(workdir / 'scrape_1.csv', [('a', 'Data Analyst', None)])
+
+    offline = ingest_job_files([scrape], 'job_data.parquet', offline_geocoding=True)
+    online = ingest_job_files([scrape], 'job_data.parquet', offline_geocoding=False)
+
+    assert online['version'] != offline['version']
+    assert online['geocoding'] == 'online'
+    assert read_artifact('job_data.parquet').loc['a', 'Latitude'] == 30.27
+
+
+def test_ingest_without_files_raises(workdir):
+    with pytest.raises(ValueError):
+        ingest_job_files([], 'job_data.parquet')
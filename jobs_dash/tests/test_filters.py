@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from filters import FilterIndex, JobFilters
+
+
+def postings():
+    # 'Company' keeps a category no row uses, as after dropping rows from a categorical column
+    df = pd.DataFrame({
+        'State': ['CA', 'NY', 'CA', None],
+        'Job Profile': ['Data Scientist', 'Data Analyst', 'Data Analyst', 'Data Engineer'],
+        'Company': pd.Categorical(['Acme', 'Globex', 'Acme', 'Initech'],
+                                  categories=['Acme', 'Globex', 'Hooli', 'Initech']),
+        'Salary': [120000.0, np.nan, 90000.0, 150000.0],
+    })
+    return df
+
+
+def test_values_skip_unused_categories():
+    index = FilterIndex(postings())
+    assert index.values('companies') == ['Acme', 'Globex', 'Initech']
+    assert index.values('states') == ['CA', 'NY']
+
+
+def test_rows_match_a_scan():
+    df = postings()
+    index = FilterIndex(df, dense_max_values=2)
+    filters = JobFilters(states=('CA',), companies=('Acme', 'Hooli'), salary_range=(100000, 200000))
+    expected = np.flatnonzero((df['State'] == 'CA') & df['Company'].isin(['Acme', 'Hooli'])
+                              & df['Salary'].between(100000, 200000))
+    np.testing.assert_array_equal(index.rows(filters), expected)
+    assert len(index.rows(JobFilters(companies=('Hooli',)))) == 0
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from salary import SALARY_COLUMNS, parse_salaries
+
+NAN = np.nan
+
+
+@pytest.mark.parametrize('text, salary_min, salary_max, period, currency', [
+    ('$120,000 - $140,000 a year', 120000, 140000, 'year', 'USD'),
+    ('$120,000 a year', 120000, 120000, 'year', 'USD'),
+    ('$37 an hour', 37, 37, 'hour', 'USD'),
+    ('$37.50 - $45.25 an hour', 37.5, 45.25, 'hour', 'USD'),
+    ('$300 - $400 a day', 300, 400, 'day', 'USD'),
+    ('$2,000 a week', 2000, 2000, 'week', 'USD'),
+    ('$8,000 - $9,500 a month', 8000, 9500, 'month', 'USD'),
+    ('Up to $110,000 a year', NAN, 110000, 'year', 'USD'),
+    ('From $90,000 a year', 90000, NAN, 'year', 'USD'),
+    ('Starting at $25 per hour', 25, NAN, 'hour', 'USD'),
+    ('£3k per month', 3000, 3000, 'month', 'GBP'),
+    ('€50,000 - €60,000 a year', 50000, 60000, 'year', 'EUR'),
+    ('USD 90,000 to 110,000', 90000, 110000, 'year', 'USD'),
+    ('$100K - $120K a year', 100000, 120000, 'year', 'USD'),
+    ('Estimated $100K - $120K a year', 100000, 120000, 'year', 'USD'),
+    ('Estimated: $85,000 a year', 85000, 85000, 'year', 'USD'),
+    ('$50 - 60k', 50000, 60000, 'year', 'USD'),
+    ('$50k - 60k a year', 50000, 60000, 'year', 'USD'),
+    ('$90,000 - 120k a year', 90000, 120000, 'year', 'USD'),
+    ('$120,000 – $140,000 a year', 120000, 140000, 'year', 'USD'),
+])
+def test_parse_salaries(text, salary_min, salary_max, period, currency):
+    row = parse_salaries(pd.Series([text])).iloc[0]
+
+    np.testing.assert_equal([row['Salary Min'], row['Salary Max']], [salary_min, salary_max])
+    assert row['Salary Period'] == period
+    assert row['Salary Currency'] == currency
+
+
+@pytest.mark.parametrize('text, annual_min, annual_max', [
+    ('$37 an hour', 37 * 2080, 37 * 2080),
+    ('$300 - $400 a day', 300 * 260, 400 * 260),
+    ('$2,000 a week', 2000 * 52, 2000 * 52),
+    ('$8,000 - $9,500 a month', 8000 * 12, 9500 * 12),
+    ('$120,000 - $140,000 a year', 120000, 140000),
+    ('Up to $110,000 a year', NAN, 110000),
+])
+def test_annualized_bounds(text, annual_min, annual_max):
+    row = parse_salaries(pd.Series([text])).iloc[0]
+
+    np.testing.assert_equal([row['Annual Min'], row['Annual Max']], [annual_min, annual_max])
+
+
+@pytest.mark.parametrize('text', [None, np.nan, '', 'Competitive', 'Not disclosed'])
+def test_missing_or_unparseable_salaries_are_nan(text):
+    row = parse_salaries(pd.Series([text], dtype=object)).iloc[0]
+
+    assert row[['Salary Min', 'Salary Max', 'Annual Min', 'Annual Max']].isna().all()
+    assert pd.isna(row['Salary Period'])
+
+
+def test_rows_keep_their_index_and_order():
+    salary = pd.Series(['$37 an hour', None, '$120,000 a year', '$37 an hour'], index=[10, 11, 12, 13])
+
+    result = parse_salaries(salary)
+
+    assert list(result.columns) == SALARY_COLUMNS
+    assert result.index.tolist() == [10, 11, 12, 13]
+    np.testing.assert_equal(result['Annual Min'].to_numpy(), [76960, NAN, 120000, 76960])
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from search_index import SearchIndex
+
+
+def postings():
+    return pd.DataFrame({
+        'Job Title': ['Data Analyst', 'Software Engineer'],
+        'Company': ['Analytics Corp', 'Data Works'],
+    })
+
+
+def test_ranking_uses_the_index_weights():
+    df = postings()
+    by_title = SearchIndex.build(df, fields={'Job Title': 3.0, 'Company': 1.0})
+    by_company = SearchIndex.build(df, fields={'Job Title': 1.0, 'Company': 3.0})
+    assert by_title.search('data')[0].tolist() == [0, 1]
+    assert by_company.search('data')[0].tolist() == [1, 0]
+
+
+def test_weights_survive_save_and_load(tmp_path):
+    path = str(tmp_path / 'search_index.npz')
+    index = SearchIndex.build(postings(), version='v1', fields={'Job Title': 1.0, 'Company': 3.0})
+    index.save(path)
+    loaded = SearchIndex.load(path)
+    assert loaded.weights == {'Job Title': 1.0, 'Company': 3.0}
+    assert loaded.search('data')[0].tolist() == [1, 0]
@@ -0,0 +1,128 @@
+import os
+import sys
+import glob
+import time
+import logging
+from typing import Optional
+
+import pandas as pd
+
+# Launcher and readiness endpoint shared with the YouTube dashboard
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'shared'))
+import readiness
+
+from build_dataset import ARTIFACT_PATH, RAW_PATH, build_job_dataset, read_manifest
+from map_view import aggregate_locations, build_cluster_map, build_grouped_map, render_map_html
+from search_index import load_or_build_index
+
+logger = logging.getLogger(__name__)
+
+# Columns used by the map, salary and result views; the long text fields are only read for search
+DASHBOARD_COLUMNS = ['Job Title', 'Company', 'Salary', 'Job Profile', 'City', 'State', 'Latitude', 'Longitude']
+SEARCH_COLUMNS = ['Job Title', 'Company', 'City', 'Short Description', 'Latitude', 'Longitude']
+
+SEARCH_INDEX_PATH = 'job_data.index.npz'
+
+# Map modes of the location view and the file name of their prerendered map
+MAP_MODES = {'Grouped by location': 'grouped', 'Individual jobs': 'individual'}
+
+# Folder of the unfiltered maps prerendered per dataset version, and of the ready file
+WARM_DIR = os.getenv('JOBS_WARM_DIR', 'warm_cache')
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+# Ports of the dashboard and of the readiness endpoint started by --serve; the YouTube
+# dashboard defaults to 8501/8511, so both can run on one host
+APP_PORT = int(os.getenv('JOBS_APP_PORT', '8502'))
+READY_PORT = int(os.getenv('JOBS_READY_PORT', '8512'))
+
+
+def load_dashboard_frame(artifact_path: str, columns: list) -> pd.DataFrame:
+    """
+    Reads the given artifact columns, keeping only postings with coordinates.
+    """
+    df = pd.read_parquet(artifact_path, columns=list(columns))
+    # Drop rows with invalid coordinates
+    return df.dropna(subset=['Latitude', 'Longitude']).reset_index(drop=True)
+
+
+def render_location_map(df: pd.DataFrame, map_mode: str) -> str:
+    """
+    Builds the location map of the given postings and renders it to HTML.
+    """
+    if map_mode == "Grouped by location":
+        m = build_grouped_map(aggregate_locations(df))
+    else:
+        m = build_cluster_map(df)
+    return render_map_html(m)
+
+
+def warm_map_path(version: str, map_mode: str, warm_dir: str = WARM_DIR) -> str:
+    return os.path.join(warm_dir, f'map_{MAP_MODES[map_mode]}.{version}.html')
+
+
+def read_warm_map(version: str, map_mode: str, warm_dir: str = WARM_DIR) -> Optional[str]:
+    """
+    Returns the unfiltered map prerendered for this dataset version, or None.
+    """
+    try:
+        with open(warm_map_path(version, map_mode, warm_dir), encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def prewarm(artifact_path: str = ARTIFACT_PATH, offline_geocoding: bool = False, warm_dir: str = WARM_DIR) -> dict:
+    """
+    Prepares everything a cold dashboard process would otherwise compute on its first
+    requests: builds the artifact if it is missing, loads or builds the search index
+    and prerenders the unfiltered maps. Maps of older dataset versions are removed
+    and the ready file is written last.
+
+    Parameters:
+    artifact_path (str): Job dataset artifact read by the dashboard
+    offline_geocoding (bool): Geocode offline if the artifact has to be built
+    warm_dir (str): Folder the maps and the ready file are written to
+
+    Returns:
+    dict: Contents of the ready file (dataset version, prerendered files, duration)
+    """
+    start_time = time.perf_counter()
+    if not os.path.exists(artifact_path):
+        build_job_dataset(RAW_PATH, artifact_path, offline_geocoding=offline_geocoding)
+    version = read_manifest(artifact_path)['version']
+
+    load_or_build_index(load_dashboard_frame(artifact_path, SEARCH_COLUMNS), SEARCH_INDEX_PATH, version)
+
+    os.makedirs(warm_dir, exist_ok=True)
+    df = load_dashboard_frame(artifact_path, DASHBOARD_COLUMNS)
+    written = set()
+    for map_mode in MAP_MODES:
+        path = warm_map_path(version, map_mode, warm_dir)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(render_location_map(df, map_mode))
+        os.replace(tmp_path, path)
+        written.add(path)
+
+    # Maps of replaced dataset versions are never requested again
+    for stale in set(glob.glob(os.path.join(warm_dir, 'map_*.html'))) - written:
+        os.remove(stale)
+
+    ready = readiness.write_ready(warm_dir, {
+        'version': version,
+        'jobs': len(df),
+        'files': sorted(os.path.basename(path) for path in written),
+    }, start_time)
+    logger.info(f"Warmed up dataset version {version} ({len(df)} jobs) in {ready['seconds']}s")
+    return ready
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    parser = readiness.launcher_parser('Warm up the job dashboard caches and report readiness', APP_PORT, READY_PORT)
+    parser.add_argument('--offline', action='store_true', help='Never call the geocoder if the artifact has to be built')
+    args, streamlit_args = parser.parse_known_args()
+
+    offline = args.offline or os.getenv('GEOCODE_OFFLINE', '0') == '1'
+    readiness.run_launcher(args, streamlit_args, APP_PATH, lambda: prewarm(offline_geocoding=offline), WARM_DIR)
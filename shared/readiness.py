@@ -0,0 +1,158 @@
+import os
+import sys
+import json
+import time
+import signal
+import logging
+import argparse
+import threading
+import subprocess
+import urllib.request
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Written last by a warm-up, in its cache folder; its presence means the replica is warm
+READY_FILE = 'ready.json'
+
+
+def write_ready(directory: str, details: dict, start_time: float) -> dict:
+    """
+    Writes the ready file (through a temporary file) once a warm-up is done.
+
+    Parameters:
+    directory (str): Cache folder the warm-up wrote to
+    details (dict): What was warmed up (dataset versions, files)
+    start_time (float): time.perf_counter() at the start of the warm-up
+
+    Returns:
+    dict: Contents of the ready file: details, the duration and the time it was written
+    """
+    ready = {
+        **details,
+        'seconds': round(time.perf_counter() - start_time, 3),
+        'warmed_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f'{READY_FILE}.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(ready, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, READY_FILE))
+    return ready
+
+
+def read_ready(directory: str) -> Optional[dict]:
+    """
+    Returns the ready file written by write_ready(), or None before the first warm-up.
+    """
+    try:
+        with open(os.path.join(directory, READY_FILE)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def streamlit_healthy(port: int) -> bool:
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=2) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+class ReadinessHandler(BaseHTTPRequestHandler):
+    """
+    GET /live: 200 while the launcher runs.
+    GET /ready: 200 once the warm-up is done and Streamlit answers its health check, 503 before.
+    """
+
+    def do_GET(self):
+        if self.path == '/live':
+            status, body = 200, {'status': 'alive'}
+        elif self.path == '/ready':
+            warm = self.server.warm
+            ready = warm is not None and streamlit_healthy(self.server.app_port)
+            state = 'ready' if ready else 'starting' if warm is None else 'unavailable'
+            status, body = (200 if ready else 503), {'status': state, 'warm': warm}
+        else:
+            status, body = 404, {'status': 'not found'}
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Probes hit the endpoint every few seconds
+        pass
+
+
+def serve(app_path: str, warm_up: Callable[[], dict], app_port: int, ready_port: int,
+          streamlit_args: list = ()) -> int:
+    """
+    Warm start: serves the readiness endpoint, runs warm_up(), then runs the dashboard
+    with Streamlit.
+
+    /ready succeeds once the disk caches written by warm_up() are in place and
+    Streamlit answers its health check. Streamlit's in-process caches (st.cache_data,
+    st.cache_resource) are still empty then: the first session fills them, reading
+    from the disk caches rather than computing from scratch.
+
+    Parameters:
+    app_path (str): Streamlit script to run
+    warm_up (Callable[[], dict]): Prepares the disk caches; its result is reported by /ready
+    app_port (int): Streamlit port
+    ready_port (int): Port of the readiness endpoint
+    streamlit_args (list): Extra arguments for streamlit run
+
+    Returns:
+    int: Exit code of the Streamlit server
+    """
+    server = ThreadingHTTPServer(('', ready_port), ReadinessHandler)
+    server.warm = None
+    server.app_port = app_port
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(f"Readiness endpoint on port {ready_port} (/ready, /live)")
+
+    try:
+        server.warm = warm_up()
+        process = subprocess.Popen([
+            sys.executable, '-m', 'streamlit', 'run', app_path,
+            '--server.port', str(app_port), '--server.headless', 'true', *streamlit_args
+        ])
+        # Stop the dashboard with the launcher (e.g. when the container is stopped)
+        signal.signal(signal.SIGTERM, lambda signum, frame: process.terminate())
+        return process.wait()
+    finally:
+        server.shutdown()
+
+
+def launcher_parser(description: str, app_port: int, ready_port: int) -> argparse.ArgumentParser:
+    """
+    Command line of a dashboard's warmup.py: --check, --serve, --port and --ready-port.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--check', action='store_true', help='Exit with 0 if the caches have been warmed up, 1 otherwise')
+    parser.add_argument('--serve', action='store_true', help='Warm up, then run the dashboard with a readiness endpoint')
+    parser.add_argument('--port', type=int, default=app_port, help='Streamlit port (with --serve)')
+    parser.add_argument('--ready-port', type=int, default=ready_port, help='Readiness endpoint port (with --serve)')
+    return parser
+
+
+def run_launcher(args: argparse.Namespace, streamlit_args: list, app_path: str,
+                 warm_up: Callable[[], dict], ready_dir: str) -> None:
+    """
+    Runs the command parsed with launcher_parser(): a --check of the ready file in
+    ready_dir, a --serve, or just the warm-up.
+    """
+    if args.check:
+        ready = read_ready(ready_dir)
+        print(json.dumps(ready) if ready else 'not warmed up')
+        sys.exit(0 if ready else 1)
+    elif args.serve:
+        sys.exit(serve(app_path, warm_up, args.port, args.ready_port, streamlit_args))
+    else:
+        warm_up()
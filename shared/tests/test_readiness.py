@@ -0,0 +1,74 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from readiness import ReadinessHandler, launcher_parser, read_ready, write_ready
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    # Stands in for Streamlit's /_stcore/health
+
+    def do_GET(self):
+        self.send_response(200 if self.path == '/_stcore/health' else 404)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start(handler) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def get(server, path: str):
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{server.server_port}{path}', timeout=5) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+@pytest.fixture
+def endpoint():
+    app = start(HealthHandler)
+    server = start(ReadinessHandler)
+    server.warm = None
+    server.app_port = app.server_port
+    yield server, app
+    server.shutdown()
+    app.shutdown()
+
+
+def test_ready_after_warm_up_and_health_check(endpoint):
+    server, app = endpoint
+    assert get(server, '/live') == (200, {'status': 'alive'})
+    assert get(server, '/ready')[0] == 503
+
+    server.warm = {'version': 'v1'}
+    assert get(server, '/ready') == (200, {'status': 'ready', 'warm': {'version': 'v1'}})
+
+    app.shutdown()
+    app.server_close()
+    assert get(server, '/ready')[1]['status'] == 'unavailable'
+
+
+def test_ready_file(tmp_path):
+    assert read_ready(str(tmp_path / 'cache')) is None
+
+    ready = write_ready(str(tmp_path / 'cache'), {'version': 'v1'}, start_time=0.0)
+
+    assert read_ready(str(tmp_path / 'cache')) == ready
+    assert ready['version'] == 'v1' and ready['seconds'] > 0 and 'warmed_at' in ready
+    assert sorted(p.name for p in (tmp_path / 'cache').iterdir()) == ['ready.json']
+
+
+def test_launcher_ports():
+    args, streamlit_args = launcher_parser('test', 8502, 8512).parse_known_args(['--serve', '--theme.base', 'dark'])
+    assert (args.serve, args.port, args.ready_port) == (True, 8502, 8512)
+    assert streamlit_args == ['--theme.base', 'dark']
@@ -1,104 +1,106 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
+import os
+from data import (
+    DATASET_DIR, dataset_version, day_of_week_means, discover_channels, prepare_channel_data, summarize_channel,
+    version_data_path
+)
+from figure_cache import FIGURE_DIR, FigureCache
+from sampling import MAX_TOP_N, SCATTER_POINT_BUDGET, top_k
 
-# Load the data
-df_2 = pd.read_csv('dataset/mrbeast_channel.csv')
+# Maximum number of channels kept in memory at once (shared by all sessions)
+MAX_CACHED_CHANNELS = int(os.getenv('YT_MAX_CACHED_CHANNELS', '8'))
 
-# Convert duration from seconds to minutes
-df_2['duration_minutes'] = df_2['duration'] / 60
+# Load and prepare a channel once per dataset version; frames are shared by all sessions
+# (only the plotted columns are read; the Parquet copy is used when present)
+@st.cache_resource(max_entries=MAX_CACHED_CHANNELS)
+def get_channel_data(path, version):
+    return prepare_channel_data(version_data_path(path, version))
 
-# Set up the Streamlit layout
-st.title('Mr. Beast Channel Analytics Dashboard')
+# The top-MAX_TOP_N ranking behind the "top N videos" slider
+@st.cache_data(max_entries=MAX_CACHED_CHANNELS)
+def get_top_videos(path, version):
+    return top_k(get_channel_data(path, version), 'viewCount', MAX_TOP_N)[['title', 'viewCount']]
 
-# Sidebar for selecting metric
-metric = st.sidebar.selectbox(
-    'Select Metric to Display',
-    ['Views per Video', 'Likes vs. Views', 'Length vs. Views', 'Views by Day of Week', 'Likes by Day of Week']
-)
+# Averages by day of week, read from the aggregates cube the pipeline publishes with the
+# dataset (a few rows per channel); datasets without a cube fall back to grouping the videos
+@st.cache_data(max_entries=4 * MAX_CACHED_CHANNELS)
+def get_day_of_week_means(path, version, column):
+    return day_of_week_means(path, column, lambda: get_channel_data(path, version), version)
 
-# Define a light color palette
-light_palette = ['#FFB3BA', '#BAFFC9', '#BAE1FF', '#FFFFBA', '#FFDFBA']
+# Small per-channel summaries for the comparison view
+@st.cache_data(max_entries=1000)
+def get_channel_summary(path, version):
+    return summarize_channel(get_channel_data(path, version))
 
-# Function to format y-axis labels
-def format_func(value, tick_number):
-    return f'{value/1e6:.1f}M' if value >= 1e6 else f'{value/1e3:.0f}K'
+# Rendered figures shared by all sessions (LRU, bounded), backed by the prerendered ones
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache(max_entries=64, directory=FIGURE_DIR)
 
-# Define plot functions
-def plot_views_per_video(df):
-    top_n = st.slider('Select number of top videos to display', min_value=5, max_value=20, value=10, step=5)
-    
-    fig, ax = plt.subplots(figsize=(12, 6))
-    sns.barplot(x='title', y='viewCount', data=df.sort_values('viewCount', ascending=False).head(top_n), ax=ax, palette=light_palette)
-    ax.set_xticklabels(ax.get_xticklabels(), rotation=90)
-    ax.set_title(f'Top {top_n} Videos by Views')
-    ax.set_xlabel('Video Title')
-    ax.set_ylabel('Views')
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
-    plt.tight_layout()
-    st.pyplot(fig)
+figure_cache = get_figure_cache()
 
-def plot_likes_vs_views(df):
-    fig, ax = plt.subplots(figsize=(10, 6))
-    sns.scatterplot(x='viewCount', y='likeCount', data=df, ax=ax, color=light_palette[0])
-    ax.set_title('Likes vs. Views')
-    ax.set_xlabel('Views')
-    ax.set_ylabel('Likes')
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(format_func))
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
-    st.pyplot(fig)
+channels = discover_channels(DATASET_DIR)
+if not channels:
+    st.error(f"No channel datasets (*_channel.csv or *_channel.parquet) found in '{DATASET_DIR}'")
+    st.stop()
 
-def plot_length_vs_views(df):
-    # Filter for videos less than 100 minutes
-    df_filtered = df[df['duration_minutes'] < 100]
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    sns.scatterplot(x='duration_minutes', y='viewCount', data=df_filtered, ax=ax, color=light_palette[1])
-    ax.set_title('Video Length vs. Views (Videos under 100 minutes)')
-    ax.set_xlabel('Duration (minutes)')
-    ax.set_ylabel('Views')
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
-    ax.set_xlim(0, 100)  # Set x-axis limit to 100 minutes
-    st.pyplot(fig)
+# Sidebar for selecting the channel and metric
+channel = st.sidebar.selectbox('Select Channel', list(channels))
+metric = st.sidebar.selectbox(
+    'Select Metric to Display',
+    ['Views per Video', 'Likes vs. Views', 'Length vs. Views', 'Views by Day of Week', 'Likes by Day of Week',
+     'Channel Comparison']
+)
 
-def plot_views_by_day_of_week(df):
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    df['day_of_week'] = pd.Categorical(df['day_of_week'], categories=day_order, ordered=True)
-    
-    avg_views = df.groupby('day_of_week')['viewCount'].mean().reindex(day_order)
+# Only the selected channel is loaded
+data_version = dataset_version(channels[channel])
+df_2 = get_channel_data(channels[channel], data_version)
+
+# Set up the Streamlit layout
+if metric == 'Channel Comparison':
+    st.title('Channel Comparison Dashboard')
+else:
+    channel_title = df_2['channelTitle'].iloc[0] if len(df_2) else channel
+    st.title(f'{channel_title} Channel Analytics Dashboard')
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-    sns.barplot(x=day_order, y=avg_views, ax=ax, palette=light_palette)
-    ax.set_title('Average Views by Day of Video Publication')
-    ax.set_xlabel('Day of Week')
-    ax.set_ylabel('Average Views')
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
-    st.pyplot(fig)
+# Show a figure, rendering it only once per (plot, parameters, dataset version).
+# Figures prerendered by warmup.py are read from FIGURE_DIR; the plotting stack
+# (plots.py: matplotlib, seaborn) is only imported to render the others
+def show_figure(plot_name, *params, df=None, version=None):
+    df = df_2 if df is None else df
+    version = data_version if version is None else version
+    key = (plot_name, params, version)
+    image = figure_cache.get_or_render(key, lambda: render_plot(plot_name, df, *params))
+    st.image(image)
 
-def plot_likes_by_day_of_week(df):
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    df['day_of_week'] = pd.Categorical(df['day_of_week'], categories=day_order, ordered=True)
-    
-    avg_likes = df.groupby('day_of_week')['likeCount'].mean().reindex(day_order)
+def render_plot(plot_name, df, *params):
+    import plots
+    return getattr(plots, plot_name)(df, *params)
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-    sns.barplot(x=day_order, y=avg_likes, ax=ax, palette=light_palette)
-    ax.set_title('Average Likes by Day of Video Publication')
-    ax.set_xlabel('Day of Week')
-    ax.set_ylabel('Average Likes')
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
-    st.pyplot(fig)
+def show_channel_comparison():
+    selected = st.multiselect('Channels to compare', list(channels), default=list(channels)[:5])
+    if not selected:
+        st.write('Select at least one channel.')
+        return
+    versions = {name: dataset_version(channels[name]) for name in selected}
+    summaries = pd.DataFrame({name: get_channel_summary(channels[name], versions[name]) for name in selected}).T
+    statistic = st.selectbox('Statistic', list(summaries.columns), index=1)
+    show_figure('plot_channel_comparison', statistic, df=summaries, version=tuple(versions.items()))
+    st.dataframe(summaries)
 
 # Render the selected metric
 if metric == 'Views per Video':
-    plot_views_per_video(df_2)
-elif metric == 'Likes vs. Views':
-    plot_likes_vs_views(df_2)
-elif metric == 'Length vs. Views':
-    plot_length_vs_views(df_2)
+    top_n = st.slider('Select number of top videos to display', min_value=5, max_value=MAX_TOP_N, value=10, step=5)
+    show_figure('plot_views_per_video', top_n, df=get_top_videos(channels[channel], data_version))
+elif metric in ('Likes vs. Views', 'Length vs. Views'):
+    display = st.radio('Display', ['Points', 'Density'], horizontal=True,
+                       help=f'Points draws at most {SCATTER_POINT_BUDGET:,} videos, thinning dense areas first')
+    plot_name = 'plot_likes_vs_views' if metric == 'Likes vs. Views' else 'plot_length_vs_views'
+    show_figure(plot_name, display)
 elif metric == 'Views by Day of Week':
-    plot_views_by_day_of_week(df_2)
+    show_figure('plot_views_by_day_of_week', df=get_day_of_week_means(channels[channel], data_version, 'viewCount'))
 elif metric == 'Likes by Day of Week':
-    plot_likes_by_day_of_week(df_2)
\ No newline at end of file
+    show_figure('plot_likes_by_day_of_week', df=get_day_of_week_means(channels[channel], data_version, 'likeCount'))
+elif metric == 'Channel Comparison':
+    show_channel_comparison()
\ No newline at end of file
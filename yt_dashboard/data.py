@@ -0,0 +1,227 @@
+import os
+import re
+import glob
+from typing import Callable, Optional
+
+import pandas as pd
+
+# Columns the dashboard plots; the large free-text fields (description, tags) are never loaded
+DASHBOARD_COLUMNS = [
+    'video_id', 'channelTitle', 'title', 'publishedAt', 'viewCount', 'likeCount',
+    'commentCount', 'duration', 'definition', 'day_of_week'
+]
+
+# Folder with the <channel>_channel.csv/.parquet files produced by the pipeline
+DATASET_DIR = os.getenv('YT_DATASET_DIR', 'dataset')
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Low-cardinality text columns stored as categoricals
+CATEGORY_DTYPES = {
+    'channelTitle': 'category',
+    'definition': 'category',
+    'day_of_week': pd.CategoricalDtype(DAY_ORDER, ordered=True),
+}
+
+
+# Files written by the pipeline's load stage: <channel>_channel.csv / <channel>_channel.parquet
+CHANNEL_SUFFIX = '_channel'
+
+# Aggregates cube published next to them: <channel>_aggregates.parquet, one row per
+# (dimension, bucket) with <measure>_sum/_count/_mean columns
+AGGREGATES_SUFFIX = '_aggregates'
+CUBE_MEASURES = {'viewCount': 'views', 'likeCount': 'likes', 'commentCount': 'comments'}
+
+
+def discover_channels(dataset_dir: str) -> dict:
+    """
+    Finds every channel dataset in dataset_dir.
+
+    Returns:
+    dict: Channel name -> path of its CSV (or Parquet file when there is no CSV), sorted by name
+    """
+    channels = {}
+    for pattern in (f'*{CHANNEL_SUFFIX}.parquet', f'*{CHANNEL_SUFFIX}.csv'):
+        for path in glob.glob(os.path.join(dataset_dir, pattern)):
+            name = os.path.splitext(os.path.basename(path))[0][:-len(CHANNEL_SUFFIX)]
+            # The CSV path is preferred as key; load_channel_data() still reads the Parquet copy
+            channels[name] = path
+    return dict(sorted(channels.items()))
+
+
+def parquet_path_for(path: str) -> str:
+    return os.path.splitext(path)[0] + '.parquet'
+
+
+def resolve_data_path(path: str) -> str:
+    """
+    Returns the file load_channel_data() will actually read for path.
+    """
+    parquet_path = path if path.endswith('.parquet') else parquet_path_for(path)
+    return parquet_path if os.path.exists(parquet_path) else path
+
+
+def dataset_version(path: str) -> str:
+    """
+    Identifies the current content of a channel dataset.
+    Used as a cache key so a new load from the pipeline invalidates cached data.
+
+    Files published by the pipeline are symlinks to immutable, content-hashed
+    version files, whose name is the version id. Plain files fall back to
+    file name, size and mtime.
+    """
+    data_path = resolve_data_path(path)
+    if os.path.islink(data_path):
+        return os.path.basename(os.path.realpath(data_path))
+    stat = os.stat(data_path)
+    return f"{os.path.basename(data_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def version_data_path(path: str, version: str) -> str:
+    """
+    Returns the immutable version file for a version id from dataset_version(), so
+    data cached under that id is read from exactly that version even if the
+    pipeline publishes a new one in between. Other datasets are read from path.
+    """
+    versioned = os.path.join(os.path.dirname(resolve_data_path(path)), 'versions', version)
+    return versioned if os.path.exists(versioned) else path
+
+
+def load_channel_data(path: str, columns: list = DASHBOARD_COLUMNS) -> pd.DataFrame:
+    """
+    Loads a channel dataset, reading only the given columns.
+
+    If a Parquet file with the same name exists next to the CSV it is used instead.
+
+    Parameters:
+    path (str): Path to the channel CSV (or Parquet) file
+    columns (list): Columns to load
+
+    Returns:
+    pd.DataFrame: The projected dataset with categorical day_of_week/definition/channelTitle
+    """
+    data_path = resolve_data_path(path)
+    if data_path.endswith('.parquet'):
+        df = pd.read_parquet(data_path, columns=columns)
+    else:
+        dtypes = {col: dtype for col, dtype in CATEGORY_DTYPES.items() if col in columns}
+        parse_dates = ['publishedAt'] if 'publishedAt' in columns else False
+        df = pd.read_csv(path, usecols=columns, dtype=dtypes, parse_dates=parse_dates)
+
+    for col, dtype in CATEGORY_DTYPES.items():
+        if col in df.columns and df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+
+    # The pipeline stores counts as nullable integers; plotting libraries expect NaN
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.Int64Dtype):
+            df[col] = df[col].astype('float64')
+    return df
+
+
+def aggregates_path_for(path: str) -> str:
+    name = os.path.splitext(os.path.basename(path))[0]
+    if name.endswith(CHANNEL_SUFFIX):
+        name = name[:-len(CHANNEL_SUFFIX)]
+    return os.path.join(os.path.dirname(path), f'{name}{AGGREGATES_SUFFIX}.parquet')
+
+
+def version_aggregates_path(path: str, version: str) -> str:
+    """
+    Returns the cube published with a version id from dataset_version(). The pipeline
+    names each cube version after the content hash of its Parquet dataset, so means
+    cached under a dataset version come from that version's cube even while a load
+    swaps the cube and the dataset one after the other. Other datasets use the current cube.
+    """
+    cube_path = aggregates_path_for(path)
+    match = re.fullmatch(r'.+\.([0-9a-f]{16})\.parquet', version)
+    if match:
+        stem, ext = os.path.splitext(os.path.basename(cube_path))
+        versioned = os.path.join(os.path.dirname(cube_path), 'versions', f'{stem}.{match.group(1)}{ext}')
+        if os.path.exists(versioned):
+            return versioned
+    return cube_path
+
+
+def load_channel_aggregates(path: str, version: Optional[str] = None):
+    """
+    Loads the aggregates cube published with a channel dataset, or with the given
+    version of it (see version_aggregates_path()).
+
+    Returns:
+    pd.DataFrame: The cube, or None for datasets published without one
+    """
+    cube_path = aggregates_path_for(path) if version is None else version_aggregates_path(path, version)
+    if not os.path.exists(cube_path):
+        return None
+    return pd.read_parquet(cube_path)
+
+
+def bucket_means(cube: pd.DataFrame, dimension: str, column: str) -> pd.Series:
+    """
+    Mean of column (viewCount, likeCount or commentCount) per bucket of a cube
+    dimension (day_of_week, publish_month, publish_hour or duration_bucket), in bucket order.
+    """
+    rows = cube[cube['dimension'] == dimension].sort_values('bucket_order')
+    return pd.Series(rows[f'{CUBE_MEASURES[column]}_mean'].to_numpy(), index=rows['bucket'].to_numpy(), name=column)
+
+
+def day_of_week_means(path: str, column: str, load_videos: Callable[[], pd.DataFrame],
+                      version: Optional[str] = None) -> pd.Series:
+    """
+    Mean of column per day of week, in DAY_ORDER.
+
+    Read from the aggregates cube of the given dataset version (the current one
+    when None); datasets published without one fall back to grouping the videos
+    returned by load_videos().
+    """
+    cube = load_channel_aggregates(path, version)
+    if cube is not None:
+        return bucket_means(cube, 'day_of_week', column).reindex(DAY_ORDER)
+    df = load_videos()
+    return df.groupby('day_of_week', observed=False)[column].mean().reindex(DAY_ORDER)
+
+
+def prepare_channel_data(path: str) -> pd.DataFrame:
+    """
+    Loads a channel dataset and adds the derived columns the plots use.
+    The result is shared between sessions and must not be modified by callers.
+    """
+    df = load_channel_data(path)
+
+    # Convert duration from seconds to minutes
+    df['duration_minutes'] = df['duration'] / 60
+    return df
+
+
+def summarize_channel(df: pd.DataFrame) -> pd.Series:
+    """
+    Per-channel summary used by the cross-channel comparison view.
+    """
+    return pd.Series({
+        'Videos': len(df),
+        'Total Views': df['viewCount'].sum(),
+        'Median Views': df['viewCount'].median(),
+        'Average Likes': df['likeCount'].mean(),
+        'Average Comments': df['commentCount'].mean(),
+        'Likes per 1K Views': 1000 * df['likeCount'].sum() / df['viewCount'].sum(),
+        'Median Length (minutes)': df['duration_minutes'].median(),
+    })
+
+
+def convert_to_parquet(csv_path: str) -> str:
+    """
+    Writes a Parquet copy of a channel CSV next to it and returns its path.
+    All columns are kept; projection happens when reading.
+    """
+    df = pd.read_csv(csv_path, dtype=CATEGORY_DTYPES, parse_dates=['publishedAt'])
+    parquet_path = parquet_path_for(csv_path)
+    df.to_parquet(parquet_path, index=False)
+    return parquet_path
+
+
+if __name__ == '__main__':
+    import sys
+
+    for csv_path in sys.argv[1:]:
+        print(f"Saved {convert_to_parquet(csv_path)}")
@@ -0,0 +1,104 @@
+import io
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+# Folder of the images prerendered by warmup.py
+FIGURE_DIR = os.getenv('YT_FIGURE_DIR', 'prerendered')
+
+
+class FigureCache:
+    """
+    LRU cache of rendered figures, stored as image bytes.
+
+    Keys should identify everything the figure depends on, e.g.
+    (plot name, parameters, dataset version). Figures are closed as soon as
+    they are rendered, so pyplot never accumulates open figures.
+
+    With a directory, a miss first looks for an image prerendered there by save(),
+    so those figures are served without importing matplotlib at all.
+    """
+
+    def __init__(self, max_entries: int = 64, image_format: str = 'png', dpi: int = 100,
+                 directory: Optional[str] = None):
+        self.max_entries = max_entries
+        self.image_format = image_format
+        self.dpi = dpi
+        self.directory = directory
+        self._images = OrderedDict()
+        # pyplot keeps global state, so only one figure is rendered at a time
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.prerendered = 0
+
+    def file_path(self, key: Hashable) -> str:
+        # Keys are tuples of strings and numbers, so their repr is stable across processes
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{digest}.{self.image_format}')
+
+    def _read_file(self, key: Hashable) -> Optional[bytes]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self.file_path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _render(self, render: Callable) -> bytes:
+        import matplotlib.pyplot as plt
+
+        fig = render()
+        try:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=self.image_format, dpi=self.dpi, bbox_inches='tight')
+        finally:
+            plt.close(fig)
+        return buffer.getvalue()
+
+    def get_or_render(self, key: Hashable, render: Callable) -> bytes:
+        """
+        Returns the cached image for key, rendering it with render() on a miss.
+        render() returns a matplotlib Figure.
+        """
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return self._images[key]
+
+            self.misses += 1
+            image = self._read_file(key)
+            if image is not None:
+                self.prerendered += 1
+            else:
+                image = self._render(render)
+
+            self._images[key] = image
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+            return image
+
+    def save(self, key: Hashable, render: Callable) -> str:
+        """
+        Renders the figure for key into the directory (through a temporary file) and returns its path.
+        """
+        path = self.file_path(key)
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            image = self._render(render)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(image)
+        os.replace(tmp_path, path)
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+
+    def __len__(self) -> int:
+        return len(self._images)
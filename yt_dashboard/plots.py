@@ -0,0 +1,98 @@
+# Figures of the dashboard views. Importing this module loads matplotlib and seaborn,
+# so app.py only imports it when a figure isn't cached or prerendered (see warmup.py)
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+from data import DAY_ORDER
+from sampling import SCATTER_POINT_BUDGET, downsample_points
+
+# Define a light color palette
+light_palette = ['#FFB3BA', '#BAFFC9', '#BAE1FF', '#FFFFBA', '#FFDFBA']
+
+# Function to format y-axis labels
+def format_func(value, tick_number):
+    return f'{value/1e6:.1f}M' if value >= 1e6 else f'{value/1e3:.0f}K'
+
+# Plot functions (each returns a new figure; FigureCache renders it to an image and closes it)
+def plot_views_per_video(df, top_n):
+    # df is the precomputed top-MAX_TOP_N ranking, already sorted by views
+    fig, ax = plt.subplots(figsize=(12, 6))
+    sns.barplot(x='title', y='viewCount', data=df.head(top_n), ax=ax, palette=light_palette)
+    ax.set_xticklabels(ax.get_xticklabels(), rotation=90)
+    ax.set_title(f'Top {top_n} Videos by Views')
+    ax.set_xlabel('Video Title')
+    ax.set_ylabel('Views')
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
+    fig.tight_layout()
+    return fig
+
+# Scatter or hexbin, depending on the selected display mode and the point budget
+def draw_scatter(ax, df, x, y, display, color):
+    if display == 'Density':
+        data = df.dropna(subset=[x, y])
+        ax.hexbin(data[x], data[y], gridsize=50, bins='log', mincnt=1, cmap='Blues')
+        return ''
+    sample = downsample_points(df, x, y, max_points=SCATTER_POINT_BUDGET)
+    sns.scatterplot(x=x, y=y, data=sample, ax=ax, color=color)
+    n_points = len(df.dropna(subset=[x, y]))
+    return f' ({len(sample):,} of {n_points:,} videos)' if len(sample) < n_points else ''
+
+def plot_likes_vs_views(df, display):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    note = draw_scatter(ax, df, 'viewCount', 'likeCount', display, light_palette[0])
+    ax.set_title(f'Likes vs. Views{note}')
+    ax.set_xlabel('Views')
+    ax.set_ylabel('Likes')
+    ax.xaxis.set_major_formatter(plt.FuncFormatter(format_func))
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
+    return fig
+
+def plot_length_vs_views(df, display):
+    # Filter for videos less than 100 minutes
+    df_filtered = df[df['duration_minutes'] < 100]
+    
+    fig, ax = plt.subplots(figsize=(10, 6))
+    note = draw_scatter(ax, df_filtered, 'duration_minutes', 'viewCount', display, light_palette[1])
+    ax.set_title(f'Video Length vs. Views (Videos under 100 minutes){note}')
+    ax.set_xlabel('Duration (minutes)')
+    ax.set_ylabel('Views')
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
+    ax.set_xlim(0, 100)  # Set x-axis limit to 100 minutes
+    return fig
+
+def plot_views_by_day_of_week(avg_views):
+    # avg_views is the precomputed mean per day, in DAY_ORDER
+    day_order = DAY_ORDER
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    sns.barplot(x=day_order, y=avg_views, ax=ax, palette=light_palette)
+    ax.set_title('Average Views by Day of Video Publication')
+    ax.set_xlabel('Day of Week')
+    ax.set_ylabel('Average Views')
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
+    return fig
+
+def plot_likes_by_day_of_week(avg_likes):
+    # avg_likes is the precomputed mean per day, in DAY_ORDER
+    day_order = DAY_ORDER
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    sns.barplot(x=day_order, y=avg_likes, ax=ax, palette=light_palette)
+    ax.set_title('Average Likes by Day of Video Publication')
+    ax.set_xlabel('Day of Week')
+    ax.set_ylabel('Average Likes')
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
+    return fig
+
+def plot_channel_comparison(summaries, statistic):
+    fig, ax = plt.subplots(figsize=(12, 6))
+    values = summaries[statistic].sort_values(ascending=False)
+    sns.barplot(x=values.index, y=values.values, ax=ax, palette=light_palette)
+    ax.set_xticklabels(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.set_title(f'{statistic} by Channel')
+    ax.set_xlabel('Channel')
+    ax.set_ylabel(statistic)
+    if values.max() >= 1e3:
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(format_func))
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Default number of points drawn by the scatter views
+DEFAULT_POINT_BUDGET = 5000
+
+# Maximum number of points drawn by the scatter views (denser data is thinned or shown as hexbin)
+SCATTER_POINT_BUDGET = int(os.getenv('YT_SCATTER_POINT_BUDGET', str(DEFAULT_POINT_BUDGET)))
+
+# Largest value of the "top N videos" slider; the ranking is precomputed once per dataset version
+MAX_TOP_N = 20
+
+
+def top_k(df: pd.DataFrame, column: str, k: int) -> pd.DataFrame:
+    """
+    Returns the k rows with the largest values in column, largest first.
+
+    Uses np.argpartition, so only the k selected rows are sorted.
+    """
+    values = df[column].to_numpy(dtype=float, na_value=-np.inf)
+    if k >= len(values):
+        order = np.argsort(-values, kind='stable')
+    else:
+        candidates = np.argpartition(-values, k)[:k]
+        order = candidates[np.argsort(-values[candidates], kind='stable')]
+    return df.iloc[order]
+
+
+def _grid_cells(values: np.ndarray, grid_size: int) -> np.ndarray:
+    low, high = np.nanmin(values), np.nanmax(values)
+    if high <= low:
+        return np.zeros(len(values), dtype=np.int64)
+    cells = ((values - low) / (high - low) * grid_size).astype(np.int64)
+    return np.clip(cells, 0, grid_size - 1)
+
+
+def downsample_points(df: pd.DataFrame, x: str, y: str, max_points: int = DEFAULT_POINT_BUDGET,
+                      grid_size: int = 64, seed: int = 0) -> pd.DataFrame:
+    """
+    Density-aware downsampling for scatter plots.
+
+    The plot area is split into a grid_size x grid_size grid and every cell keeps
+    at most the same number of points, chosen so the total fits max_points.
+    Sparse cells (outliers) are kept whole while dense clusters are thinned.
+    The selection is deterministic for a given seed.
+
+    Parameters:
+    df (pd.DataFrame): Data to plot
+    x (str): Column on the x axis
+    y (str): Column on the y axis
+    max_points (int): Point budget
+    grid_size (int): Number of grid cells per axis
+    seed (int): Seed for the random choice inside dense cells
+
+    Returns:
+    pd.DataFrame: At most max_points rows of df, in their original order
+    """
+    df = df.dropna(subset=[x, y])
+    if len(df) <= max_points:
+        return df
+
+    cells = (
+        _grid_cells(df[x].to_numpy(dtype=float), grid_size) * grid_size
+        + _grid_cells(df[y].to_numpy(dtype=float), grid_size)
+    )
+
+    # Random priority inside each cell, then rank rows within their cell
+    priority = np.random.default_rng(seed).permutation(len(df))
+    order = np.lexsort((priority, cells))
+    sorted_cells = cells[order]
+    group_start = np.r_[0, np.flatnonzero(np.diff(sorted_cells)) + 1]
+    group_sizes = np.diff(np.r_[group_start, len(order)])
+    rank = np.arange(len(order)) - np.repeat(group_start, group_sizes)
+
+    # Largest per-cell cap whose total stays within the budget
+    low, high = 1, int(group_sizes.max())
+    while low < high:
+        cap = (low + high + 1) // 2
+        if np.minimum(group_sizes, cap).sum() <= max_points:
+            low = cap
+        else:
+            high = cap - 1
+
+    keep = order[rank < low]
+    if len(keep) > max_points:
+        # More occupied cells than the budget: keep one random point from a subset of cells
+        keep = keep[np.argsort(priority[keep])[:max_points]]
+    return df.iloc[np.sort(keep)]
@@ -0,0 +1,106 @@
+import os
+import sys
+import glob
+import time
+import logging
+
+import pandas as pd
+
+# Launcher and readiness endpoint shared with the job dashboard
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'shared'))
+import readiness
+
+from data import (
+    DATASET_DIR, dataset_version, day_of_week_means, discover_channels, prepare_channel_data, summarize_channel,
+    version_data_path
+)
+from figure_cache import FIGURE_DIR, FigureCache
+from sampling import MAX_TOP_N, top_k
+
+logger = logging.getLogger(__name__)
+
+# Views prerendered for every channel, with the widget defaults of app.py, i.e. the figures
+# a new session sees first: (plot function in plots.py, its parameters)
+DEFAULT_VIEWS = [
+    ('plot_views_per_video', (10,)),
+    ('plot_likes_vs_views', ('Points',)),
+    ('plot_length_vs_views', ('Points',)),
+    ('plot_views_by_day_of_week', ()),
+    ('plot_likes_by_day_of_week', ()),
+]
+
+# Channels and statistic (second column) selected by default in the comparison view
+COMPARISON_CHANNELS = 5
+COMPARISON_STATISTIC = 1
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+# Ports of the dashboard and of the readiness endpoint started by --serve; the job
+# dashboard defaults to 8502/8512, so both can run on one host
+APP_PORT = int(os.getenv('YT_APP_PORT', '8501'))
+READY_PORT = int(os.getenv('YT_READY_PORT', '8511'))
+
+
+def _view_inputs(path: str, version: str, df: pd.DataFrame) -> dict:
+    # The data app.py passes to each plot function
+    return {
+        'plot_views_per_video': top_k(df, 'viewCount', MAX_TOP_N)[['title', 'viewCount']],
+        'plot_likes_vs_views': df,
+        'plot_length_vs_views': df,
+        'plot_views_by_day_of_week': day_of_week_means(path, 'viewCount', lambda: df, version),
+        'plot_likes_by_day_of_week': day_of_week_means(path, 'likeCount', lambda: df, version),
+    }
+
+
+def prerender_figures(dataset_dir: str = DATASET_DIR, figure_dir: str = FIGURE_DIR) -> dict:
+    """
+    Renders the default views of every channel, and the default channel comparison,
+    into figure_dir, where the dashboard's FigureCache finds them. Images of older
+    dataset versions are removed and the ready file is written last.
+
+    Parameters:
+    dataset_dir (str): Folder with the channel datasets
+    figure_dir (str): Folder the images and the ready file are written to
+
+    Returns:
+    dict: Contents of the ready file (dataset versions, number of figures, duration)
+    """
+    import plots
+
+    start_time = time.perf_counter()
+    cache = FigureCache(max_entries=0, directory=figure_dir)
+    channels = discover_channels(dataset_dir)
+    versions, summaries, written = {}, {}, set()
+
+    for name, path in channels.items():
+        version = dataset_version(path)
+        df = prepare_channel_data(version_data_path(path, version))
+        inputs = _view_inputs(path, version, df)
+        for plot_name, params in DEFAULT_VIEWS:
+            render = lambda: getattr(plots, plot_name)(inputs[plot_name], *params)
+            written.add(cache.save((plot_name, params, version), render))
+        versions[name] = version
+        if len(summaries) < COMPARISON_CHANNELS:
+            summaries[name] = summarize_channel(df)
+        logger.info(f"Prerendered {len(DEFAULT_VIEWS)} figures for channel {name}")
+
+    if summaries:
+        frame = pd.DataFrame(summaries).T
+        statistic = list(frame.columns)[COMPARISON_STATISTIC]
+        key = ('plot_channel_comparison', (statistic,), tuple((name, versions[name]) for name in summaries))
+        written.add(cache.save(key, lambda: plots.plot_channel_comparison(frame, statistic)))
+
+    # Images of replaced dataset versions are never requested again
+    for stale in set(glob.glob(os.path.join(figure_dir, f'*.{cache.image_format}'))) - written:
+        os.remove(stale)
+
+    ready = readiness.write_ready(figure_dir, {'versions': versions, 'figures': len(written)}, start_time)
+    logger.info(f"Prerendered {len(written)} figures for {len(versions)} channels in {ready['seconds']}s")
+    return ready
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = readiness.launcher_parser('Prerender the YouTube dashboard figures and report readiness', APP_PORT, READY_PORT)
+    args, streamlit_args = parser.parse_known_args()
+    readiness.run_launcher(args, streamlit_args, APP_PATH, prerender_figures, FIGURE_DIR)
@@ -0,0 +1,130 @@
+import os
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Counts aggregated per bucket, and the prefix of their columns in the cube
+MEASURES = {'viewCount': 'views', 'likeCount': 'likes', 'commentCount': 'comments'}
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Lower bound in seconds and label of every video length bucket
+DURATION_BUCKETS = [
+    (0, '< 1 min'),
+    (60, '1-4 min'),
+    (240, '4-10 min'),
+    (600, '10-20 min'),
+    (1200, '20-60 min'),
+    (3600, '60+ min'),
+]
+
+# Grouping dimensions; publish month is the calendar month (YYYY-MM) and hour is in UTC
+DIMENSIONS = ['day_of_week', 'publish_month', 'publish_hour', 'duration_bucket']
+
+# One row per (dimension, bucket); bucket_order sorts the buckets of a dimension
+AGGREGATES_SCHEMA = pa.schema(
+    [('dimension', pa.string()), ('bucket', pa.string()), ('bucket_order', pa.int64()), ('videos', pa.int64())]
+    + [
+        field
+        for name in MEASURES.values()
+        for field in ((f'{name}_sum', pa.int64()), (f'{name}_count', pa.int64()), (f'{name}_mean', pa.float64()))
+    ]
+)
+
+
+def aggregates_path_for(path: str) -> str:
+    """
+    Path of the aggregates cube written next to a transformed file.
+    """
+    return os.path.splitext(path)[0] + '_aggregates.parquet'
+
+
+def _bucket_keys(df: pd.DataFrame) -> Dict[str, Tuple[pd.Series, pd.Series]]:
+    # (label, order) of every row for each dimension; rows without a value are NA in both
+    published = pd.to_datetime(df['publishedAt'], utc=True)
+    weekday = published.dt.weekday.astype('Int64')
+    month_order = (published.dt.year * 12 + published.dt.month - 1).astype('Int64')
+    hour = published.dt.hour.astype('Int64')
+
+    bounds = np.array([bound for bound, _ in DURATION_BUCKETS], dtype=float)
+    labels = np.array([label for _, label in DURATION_BUCKETS], dtype=object)
+    duration = pd.to_numeric(df['duration'], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    bucket = np.searchsorted(bounds, duration, side='right') - 1
+    has_duration = ~np.isnan(duration) & (bucket >= 0)
+    duration_order = pd.Series(bucket, index=df.index).where(has_duration).astype('Int64')
+
+    return {
+        'day_of_week': (published.dt.day_name(), weekday),
+        'publish_month': (published.dt.strftime('%Y-%m'), month_order),
+        'publish_hour': (published.dt.strftime('%H:00'), hour),
+        'duration_bucket': (pd.Series(labels[np.clip(bucket, 0, None)], index=df.index).where(has_duration),
+                            duration_order),
+    }
+
+
+class AggregatesBuilder:
+    """
+    Accumulates the aggregates cube over the chunks of a transform run.
+
+    Each chunk is reduced to sums and counts per bucket right away, so memory
+    only grows with the number of buckets. Means are computed once at the end
+    from the combined sums and counts, so the cube doesn't depend on the chunk size.
+    """
+
+    def __init__(self):
+        self._parts = []
+
+    def add(self, df: pd.DataFrame) -> None:
+        measures = {
+            name: pd.to_numeric(df[col], errors='coerce').astype('Int64') if col in df.columns
+            else pd.Series(pd.NA, index=df.index, dtype='Int64')
+            for col, name in MEASURES.items()
+        }
+        for dimension, (bucket, order) in _bucket_keys(df).items():
+            frame = pd.DataFrame({'bucket': bucket, 'bucket_order': order, **measures}).dropna(subset=['bucket'])
+            frame['bucket_order'] = frame['bucket_order'].astype('int64')
+            grouped = frame.groupby(['bucket', 'bucket_order'], sort=False)
+            part = grouped.agg(**{
+                stat_name: (name, stat)
+                for name in MEASURES.values()
+                for stat_name, stat in ((f'{name}_sum', 'sum'), (f'{name}_count', 'count'))
+            })
+            part.insert(0, 'videos', grouped.size())
+            self._parts.append(part.reset_index().assign(dimension=dimension))
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        The cube: AGGREGATES_SCHEMA columns, sorted by dimension and bucket_order.
+        """
+        if not self._parts:
+            return AGGREGATES_SCHEMA.empty_table().to_pandas()
+        cube = (
+            pd.concat(self._parts, ignore_index=True)
+            .groupby(['dimension', 'bucket', 'bucket_order'], sort=False)
+            .sum()
+            .reset_index()
+        )
+        for name in MEASURES.values():
+            count = cube[f'{name}_count'].to_numpy(dtype=float)
+            total = cube[f'{name}_sum'].to_numpy(dtype=float)
+            cube[f'{name}_mean'] = np.divide(total, count, out=np.full(len(cube), np.nan), where=count > 0)
+
+        cube['dimension_order'] = cube['dimension'].map({name: i for i, name in enumerate(DIMENSIONS)})
+        cube = cube.sort_values(['dimension_order', 'bucket_order'], kind='stable', ignore_index=True)
+        return cube[AGGREGATES_SCHEMA.names]
+
+    def write(self, path: str) -> int:
+        """
+        Writes the cube to a Parquet file (through a temporary file) and returns its number of rows.
+        """
+        cube = self.to_frame()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        pq.write_table(pa.Table.from_pandas(cube, schema=AGGREGATES_SCHEMA, preserve_index=False), tmp_path)
+        os.replace(tmp_path, path)
+        return len(cube)
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import isodate
+
+# ISO 8601 durations as emitted by the YouTube API: PT#H#M#S, P#DT#H#M#S, P#W, P0D, ...
+# Only whole weeks/days/hours/minutes are matched here; anything else (years, months,
+# fractional units, comma decimals, signs) goes through isodate row by row.
+DURATION_PATTERN = (
+    r'^P(?!$)(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?'
+    r'(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?$'
+)
+
+SECONDS_PER_UNIT = {'weeks': 604800, 'days': 86400, 'hours': 3600, 'minutes': 60}
+
+
+def parse_duration_isodate(value) -> float:
+    """
+    Row-wise conversion with isodate, returning NaN for missing or invalid values.
+    """
+    try:
+        if pd.isna(value) or value == '':
+            return np.nan
+        return isodate.parse_duration(value).total_seconds()
+    except Exception:
+        return np.nan
+
+
+def parse_durations(durations: pd.Series) -> pd.Series:
+    """
+    Converts ISO 8601 duration strings to total seconds.
+
+    Durations repeat a lot (short videos, fixed-length series), so each distinct
+    value is parsed once. One regex extraction handles the formats YouTube emits,
+    with NumPy arithmetic on the captured fields. Values the regex doesn't match
+    fall back to isodate, so the result equals parse_duration_isodate() applied
+    to every row.
+
+    Parameters:
+    durations (pd.Series): Duration strings (missing values allowed)
+
+    Returns:
+    pd.Series: Durations in seconds as float64, NaN for missing or invalid values
+    """
+    codes, uniques = pd.factorize(durations)
+    text = pd.Series(uniques, dtype=object).astype('string')
+    parts = text.str.extract(DURATION_PATTERN)
+    matched = parts.notna().any(axis=1).to_numpy() | (text == 'PT').to_numpy(dtype=bool, na_value=False)
+
+    # Whole units in integer seconds, fractional seconds rounded to microseconds like timedelta
+    whole = np.zeros(len(text), dtype=np.int64)
+    for unit, factor in SECONDS_PER_UNIT.items():
+        whole += parts[unit].fillna('0').to_numpy(dtype=np.int64) * factor
+    micro = np.rint(parts['seconds'].fillna('0').to_numpy(dtype=np.float64) * 1e6).astype(np.int64)
+    seconds = np.where(matched, (whole * 1_000_000 + micro) / 1e6, np.nan)
+
+    # Per-value fallback only for the values the regex didn't match
+    fallback = np.flatnonzero(~matched)
+    if len(fallback):
+        seconds[fallback] = [parse_duration_isodate(uniques[i]) for i in fallback]
+
+    # Missing values have code -1
+    result = np.append(seconds, np.nan)[codes]
+    return pd.Series(result, index=durations.index, dtype='float64')
@@ -0,0 +1,188 @@
+import os
+import logging
+from typing import Iterable, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from publish import file_digest
+
+logger = logging.getLogger(__name__)
+
+# Counts tracked over time
+STAT_COLUMNS = ['viewCount', 'likeCount', 'commentCount']
+
+HISTORY_SCHEMA = pa.schema(
+    [('video_id', pa.string()), ('collected_at', pa.timestamp('us', tz='UTC'))]
+    + [(col, pa.int64()) for col in STAT_COLUMNS]
+)
+
+# <history_dir>/<channel>/snapshots/collected_date=YYYY-MM-DD/part-<content hash>.parquet
+SNAPSHOTS_DIR = 'snapshots'
+PARTITIONING = ds.partitioning(pa.schema([('collected_date', pa.string())]), flavor='hive')
+
+# Last recorded counts per video, used to find the rows that changed
+LATEST_FILE = 'latest.parquet'
+
+
+def _channel_dir(history_dir: str, channel_name: str) -> str:
+    return os.path.join(history_dir, channel_name)
+
+
+def _write_table(table: pa.Table, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def read_latest(history_dir: str, channel_name: str) -> pd.DataFrame:
+    """
+    Returns the last recorded counts of every video of the channel (empty if there's no history yet).
+    """
+    path = os.path.join(_channel_dir(history_dir, channel_name), LATEST_FILE)
+    if not os.path.exists(path):
+        return HISTORY_SCHEMA.empty_table().to_pandas()
+    return pd.read_parquet(path)
+
+
+def snapshot_from_transformed(input_path: str) -> pd.DataFrame:
+    """
+    Reads the history columns of a transformed CSV or Parquet file.
+    data_collected_at becomes collected_at (transformed_at for extracts that predate it);
+    rows without a timestamp are dropped.
+    """
+    wanted = {'video_id', 'data_collected_at', 'transformed_at', *STAT_COLUMNS}
+    if input_path.endswith('.parquet'):
+        df = pd.read_parquet(input_path, columns=[c for c in pq.read_schema(input_path).names if c in wanted])
+    else:
+        df = pd.read_csv(input_path, usecols=lambda c: c in wanted,
+                         dtype={'video_id': str, **{col: 'Int64' for col in STAT_COLUMNS}})
+    collected_at = df['data_collected_at'] if 'data_collected_at' in df.columns else df['transformed_at']
+    df['collected_at'] = pd.to_datetime(collected_at, utc=True, format='ISO8601', errors='coerce')
+    return df.dropna(subset=['video_id', 'collected_at'])[HISTORY_SCHEMA.names]
+
+
+def append_snapshot(snapshot: pd.DataFrame, history_dir: str, channel_name: str) -> int:
+    """
+    Upserts a snapshot of video counts into the channel's history.
+
+    Only rows that are new or whose counts changed since the last recorded
+    snapshot are written, into the partition of their collection date. Writing
+    the same snapshot twice is a no-op, so reruns of a load don't duplicate history.
+
+    Parameters:
+    snapshot (pd.DataFrame): video_id, collected_at and the STAT_COLUMNS counts
+    history_dir (str): Root folder of the history store
+    channel_name (str): Name of the channel
+
+    Returns:
+    int: Number of rows written
+    """
+    snapshot = snapshot.drop_duplicates('video_id', keep='first')
+    latest = read_latest(history_dir, channel_name)
+
+    merged = snapshot.merge(latest, on='video_id', how='left', suffixes=('', '_previous'), indicator=True)
+    changed = (merged['_merge'] == 'left_only').to_numpy()
+    for col in STAT_COLUMNS:
+        current, previous = merged[col].astype('Int64'), merged[f'{col}_previous'].astype('Int64')
+        # Missing on one side only counts as a change; missing on both doesn't
+        changed |= (current != previous).fillna(current.isna() != previous.isna()).to_numpy(dtype=bool)
+    changes = snapshot[changed]
+    if changes.empty:
+        logger.info(f"History of {channel_name}: no changed videos")
+        return 0
+
+    snapshots_dir = os.path.join(_channel_dir(history_dir, channel_name), SNAPSHOTS_DIR)
+    collected_dates = changes['collected_at'].dt.strftime('%Y-%m-%d')
+    for collected_date, rows in changes.groupby(collected_dates, sort=True):
+        # Sorted by video so per-video queries can skip most of each file
+        table = pa.Table.from_pandas(rows.sort_values('video_id'), schema=HISTORY_SCHEMA, preserve_index=False)
+        partition_dir = os.path.join(snapshots_dir, f"collected_date={collected_date}")
+        os.makedirs(partition_dir, exist_ok=True)
+        # Dot-prefixed, so readers skip it while it's being written
+        tmp_path = os.path.join(partition_dir, '.part.tmp')
+        pq.write_table(table, tmp_path)
+        # Content-hashed names make an interrupted rerun overwrite rather than duplicate its file
+        os.replace(tmp_path, os.path.join(partition_dir, f"part-{file_digest(tmp_path)}.parquet"))
+
+    latest = pd.concat([changes, latest[~latest['video_id'].isin(changes['video_id'])]], ignore_index=True)
+    _write_table(
+        pa.Table.from_pandas(latest.sort_values('video_id'), schema=HISTORY_SCHEMA, preserve_index=False),
+        os.path.join(_channel_dir(history_dir, channel_name), LATEST_FILE)
+    )
+    logger.info(f"History of {channel_name}: recorded {len(changes)} of {len(snapshot)} videos")
+    return len(changes)
+
+
+def record_history(input_path: str, history_dir: str, channel_name: str) -> int:
+    """
+    Appends the counts of a transformed file to the channel's history (see append_snapshot()).
+    """
+    return append_snapshot(snapshot_from_transformed(input_path), history_dir, channel_name)
+
+
+def video_history(history_dir: str, channel_name: str, video_ids: Optional[Iterable[str]] = None,
+                  start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
+    """
+    Returns the recorded counts over time, sorted by video and collection time.
+
+    Only the partitions between start and end (inclusive "YYYY-MM-DD" dates) are
+    read, and the video_id filter is pushed down to the Parquet reader.
+
+    Parameters:
+    history_dir (str): Root folder of the history store
+    channel_name (str): Name of the channel
+    video_ids (Optional[Iterable[str]]): Videos to return (all when None)
+    start (Optional[str]): First collection date
+    end (Optional[str]): Last collection date
+
+    Returns:
+    pd.DataFrame: video_id, collected_at and the STAT_COLUMNS counts
+    """
+    snapshots_dir = os.path.join(_channel_dir(history_dir, channel_name), SNAPSHOTS_DIR)
+    if not os.path.isdir(snapshots_dir):
+        return HISTORY_SCHEMA.empty_table().to_pandas()
+
+    dataset = ds.dataset(snapshots_dir, format='parquet', partitioning=PARTITIONING)
+    conditions = []
+    if start is not None:
+        conditions.append(ds.field('collected_date') >= start)
+    if end is not None:
+        conditions.append(ds.field('collected_date') <= end)
+    if video_ids is not None:
+        conditions.append(ds.field('video_id').isin(list(video_ids)))
+    condition = None
+    for c in conditions:
+        condition = c if condition is None else condition & c
+
+    table = dataset.to_table(columns=HISTORY_SCHEMA.names, filter=condition)
+    df = table.to_pandas()
+    return df.sort_values(['video_id', 'collected_at'], ignore_index=True)
+
+
+def view_velocity(history: pd.DataFrame, column: str = 'viewCount') -> pd.DataFrame:
+    """
+    Growth between consecutive snapshots of each video.
+
+    Parameters:
+    history (pd.DataFrame): Output of video_history()
+    column (str): Count to measure
+
+    Returns:
+    pd.DataFrame: video_id, collected_at, the count, its gain since the previous
+    snapshot and the gain per day (NaN for the first snapshot of a video)
+    """
+    history = history.sort_values(['video_id', 'collected_at'], ignore_index=True)
+    grouped = history.groupby('video_id', sort=False)
+    gained = grouped[column].diff()
+    days = grouped['collected_at'].diff().dt.total_seconds() / 86400
+    return pd.DataFrame({
+        'video_id': history['video_id'],
+        'collected_at': history['collected_at'],
+        column: history[column],
+        'gained': gained,
+        'per_day': gained.astype('float64') / days.where(days > 0),
+    })
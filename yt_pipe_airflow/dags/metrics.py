@@ -0,0 +1,139 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Counters a step can accumulate with PipelineMetrics.add()
+COUNTERS = ['rows_in', 'rows_out', 'bytes_read', 'bytes_written', 'api_calls', 'api_seconds']
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Peak resident set size of this process so far, in MB (None where unsupported).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def file_size(path: str) -> int:
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+class PipelineMetrics:
+    """
+    Per-step metrics of one run of a pipeline stage.
+
+    Wrap each step in step(name) to record its wall time and the process peak RSS
+    at its end, and accumulate counters (rows, bytes, API calls and latency) with
+    add(). A step entered several times, e.g. once per chunk, adds up.
+
+    The result is a plain dict (to_dict()), which can be returned to Airflow as
+    an XCom, written to a JSON file (export_json()) and sent to StatsD through
+    Airflow's Stats client when Airflow is available (emit_statsd()).
+    """
+
+    def __init__(self, stage: str, **labels):
+        self.stage = stage
+        self.labels = labels
+        self.started_at = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.steps = {}
+        self._lock = threading.Lock()
+
+    def _record(self, name: str) -> dict:
+        if name not in self.steps:
+            self.steps[name] = {'wall_seconds': 0.0, 'calls': 0, **{counter: 0 for counter in COUNTERS}}
+        return self.steps[name]
+
+    @contextmanager
+    def step(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            with self._lock:
+                record = self._record(name)
+                record['wall_seconds'] += time.perf_counter() - start
+                record['calls'] += 1
+                record['peak_rss_mb'] = peak_rss_mb()
+
+    def add(self, name: str, **counters) -> None:
+        unknown = set(counters) - set(COUNTERS)
+        if unknown:
+            raise ValueError(f"Unknown counters: {sorted(unknown)}")
+        with self._lock:
+            record = self._record(name)
+            for counter, value in counters.items():
+                record[counter] += value
+
+    def to_dict(self) -> dict:
+        steps = {
+            name: {key: round(value, 4) if isinstance(value, float) else value for key, value in record.items()}
+            for name, record in self.steps.items()
+        }
+        return {
+            'stage': self.stage,
+            **self.labels,
+            'started_at': self.started_at.isoformat(),
+            'wall_seconds': round(time.perf_counter() - self._start, 4),
+            'peak_rss_mb': peak_rss_mb(),
+            'steps': steps,
+        }
+
+    def export_json(self, metrics_dir: str, metrics: Optional[dict] = None) -> str:
+        """
+        Writes the metrics (to_dict() unless given) to
+        <metrics_dir>/<stage>[-<labels>]-<start time>.json and returns the path.
+        """
+        os.makedirs(metrics_dir, exist_ok=True)
+        parts = [self.stage] + [str(value) for value in self.labels.values()]
+        parts.append(self.started_at.strftime('%Y%m%dT%H%M%S%fZ'))
+        path = os.path.join(metrics_dir, '-'.join(parts) + '.json')
+        with open(path, 'w') as f:
+            json.dump(metrics or self.to_dict(), f, indent=2)
+        return path
+
+    def emit_statsd(self, prefix: str = 'youtube_etl') -> bool:
+        """
+        Sends step timings and counters through Airflow's StatsD client.
+        Returns False when Airflow isn't installed; Stats is a no-op when StatsD is disabled.
+        """
+        try:
+            from airflow.stats import Stats
+        except ImportError:
+            return False
+        for name, record in self.steps.items():
+            stat = f"{prefix}.{self.stage}.{name}"
+            Stats.timing(f"{stat}.duration", timedelta(seconds=record['wall_seconds']))
+            for counter in COUNTERS:
+                if record[counter]:
+                    Stats.gauge(f"{stat}.{counter}", record[counter])
+        Stats.timing(f"{prefix}.{self.stage}.duration", timedelta(seconds=time.perf_counter() - self._start))
+        return True
+
+    def finish(self, metrics_dir: Optional[str] = None) -> dict:
+        """
+        Exports the run (JSON file when metrics_dir is given, StatsD) and returns to_dict().
+        """
+        metrics = self.to_dict()
+        if metrics_dir is not None:
+            logger.info(f"Saved metrics to {self.export_json(metrics_dir, metrics)}")
+        self.emit_statsd()
+        summary = ', '.join(f"{name} {record['wall_seconds']:.2f}s" for name, record in metrics['steps'].items())
+        logger.info(f"{self.stage} took {metrics['wall_seconds']:.2f}s ({summary}), peak RSS {metrics['peak_rss_mb']} MB")
+        return metrics
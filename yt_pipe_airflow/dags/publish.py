@@ -0,0 +1,144 @@
+import os
+import re
+import shutil
+import hashlib
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Immutable version files live in <output_folder>/versions as <stem>.<content hash><ext>
+VERSIONS_DIR = 'versions'
+
+# Versions kept per file besides the current one, for rollback
+DEFAULT_KEEP_VERSIONS = 3
+
+DIGEST_LENGTH = 16
+
+
+def file_digest(path: str, length: int = DIGEST_LENGTH) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:length]
+
+
+def staging_path(output_folder: str, name: str) -> str:
+    """
+    Where a new version of output_folder/name should be written before publish_file().
+    Keeps the extension, so writers that pick the format from it still work.
+    """
+    versions_dir = os.path.join(output_folder, VERSIONS_DIR)
+    os.makedirs(versions_dir, exist_ok=True)
+    return os.path.join(versions_dir, f"staging-{os.getpid()}-{name}")
+
+
+def _version_pattern(name: str) -> re.Pattern:
+    stem, ext = os.path.splitext(name)
+    return re.compile(rf'^{re.escape(stem)}\.[0-9a-f]{{{DIGEST_LENGTH}}}{re.escape(ext)}$')
+
+
+def _point_to(pointer: str, target: str) -> None:
+    """
+    Atomically makes pointer refer to target: a relative symlink renamed over the
+    pointer, or a full copy renamed over it where symlinks aren't available.
+    Readers see either the old or the new file, never a missing or partial one.
+    """
+    tmp_path = f"{pointer}.tmp"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.symlink(os.path.relpath(target, os.path.dirname(pointer) or '.'), tmp_path)
+    except (OSError, NotImplementedError):
+        shutil.copyfile(target, tmp_path)
+    os.replace(tmp_path, pointer)
+
+
+def list_versions(output_folder: str, name: str) -> List[str]:
+    """
+    Returns the version file names of output_folder/name, newest first.
+    """
+    versions_dir = os.path.join(output_folder, VERSIONS_DIR)
+    if not os.path.isdir(versions_dir):
+        return []
+    pattern = _version_pattern(name)
+    versions = [entry for entry in os.scandir(versions_dir) if pattern.match(entry.name)]
+    versions.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    return [entry.name for entry in versions]
+
+
+def current_version(output_folder: str, name: str) -> Optional[str]:
+    """
+    Returns the version file output_folder/name points to (None if it isn't a version symlink).
+    """
+    pointer = os.path.join(output_folder, name)
+    if not os.path.islink(pointer):
+        return None
+    return os.path.basename(os.path.realpath(pointer))
+
+
+def activate_version(output_folder: str, name: str, version: str) -> None:
+    """
+    Points output_folder/name at an existing version, e.g. to roll back a bad load.
+
+    Raises:
+    FileNotFoundError: If the version doesn't exist
+    """
+    target = os.path.join(output_folder, VERSIONS_DIR, version)
+    if not _version_pattern(name).match(version) or not os.path.exists(target):
+        raise FileNotFoundError(f"Version not found: {target}")
+    _point_to(os.path.join(output_folder, name), target)
+    logger.info(f"{os.path.join(output_folder, name)} now points to {version}")
+
+
+def prune_versions(output_folder: str, name: str, keep: int = DEFAULT_KEEP_VERSIONS) -> List[str]:
+    """
+    Deletes all but the current version and the keep newest other versions.
+
+    Returns:
+    List[str]: The deleted version file names
+    """
+    current = current_version(output_folder, name)
+    others = [version for version in list_versions(output_folder, name) if version != current]
+    removed = others[keep:]
+    for version in removed:
+        os.remove(os.path.join(output_folder, VERSIONS_DIR, version))
+    return removed
+
+
+def publish_file(staged_path: str, output_folder: str, name: str,
+                 keep_versions: int = DEFAULT_KEEP_VERSIONS, digest: Optional[str] = None) -> str:
+    """
+    Publishes a fully written file as the new content of output_folder/name.
+
+    The file is moved to versions/ under a content-hashed name (identical content
+    reuses the existing version), output_folder/name is switched to it atomically
+    and old versions beyond keep_versions are pruned. A file derived from another
+    published file can take that file's digest instead of its own, so readers
+    find the derived version that belongs to each version of the source.
+
+    Parameters:
+    staged_path (str): Finished file, usually written to staging_path()
+    output_folder (str): Folder readers load from
+    name (str): File name readers open, e.g. "<channel>_channel.parquet"
+    keep_versions (int): Previous versions to keep for rollback
+    digest (str): Content hash naming the version (default: the hash of staged_path)
+
+    Returns:
+    str: The published version file name
+    """
+    stem, ext = os.path.splitext(name)
+    version = f"{stem}.{digest or file_digest(staged_path)}{ext}"
+    target = os.path.join(output_folder, VERSIONS_DIR, version)
+    if os.path.exists(target):
+        os.remove(staged_path)
+        # Mark the reused version as the newest one so pruning keeps it
+        os.utime(target)
+    else:
+        os.replace(staged_path, target)
+
+    _point_to(os.path.join(output_folder, name), target)
+    removed = prune_versions(output_folder, name, keep_versions)
+    logger.info(f"Published {name} as {version}" + (f", pruned {len(removed)} old versions" if removed else ""))
+    return version
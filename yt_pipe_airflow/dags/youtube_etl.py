@@ -0,0 +1,733 @@
+import os
+import shutil
+import time
+import logging
+from contextlib import ExitStack
+from datetime import datetime, timezone
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import googleapiclient.discovery
+import googleapiclient.errors
+from googleapiclient.errors import HttpError
+from dotenv import load_dotenv
+from typing import Optional
+from youtube_fetch import VideoFetcher, execute_with_retry
+from durations import parse_durations
+from publish import DEFAULT_KEEP_VERSIONS, file_digest, staging_path, publish_file
+from history import record_history
+from metrics import PipelineMetrics, file_size
+from aggregates import AggregatesBuilder, aggregates_path_for
+
+
+load_dotenv() 
+
+# Fields kept from each part of the videos.list response
+STATS_TO_KEEP = {
+    'snippet': ['channelTitle', 'title', 'description', 'tags', 'publishedAt'],
+    'statistics': ['viewCount', 'likeCount', 'favouriteCount', 'commentCount'],
+    'contentDetails': ['duration', 'definition', 'caption']
+}
+
+# Explicit schemas of the Parquet intermediates. The raw extract keeps the API's text
+# values (counts are strings in the API response); the transformed data is typed, with
+# low-cardinality text columns dictionary-encoded (read back as categoricals).
+# Columns not listed here keep the type pyarrow infers.
+RAW_SCHEMA = pa.schema([
+    (col, pa.string())
+    for col in ['video_id'] + [field for fields in STATS_TO_KEEP.values() for field in fields] + ['data_collected_at']
+])
+
+TRANSFORMED_SCHEMA = pa.schema([
+    ('video_id', pa.string()),
+    ('channelTitle', pa.dictionary(pa.int32(), pa.string())),
+    ('title', pa.string()),
+    ('description', pa.string()),
+    ('tags', pa.string()),
+    ('publishedAt', pa.timestamp('ns', tz='UTC')),
+    ('viewCount', pa.int64()),
+    ('likeCount', pa.int64()),
+    ('commentCount', pa.int64()),
+    ('duration', pa.float64()),
+    ('definition', pa.dictionary(pa.int32(), pa.string())),
+    ('caption', pa.string()),
+    ('data_collected_at', pa.string()),
+    ('day_of_week', pa.dictionary(pa.int32(), pa.string())),
+    ('transformed_at', pa.string()),
+])
+
+# Column types of the transformed CSV, following TRANSFORMED_SCHEMA (dates are parsed separately)
+TRANSFORMED_DTYPES = {
+    field.name: 'Int64' if pa.types.is_integer(field.type) else 'float64' if pa.types.is_floating(field.type) else str
+    for field in TRANSFORMED_SCHEMA
+}
+
+def _is_parquet(path: str) -> bool:
+    return path.endswith('.parquet')
+
+def _schema_for(df: pd.DataFrame, schema: pa.Schema) -> pa.Schema:
+    """
+    The fields of schema for the columns of df, in df's order; other columns keep the inferred type.
+    """
+    inferred = pa.Schema.from_pandas(df, preserve_index=False)
+    return pa.schema([
+        schema.field(col) if col in schema.names else inferred.field(col)
+        for col in df.columns
+    ])
+
+def _read_chunks(path: str, chunk_size: Optional[int] = None, dtype=str):
+    """
+    Yields the rows of a CSV or Parquet file (chosen by extension) as DataFrames of
+    at most chunk_size rows, or the whole file at once when chunk_size is None.
+    CSV files are read with dtype; Parquet files keep their stored types.
+    """
+    if _is_parquet(path):
+        parquet_file = pq.ParquetFile(path)
+        if chunk_size is None or parquet_file.metadata.num_rows == 0:
+            yield parquet_file.read().to_pandas()
+        else:
+            for batch in parquet_file.iter_batches(batch_size=chunk_size):
+                yield pa.Table.from_batches([batch]).to_pandas()
+    elif chunk_size is None:
+        yield pd.read_csv(path, dtype=dtype)
+    else:
+        yield from pd.read_csv(path, dtype=dtype, chunksize=chunk_size)
+
+def _timed_chunks(path: str, metrics: PipelineMetrics, chunk_size: Optional[int] = None, dtype=str):
+    """
+    _read_chunks() with the reads recorded as the "read" step of metrics.
+    """
+    metrics.add('read', bytes_read=file_size(path))
+    chunks = _read_chunks(path, chunk_size, dtype)
+    while True:
+        with metrics.step('read'):
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        metrics.add('read', rows_in=len(chunk))
+        yield chunk
+
+class _FrameWriter:
+    """
+    Appends DataFrames to a CSV or Parquet file (chosen by extension).
+
+    Rows go to a temporary file that replaces path on a clean exit, so readers never
+    see a partial file. Parquet files use the fields of schema for known columns and
+    get one row group per write. With metrics, writes are recorded as the given step.
+    """
+
+    def __init__(self, path: str, schema: Optional[pa.Schema] = None,
+                 metrics: Optional[PipelineMetrics] = None, step: str = 'write'):
+        self.path = path
+        self.schema = schema
+        self.metrics = metrics
+        self.step = step
+        self.tmp_path = f"{path}.tmp"
+        self.rows = 0
+        self._writer = None
+        self._started = False
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.metrics is None:
+            self._write(df)
+        else:
+            with self.metrics.step(self.step):
+                self._write(df)
+            self.metrics.add(self.step, rows_out=len(df))
+
+    def _write(self, df: pd.DataFrame) -> None:
+        if _is_parquet(self.path):
+            if self._writer is None:
+                schema = _schema_for(df, self.schema) if self.schema is not None else None
+                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                self._writer = pq.ParquetWriter(self.tmp_path, table.schema)
+            else:
+                table = pa.Table.from_pandas(df, schema=self._writer.schema, preserve_index=False)
+            self._writer.write_table(table)
+        else:
+            df.to_csv(self.tmp_path, mode='a' if self._started else 'w', header=not self._started, index=False)
+        self._started = True
+        self.rows += len(df)
+
+    def __enter__(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._writer is not None:
+            self._writer.close()
+        if exc_type is None and self._started:
+            os.replace(self.tmp_path, self.path)
+            if self.metrics is not None:
+                self.metrics.add(self.step, bytes_written=file_size(self.path))
+        elif os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+        return False
+
+def _list_upload_ids(youtube, playlist_id: str, known_ids: Optional[set] = None,
+                     metrics: Optional[PipelineMetrics] = None) -> list:
+    """
+    Pages through the uploads playlist and returns the video IDs, newest first.
+    When known_ids is given, paging stops at the first page that reaches a known video.
+    API calls are recorded as the "list_uploads" step of metrics.
+    """
+    metrics = metrics or PipelineMetrics('extract')
+    logger = logging.getLogger(__name__)
+    video_ids = []
+    next_page_token = None
+    
+    while True:
+        try:
+            request = youtube.playlistItems().list(
+                part='contentDetails',
+                playlistId=playlist_id,
+                maxResults=50,
+                pageToken=next_page_token
+            )
+            
+            def execute():
+                start = time.perf_counter()
+                try:
+                    return request.execute()
+                finally:
+                    metrics.add('list_uploads', api_calls=1, api_seconds=time.perf_counter() - start)
+            
+            with metrics.step('list_uploads'):
+                response = execute_with_retry(execute)
+        except HttpError as e:
+            logger.error(f"Error fetching playlist items: {str(e)}")
+            raise
+        
+        page_ids = [item['contentDetails']['videoId'] for item in response.get('items', [])]
+        if known_ids:
+            new_ids = [video_id for video_id in page_ids if video_id not in known_ids]
+            video_ids.extend(new_ids)
+            if len(new_ids) < len(page_ids):
+                # The uploads playlist is newest first, everything after this point is known
+                break
+        else:
+            video_ids.extend(page_ids)
+        
+        next_page_token = response.get('nextPageToken')
+        if not next_page_token:
+            break
+    
+    metrics.add('list_uploads', rows_out=len(video_ids))
+    return video_ids
+
+def _fetch_video_details(fetcher: VideoFetcher, video_ids: list, parts: list,
+                         metrics: Optional[PipelineMetrics] = None, step: str = 'fetch_details') -> list:
+    """
+    Fetches the requested parts for the given videos through the concurrent fetcher.
+    Returns one dict per video with the STATS_TO_KEEP fields of those parts.
+    The fetch is recorded as step of metrics, with the fetcher's API calls and latency.
+    """
+    metrics = metrics or PipelineMetrics('extract')
+    calls, seconds = fetcher.api_calls, fetcher.api_seconds
+    with metrics.step(step):
+        videos = fetcher.fetch(video_ids, parts)
+    metrics.add(step, rows_in=len(video_ids), rows_out=len(videos),
+                api_calls=fetcher.api_calls - calls, api_seconds=fetcher.api_seconds - seconds)
+    
+    all_video_info = []
+    for video in videos:
+        video_info = {'video_id': video['id']}
+        
+        for k in parts:
+            for field in STATS_TO_KEEP[k]:
+                try:
+                    video_info[field] = video[k][field]
+                except KeyError:
+                    video_info[field] = None
+        
+        # Add timestamp for when the data was collected
+        video_info['data_collected_at'] = datetime.now(timezone.utc).isoformat()
+        all_video_info.append(video_info)
+    
+    return all_video_info
+
+def collect_youtube_channel_data(channel_id: str, output_path: str, incremental: bool = False,
+                                 previous_path: Optional[str] = None,
+                                 stats_refresh_days: float = 6, max_workers: int = 4,
+                                 requests_per_second: float = 10, use_batch_http: bool = False,
+                                 metrics_dir: Optional[str] = None) -> dict:
+    """
+    Collects all video data from a YouTube channel and saves to specified path.
+    
+    In incremental mode the previous extract is used as the set of known videos:
+    playlist paging stops once it reaches a known video, full details are fetched
+    only for new videos, and known videos only get their statistics refreshed once
+    they are older than stats_refresh_days. Videos removed from the channel are kept
+    until the next full (non-incremental) run.
+    
+    Statistics are stamped when the fetch finishes, so at the next run of a schedule
+    they are slightly younger than the schedule interval: keep stats_refresh_days
+    below the interval (6 days on the weekly DAG) or they are only refreshed every
+    other run.
+    
+    A channel without videos still gets an (empty) output file, so the downstream
+    stages and the next incremental run always find one.
+    
+    Parameters:
+    channel_id (str): The YouTube channel ID to collect data from
+    output_path (str): Full path where the output should be saved (.parquet for a Parquet file, otherwise CSV)
+    incremental (bool): Reuse the previous extract instead of refetching the whole channel
+    previous_path (str): Previous extract to start from (defaults to output_path)
+    stats_refresh_days (float): Minimum age of statistics before they are refreshed (below the schedule interval)
+    max_workers (int): Concurrent videos.list requests
+    requests_per_second (float): Rate limit shared by all workers
+    use_batch_http (bool): Group videos.list calls into HTTP batch requests
+    metrics_dir (Optional[str]): Folder for the JSON metrics file of this run
+    
+    Returns:
+    dict: Per-step metrics of the run (see metrics.PipelineMetrics)
+    
+    Raises:
+    ValueError: If API key is missing or invalid
+    HttpError: If YouTube API request fails
+    Exception: For other unexpected errors
+    """
+    try:
+        # Setup logging
+        logger = logging.getLogger(__name__)
+        metrics = PipelineMetrics('extract', channel=channel_id)
+        
+        # Get API key from environment variable
+        api_key = os.getenv('yt_api_key')
+        if not api_key:
+            raise ValueError("YouTube API key not found in environment variables")
+        
+        # Setup YouTube API (one client per worker thread, the client is not thread-safe)
+        def build_client():
+            return googleapiclient.discovery.build(
+                "youtube", "v3", developerKey=api_key,
+                cache_discovery=False  # Recommended for production
+            )
+        
+        youtube = build_client()
+        fetcher = VideoFetcher(build_client, max_workers=max_workers,
+                               requests_per_second=requests_per_second,
+                               use_batch_http=use_batch_http)
+        
+        # Get playlist ID (for uploads playlist)
+        playlist_id = f'UU{channel_id[2:]}' if channel_id.startswith('UC') else channel_id
+        
+        # Load the previous extract (high-water mark) in incremental mode
+        previous_path = previous_path or output_path
+        previous = None
+        if incremental and os.path.exists(previous_path):
+            with metrics.step('read_previous'):
+                if _is_parquet(previous_path):
+                    previous = pd.read_parquet(previous_path)
+                else:
+                    previous = pd.read_csv(previous_path, dtype=str, keep_default_na=False, na_values=[''])
+            metrics.add('read_previous', rows_in=len(previous), bytes_read=file_size(previous_path))
+            logger.info(f"Incremental run: {len(previous)} known videos in {previous_path}")
+        elif incremental:
+            logger.info(f"No previous extract at {previous_path}, running a full extraction")
+        
+        known_ids = set(previous['video_id']) if previous is not None else None
+        
+        # Get the video IDs (only new ones in incremental mode)
+        video_ids = _list_upload_ids(youtube, playlist_id, known_ids, metrics)
+        
+        if not video_ids and previous is None:
+            logger.warning(f"No videos found for channel {channel_id}")
+            with _FrameWriter(output_path, RAW_SCHEMA, metrics) as writer:
+                writer.write(pd.DataFrame(columns=RAW_SCHEMA.names))
+            return metrics.finish(metrics_dir)
+        
+        # Get full video details for new videos
+        all_video_info = _fetch_video_details(
+            fetcher, video_ids, ['snippet', 'statistics', 'contentDetails'], metrics
+        )
+        logger.info(f"Fetched details for {len(all_video_info)} new videos")
+        df = pd.DataFrame(all_video_info)
+        
+        if previous is not None:
+            # Refresh only the statistics of known videos whose data is stale
+            collected_at = pd.to_datetime(previous['data_collected_at'], utc=True, format='ISO8601', errors='coerce')
+            cutoff = pd.Timestamp.now(tz='UTC') - pd.Timedelta(days=stats_refresh_days)
+            stale = collected_at.isna() | (collected_at < cutoff)
+            stale_ids = previous.loc[stale, 'video_id'].tolist()
+            
+            refreshed = pd.DataFrame(_fetch_video_details(fetcher, stale_ids, ['statistics'], metrics, 'refresh_stats'))
+            logger.info(f"Refreshed statistics for {len(refreshed)} of {len(previous)} known videos")
+            if not refreshed.empty:
+                refreshed = refreshed.set_index('video_id')
+                previous = previous.set_index('video_id')
+                previous.update(refreshed.astype(str).where(refreshed.notna()))
+                previous = previous.reset_index()
+            
+            # New videos first (newest first), then the known ones
+            if not df.empty:
+                previous = previous[~previous['video_id'].isin(df['video_id'])]
+            df = pd.concat([df, previous], ignore_index=True)
+        
+        if df.empty and video_ids:
+            raise ValueError(f"No video data could be collected for channel {channel_id}")
+        
+        # Tags come back as lists; store them as the text the CSV output always had
+        if 'tags' in df.columns:
+            df['tags'] = df['tags'].map(lambda tags: tags if tags is None or isinstance(tags, str) else str(tags))
+        
+        # Save as CSV or as Parquet with the raw schema
+        with _FrameWriter(output_path, RAW_SCHEMA, metrics) as writer:
+            writer.write(df)
+        logger.info(f"Successfully saved {len(df)} video records to {output_path}")
+        
+        return metrics.finish(metrics_dir)
+        
+    except Exception as e:
+        logger.error(f"Error in collect_youtube_channel_data: {str(e)}")
+        raise
+
+def _transform_frame(df: pd.DataFrame, transformed_at: str, log=None,
+                     metrics: Optional[PipelineMetrics] = None) -> pd.DataFrame:
+    """
+    Applies the transform steps to a frame read with dtype=str, in place.
+    Every step only looks at its own rows, so chunks and whole files give the same result.
+    Each step is recorded in metrics under its own name.
+    """
+    log = log or logging.getLogger(__name__).info
+    metrics = metrics or PipelineMetrics('transform')
+    
+    # Step 1: Convert columns to numeric types (nullable integers, so missing counts
+    # don't turn a whole column or chunk into floats)
+    with metrics.step('to_numeric'):
+        numeric_columns = ['viewCount', 'likeCount', 'commentCount']
+        for col in numeric_columns:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce').round().astype('Int64')
+                log(f"Converted {col} to numeric type")
+    
+    # Step 2: Drop the 'favouriteCount' column if it exists
+    if 'favouriteCount' in df.columns:
+        df.drop(columns=['favouriteCount'], inplace=True)
+        log("Dropped favouriteCount column")
+    
+    # Step 3: Convert 'publishedAt' to datetime format
+    with metrics.step('published_at'):
+        try:
+            df['publishedAt'] = pd.to_datetime(df['publishedAt'])
+            log("Converted publishedAt to datetime format")
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Error converting publishedAt to datetime: {str(e)}")
+    
+    # Step 4: Extract the day of the week from 'publishedAt'
+    with metrics.step('day_of_week'):
+        try:
+            df['day_of_week'] = df['publishedAt'].dt.day_name()
+            log("Added day_of_week column")
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Error creating day_of_week column: {str(e)}")
+    
+    # Step 5: Convert 'duration' to total seconds (vectorized, isodate only for unusual values)
+    with metrics.step('duration'):
+        df['duration'] = parse_durations(df['duration'])
+        log("Converted duration to seconds")
+    
+    # Step 6: Fill NaN values for specific columns
+    with metrics.step('fill_text'):
+        text_columns = ['tags', 'description']
+        for col in text_columns:
+            if col in df.columns:
+                df[col] = df[col].fillna('')
+                log(f"Filled NaN values in {col}")
+    
+    # Add transformation timestamp (shared by all chunks of a run)
+    df['transformed_at'] = transformed_at
+    return df
+
+def transform_youtube_data(input_path: str, output_path: str, chunk_size: Optional[int] = None,
+                           metrics_dir: Optional[str] = None) -> dict:
+    """
+    Transforms YouTube data from the raw extract and saves the result to a new location.
+    
+    Input and output can be CSV or Parquet, chosen by file extension. Parquet output
+    uses TRANSFORMED_SCHEMA, so the next stage reads typed columns instead of parsing text.
+    
+    With chunk_size, the raw file is streamed in chunks of that many rows and each
+    transformed chunk is appended to the output, so memory stays bounded by the
+    chunk size. The output is row-for-row identical to the in-memory path (apart from
+    transformed_at); Parquet files differ in bytes, since every chunk is its own row group.
+    
+    Also writes the aggregates cube (views, likes and comments per day of week,
+    publish month, hour and duration bucket, see aggregates.py) next to the output,
+    as <output name>_aggregates.parquet. The load stage publishes it with the dataset.
+    
+    Parameters:
+    input_path (str): Path to the raw CSV or Parquet file
+    output_path (str): Path where the transformed data should be saved
+    chunk_size (Optional[int]): Rows per chunk; None transforms the whole file at once
+    metrics_dir (Optional[str]): Folder for the JSON metrics file of this run
+    
+    Returns:
+    dict: Per-step metrics of the run (see metrics.PipelineMetrics)
+    
+    Raises:
+    FileNotFoundError: If input file doesn't exist
+    Exception: For other unexpected errors
+    """
+    try:
+        # Setup logging
+        logger = logging.getLogger(__name__)
+        metrics = PipelineMetrics('transform')
+        
+        # Check if input file exists
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        
+        logger.info(f"Reading data from {input_path}" + (f" in chunks of {chunk_size} rows" if chunk_size else ""))
+        transformed_at = datetime.now(timezone.utc).isoformat()
+        
+        # CSV is read as text, so type inference can't differ between chunks
+        cube = AggregatesBuilder()
+        with _FrameWriter(output_path, TRANSFORMED_SCHEMA, metrics) as writer:
+            for i, chunk in enumerate(_timed_chunks(input_path, metrics, chunk_size)):
+                log = logger.info if i == 0 else logger.debug
+                chunk = _transform_frame(chunk, transformed_at, log, metrics)
+                writer.write(chunk)
+                with metrics.step('aggregates'):
+                    cube.add(chunk)
+        
+        logger.info(f"Successfully saved {writer.rows} transformed rows to {output_path}")
+        
+        aggregates_path = aggregates_path_for(output_path)
+        with metrics.step('write_aggregates'):
+            buckets = cube.write(aggregates_path)
+        metrics.add('write_aggregates', rows_out=buckets, bytes_written=file_size(aggregates_path))
+        logger.info(f"Saved {buckets} aggregate buckets to {aggregates_path}")
+        
+        return metrics.finish(metrics_dir)
+        
+    except Exception as e:
+        logger.error(f"Error in transform_youtube_data: {str(e)}")
+        raise
+
+def _typed_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parses the dates of a transformed frame read from CSV; TRANSFORMED_SCHEMA does the rest.
+    """
+    df['publishedAt'] = pd.to_datetime(df['publishedAt'])
+    return df
+
+def _dataset_names(channel_name: str) -> tuple:
+    return f"{channel_name}_channel.csv", f"{channel_name}_channel.parquet"
+
+def _aggregates_name(channel_name: str) -> str:
+    return f"{channel_name}_aggregates.parquet"
+
+def _publish_dataset(output_folder: str, channel_name: str, staged: dict, keep_versions: int) -> None:
+    """
+    Publishes the staged dataset files (name -> staged path) as new versions.
+    The aggregates cube goes first and then the Parquet file, since dashboards
+    prefer it over the CSV copy. The cube's version is named after the Parquet
+    file's content hash, so dashboards read the cube of the dataset version they
+    loaded, even between the two swaps or after a rollback.
+    """
+    csv_name, parquet_name = _dataset_names(channel_name)
+    aggregates_name = _aggregates_name(channel_name)
+    digests = {aggregates_name: file_digest(staged[parquet_name])} if parquet_name in staged else {}
+    for name in (aggregates_name, parquet_name, csv_name):
+        if name in staged:
+            publish_file(staged[name], output_folder, name, keep_versions, digest=digests.get(name))
+    
+    # A stale CSV copy or cube would no longer match the Parquet file
+    for name in (csv_name, aggregates_name):
+        path = os.path.join(output_folder, name)
+        if name not in staged and os.path.lexists(path):
+            os.remove(path)
+
+def _discard_staged(staged: dict) -> None:
+    # Staged files of a failed load are never published
+    for path in staged.values():
+        if os.path.exists(path):
+            os.remove(path)
+
+def load_youtube_data(input_path: str, output_folder: str, channel_name: str,
+                      chunk_size: Optional[int] = None, write_csv: bool = True,
+                      keep_versions: int = DEFAULT_KEEP_VERSIONS, history_dir: Optional[str] = None,
+                      metrics_dir: Optional[str] = None) -> dict:
+    """
+    Loads transformed YouTube data into the final dataset folder.
+    Existing files of this channel are replaced; other channels' files are left alone.
+    
+    The dataset holds a typed Parquet file and, with write_csv, a CSV copy. The input
+    file in the matching format is copied as is; only the other format is converted,
+    one chunk at a time when chunk_size is given.
+    
+    Files are published as immutable, content-hashed versions under
+    <output_folder>/versions, and <channel>_channel.parquet/.csv are switched to the
+    new version atomically (see publish.py). Readers never see a missing or partial
+    file, and keep_versions previous versions stay available for rollback.
+    
+    With history_dir, the counts that changed since the previous load are also
+    appended to the channel's snapshot history (see history.py).
+    
+    The aggregates cube written by the transform next to input_path is published
+    as <channel>_aggregates.parquet.
+    
+    Parameters:
+    input_path (str): Path to the transformed CSV or Parquet file
+    output_folder (str): Path to the destination folder
+    channel_name (str): Name of the channel (used in filename)
+    chunk_size (Optional[int]): Rows per chunk for the conversion; None converts the whole file at once
+    write_csv (bool): Also write <channel>_channel.csv
+    keep_versions (int): Previous versions to keep per file
+    history_dir (Optional[str]): Root folder of the snapshot history; None skips it
+    metrics_dir (Optional[str]): Folder for the JSON metrics file of this run
+    
+    Returns:
+    dict: Per-step metrics of the run (see metrics.PipelineMetrics)
+    
+    Raises:
+    FileNotFoundError: If input file doesn't exist
+    Exception: For other unexpected errors
+    """
+    try:
+        # Setup logging
+        logger = logging.getLogger(__name__)
+        staged = {}
+        metrics = PipelineMetrics('load', channel=channel_name)
+        
+        # Check if input file exists
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        
+        # The folder is shared by all channels, so only this channel's files are replaced
+        logger.info(f"Creating output folder: {output_folder}")
+        os.makedirs(output_folder, exist_ok=True)
+        csv_name, parquet_name = _dataset_names(channel_name)
+        staged = {parquet_name: staging_path(output_folder, parquet_name)}
+        if write_csv:
+            staged[csv_name] = staging_path(output_folder, csv_name)
+        
+        # The file in the input's format is copied as is, the other one is converted
+        copied = parquet_name if _is_parquet(input_path) else csv_name
+        if copied in staged:
+            with metrics.step('copy'):
+                shutil.copyfile(input_path, staged[copied])
+            metrics.add('copy', bytes_read=file_size(input_path), bytes_written=file_size(staged[copied]))
+        
+        aggregates_path = aggregates_path_for(input_path)
+        if os.path.exists(aggregates_path):
+            aggregates_name = _aggregates_name(channel_name)
+            staged[aggregates_name] = staging_path(output_folder, aggregates_name)
+            shutil.copyfile(aggregates_path, staged[aggregates_name])
+        else:
+            logger.warning(f"No aggregates found next to {input_path}; the dashboard will aggregate the dataset itself")
+        
+        if _is_parquet(input_path):
+            # Already typed: convert only for the CSV copy
+            if write_csv:
+                with _FrameWriter(staged[csv_name], metrics=metrics) as writer:
+                    for chunk in _timed_chunks(input_path, metrics, chunk_size):
+                        writer.write(chunk)
+        else:
+            # Save a typed Parquet copy so dashboards can load only the columns they need
+            with _FrameWriter(staged[parquet_name], TRANSFORMED_SCHEMA, metrics) as writer:
+                for chunk in _timed_chunks(input_path, metrics, chunk_size, dtype=TRANSFORMED_DTYPES):
+                    writer.write(_typed_chunk(chunk))
+        
+        rows = pq.ParquetFile(staged[parquet_name]).metadata.num_rows
+        with metrics.step('publish'):
+            _publish_dataset(output_folder, channel_name, staged, keep_versions)
+        logger.info(f"Successfully saved data to {output_folder}: {', '.join(staged)}")
+        
+        # Log some basic statistics
+        logger.info(f"Loaded {rows} records")
+        
+        if history_dir is not None:
+            with metrics.step('history'):
+                recorded = record_history(input_path, history_dir, channel_name)
+            metrics.add('history', rows_in=rows, rows_out=recorded)
+        
+        return metrics.finish(metrics_dir)
+        
+    except Exception as e:
+        logger.error(f"Error in load_youtube_data: {str(e)}")
+        _discard_staged(staged)
+        raise
+
+def transform_and_load_youtube_data(input_path: str, output_folder: str, channel_name: str,
+                                    chunk_size: Optional[int] = None, write_csv: bool = True,
+                                    keep_versions: int = DEFAULT_KEEP_VERSIONS,
+                                    history_dir: Optional[str] = None,
+                                    metrics_dir: Optional[str] = None) -> dict:
+    """
+    Runs the transform and load stages in one pass, writing the dataset files directly.
+    Skips the transformed intermediate file and the load stage's second read of it.
+    The files and the aggregates cube are published, and the history recorded, like
+    load_youtube_data() does.
+    
+    Parameters:
+    input_path (str): Path to the raw CSV or Parquet file
+    output_folder (str): Path to the destination folder
+    channel_name (str): Name of the channel (used in filename)
+    chunk_size (Optional[int]): Rows per chunk; None transforms the whole file at once
+    write_csv (bool): Also write <channel>_channel.csv
+    keep_versions (int): Previous versions to keep per file
+    history_dir (Optional[str]): Root folder of the snapshot history; None skips it
+    metrics_dir (Optional[str]): Folder for the JSON metrics file of this run
+    
+    Returns:
+    dict: Per-step metrics of the run (see metrics.PipelineMetrics)
+    
+    Raises:
+    FileNotFoundError: If input file doesn't exist
+    Exception: For other unexpected errors
+    """
+    try:
+        # Setup logging
+        logger = logging.getLogger(__name__)
+        staged = {}
+        
+        # Check if input file exists
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        
+        metrics = PipelineMetrics('transform_and_load', channel=channel_name)
+        logger.info(f"Transforming {input_path} into {output_folder}")
+        csv_name, parquet_name = _dataset_names(channel_name)
+        staged = {parquet_name: staging_path(output_folder, parquet_name)}
+        if write_csv:
+            staged[csv_name] = staging_path(output_folder, csv_name)
+        aggregates_name = _aggregates_name(channel_name)
+        staged[aggregates_name] = staging_path(output_folder, aggregates_name)
+        transformed_at = datetime.now(timezone.utc).isoformat()
+        
+        cube = AggregatesBuilder()
+        with ExitStack() as stack:
+            writers = [stack.enter_context(_FrameWriter(staged[parquet_name], TRANSFORMED_SCHEMA, metrics, 'write_parquet'))]
+            if write_csv:
+                writers.append(stack.enter_context(_FrameWriter(staged[csv_name], metrics=metrics, step='write_csv')))
+            for i, chunk in enumerate(_timed_chunks(input_path, metrics, chunk_size)):
+                log = logger.info if i == 0 else logger.debug
+                chunk = _transform_frame(chunk, transformed_at, log, metrics)
+                for writer in writers:
+                    writer.write(chunk)
+                with metrics.step('aggregates'):
+                    cube.add(chunk)
+        
+        with metrics.step('write_aggregates'):
+            buckets = cube.write(staged[aggregates_name])
+        metrics.add('write_aggregates', rows_out=buckets, bytes_written=file_size(staged[aggregates_name]))
+        
+        with metrics.step('publish'):
+            _publish_dataset(output_folder, channel_name, staged, keep_versions)
+        logger.info(f"Loaded {writers[0].rows} records into {output_folder}: {', '.join(staged)}")
+        
+        if history_dir is not None:
+            with metrics.step('history'):
+                recorded = record_history(os.path.join(output_folder, parquet_name), history_dir, channel_name)
+            metrics.add('history', rows_in=writers[0].rows, rows_out=recorded)
+        
+        return metrics.finish(metrics_dir)
+        
+    except Exception as e:
+        logger.error(f"Error in transform_and_load_youtube_data: {str(e)}")
+        _discard_staged(staged)
+        raise
@@ -0,0 +1,217 @@
+import json
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+# videos.list accepts at most 50 IDs per call
+MAX_IDS_PER_CALL = 50
+
+# HTTP status codes worth retrying, and the 403 reasons that mean "slow down"
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+RETRYABLE_403_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded', 'quotaExceeded'}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: at most `rate` acquisitions per second on average,
+    with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        if tokens > self.capacity:
+            # The bucket never holds more than capacity tokens, so this would wait forever
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of capacity {self.capacity}")
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                # Refills are floats: without the tolerance a bucket short by a rounding error
+                # would sleep for waits too small to move the clock
+                if self.tokens >= tokens - 1e-9:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    True for quota/rate-limit and server-side HttpErrors.
+    """
+    if not isinstance(error, HttpError):
+        return False
+    status = int(getattr(error.resp, 'status', 0) or 0)
+    if status in RETRYABLE_STATUS:
+        return True
+    if status == 403:
+        try:
+            content = error.content.decode() if isinstance(error.content, bytes) else error.content
+            reasons = {e.get('reason') for e in json.loads(content)['error'].get('errors', [])}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return False
+        return bool(reasons & RETRYABLE_403_REASONS)
+    return False
+
+
+def execute_with_retry(execute: Callable[[], dict], max_retries: int = 5, base_delay: float = 1.0,
+                       max_delay: float = 60.0, sleep: Callable[[float], None] = time.sleep) -> dict:
+    """
+    Runs execute(), retrying retryable HttpErrors with exponential backoff and jitter.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return execute()
+        except Exception as e:
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt) * (0.5 + random.random() / 2)
+            logger.warning(f"Retryable error ({str(e)}), retrying in {delay:.1f}s")
+            sleep(delay)
+
+
+class VideoFetcher:
+    """
+    Fetches videos.list pages concurrently.
+
+    IDs are split into chunks of 50. Chunks are fetched by a bounded thread pool,
+    each worker with its own client from client_factory (the discovery client is
+    not thread-safe). Every API call goes through a shared token bucket and is
+    retried with backoff on quota/5xx errors. With use_batch_http, up to
+    calls_per_batch chunks are sent in one HTTP batch request.
+
+    Results always come back in the order of the requested IDs, so the output
+    does not depend on thread scheduling. Chunks that still fail after retrying
+    are logged and skipped, like the serial loop did.
+
+    client_factory only needs to return an object with videos().list(part, id).execute()
+    (and new_batch_http_request() for batch mode), so a local fake can stand in for
+    the discovery client.
+    """
+
+    def __init__(self, client_factory: Callable[[], object], max_workers: int = 4,
+                 requests_per_second: float = 10, max_retries: int = 5, base_delay: float = 1.0,
+                 use_batch_http: bool = False, calls_per_batch: int = 10,
+                 sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic):
+        self.client_factory = client_factory
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(requests_per_second, clock=clock, sleep=sleep)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.use_batch_http = use_batch_http
+        self.calls_per_batch = calls_per_batch
+        self.sleep = sleep
+        self._local = threading.local()
+        self.api_calls = 0
+        self.api_seconds = 0.0
+        self._calls_lock = threading.Lock()
+
+    def _client(self):
+        if not hasattr(self._local, 'client'):
+            self._local.client = self.client_factory()
+        return self._local.client
+
+    def _count_calls(self, n: int, seconds: float) -> None:
+        with self._calls_lock:
+            self.api_calls += n
+            self.api_seconds += seconds
+
+    def _fetch_chunk(self, ids: List[str], part: str) -> List[dict]:
+        def execute():
+            self.bucket.acquire()
+            start = time.perf_counter()
+            try:
+                return self._client().videos().list(part=part, id=','.join(ids)).execute()
+            finally:
+                self._count_calls(1, time.perf_counter() - start)
+
+        try:
+            response = execute_with_retry(execute, self.max_retries, self.base_delay, sleep=self.sleep)
+        except HttpError as e:
+            logger.error(f"Error fetching video details for batch: {str(e)}")
+            return []
+        return response.get('items', [])
+
+    def _fetch_batch_http(self, chunks: List[List[str]], part: str) -> List[List[dict]]:
+        # One HTTP round trip for several videos.list calls; calls failing with a retryable
+        # error are retried one by one, the others are logged and skipped like in _fetch_chunk()
+        responses: Dict[str, dict] = {}
+
+        def callback(request_id, response, exception):
+            if exception is None:
+                responses[request_id] = response
+            elif not is_retryable(exception):
+                logger.error(f"Error fetching video details for batch: {str(exception)}")
+                responses[request_id] = {}
+
+        client = self._client()
+        batch = client.new_batch_http_request(callback=callback)
+        for i, ids in enumerate(chunks):
+            batch.add(client.videos().list(part=part, id=','.join(ids)), request_id=str(i))
+        # One token per videos.list call in the batch, so a batch larger than the bucket's
+        # capacity waits for the rate instead of asking for more tokens than the bucket holds
+        for _ in chunks:
+            self.bucket.acquire()
+        start = time.perf_counter()
+        try:
+            batch.execute()
+        except HttpError as e:
+            if not is_retryable(e):
+                logger.error(f"Error fetching video details for batch: {str(e)}")
+                return [responses.get(str(i), {}).get('items', []) for i in range(len(chunks))]
+        finally:
+            self._count_calls(len(chunks), time.perf_counter() - start)
+
+        results = []
+        for i, ids in enumerate(chunks):
+            if str(i) in responses:
+                results.append(responses[str(i)].get('items', []))
+            else:
+                results.append(self._fetch_chunk(ids, part))
+        return results
+
+    def fetch(self, video_ids: List[str], parts: List[str]) -> List[dict]:
+        """
+        Fetches the given parts for every video ID.
+
+        Returns:
+        List[dict]: videos.list items, in the order of video_ids (unknown IDs are missing)
+        """
+        part = ','.join(parts)
+        chunks = [video_ids[i:i + MAX_IDS_PER_CALL] for i in range(0, len(video_ids), MAX_IDS_PER_CALL)]
+        if not chunks:
+            return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            if self.use_batch_http:
+                groups = [chunks[i:i + self.calls_per_batch] for i in range(0, len(chunks), self.calls_per_batch)]
+                chunk_items = [
+                    items
+                    for group_items in pool.map(lambda group: self._fetch_batch_http(group, part), groups)
+                    for items in group_items
+                ]
+            else:
+                chunk_items = list(pool.map(lambda ids: self._fetch_chunk(ids, part), chunks))
+
+        # Deterministic output: follow the requested ID order
+        position = {video_id: i for i, video_id in enumerate(video_ids)}
+        items = [item for items in chunk_items for item in items]
+        items.sort(key=lambda item: position.get(item.get('id'), len(position)))
+        return items
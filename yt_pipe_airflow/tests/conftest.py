@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The DAG modules are plain scripts in dags/ (that folder is on Airflow's path, not a package)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'dags'))
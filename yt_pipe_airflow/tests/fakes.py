@@ -0,0 +1,159 @@
+import json
+import threading
+
+import httplib2
+import pandas as pd
+from googleapiclient.errors import HttpError
+
+
+class FakeClock:
+    """
+    Clock and sleep that only advance when sleep() is called.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+def http_error(status: int, reason: str = '') -> HttpError:
+    content = json.dumps({'error': {'code': status, 'errors': [{'reason': reason}]}}).encode()
+    return HttpError(httplib2.Response({'status': status}), content)
+
+
+def video_item(video_id: str) -> dict:
+    number = int(video_id[1:])
+    return {
+        'id': video_id,
+        'snippet': {'channelTitle': 'Fake', 'title': f'Video {number}', 'description': '', 'tags': ['a', 'b'],
+                    'publishedAt': f'2024-{number % 12 + 1:02d}-{number % 28 + 1:02d}T{number % 24:02d}:00:00Z'},
+        'statistics': {'viewCount': str(1000 + number), 'likeCount': str(number), 'commentCount': '1'},
+        'contentDetails': {'duration': f'PT{number % 90}M{number % 60}S', 'definition': 'hd', 'caption': 'false'},
+    }
+
+
+def raw_extract(n: int) -> pd.DataFrame:
+    """
+    Raw extract rows (RAW_SCHEMA columns, text values) for n videos, with some
+    missing counts and durations.
+    """
+    rows = []
+    for video_id in video_ids(n):
+        item = video_item(video_id)
+        row = {'video_id': video_id}
+        for part in ('snippet', 'statistics', 'contentDetails'):
+            row.update(item[part])
+        row['tags'] = str(row['tags'])
+        row['data_collected_at'] = '2024-12-01T00:00:00+00:00'
+        rows.append(row)
+    df = pd.DataFrame(rows)
+    df.loc[::7, 'likeCount'] = None
+    df.loc[::11, 'duration'] = None
+    return df
+
+
+class FakeRequest:
+    def __init__(self, client, ids):
+        self.client = client
+        self.ids = ids
+
+    def execute(self):
+        return self.client.respond(self.ids)
+
+
+class FakeBatch:
+    def __init__(self, client, callback):
+        self.client = client
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.client.batches += 1
+        if self.client.batch_failures:
+            raise self.client.batch_failures.pop(0)
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, self.client.respond(request.ids, in_batch=True), None)
+            except HttpError as e:
+                self.callback(request_id, None, e)
+
+
+class FakeYouTube:
+    """
+    Stand-in for the discovery client: videos().list(part, id).execute(),
+    new_batch_http_request() and playlistItems().list(...).execute() over the
+    uploads (newest first). failures maps a video ID to the errors raised, one
+    per call, by the calls that include it; batch_failures are raised, one per
+    batch, by whole batch requests.
+    """
+
+    def __init__(self, known_ids=None, failures=None, uploads=(), batch_failures=()):
+        self.known_ids = known_ids
+        self.uploads = list(uploads)
+        self.failures = {video_id: list(errors) for video_id, errors in (failures or {}).items()}
+        self.batch_failures = list(batch_failures)
+        self.calls = []
+        self.batches = 0
+        self._lock = threading.Lock()
+
+    def videos(self):
+        return self
+
+    def playlistItems(self):
+        return FakePlaylistItems(self)
+
+    def list(self, part, id):
+        return FakeRequest(self, id.split(','))
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def respond(self, ids, in_batch=False):
+        with self._lock:
+            self.calls.append((tuple(ids), in_batch))
+            for video_id in ids:
+                if self.failures.get(video_id):
+                    raise self.failures[video_id].pop(0)
+        known = [video_id for video_id in ids if self.known_ids is None or video_id in self.known_ids]
+        # The API doesn't return items in the requested order
+        return {'items': [video_item(video_id) for video_id in reversed(known)]}
+
+
+class FakePlaylistItems:
+    def __init__(self, client, page_size=50):
+        self.client = client
+        self.page_size = page_size
+
+    def list(self, part, playlistId, maxResults, pageToken=None):
+        start = int(pageToken or 0)
+        return FakePage(self.client.uploads, start, min(maxResults, self.page_size))
+
+
+class FakePage:
+    def __init__(self, uploads, start, size):
+        self.uploads = uploads
+        self.start = start
+        self.size = size
+
+    def execute(self):
+        ids = self.uploads[self.start:self.start + self.size]
+        response = {'items': [{'contentDetails': {'videoId': video_id}} for video_id in ids]}
+        if self.start + self.size < len(self.uploads):
+            response['nextPageToken'] = str(self.start + self.size)
+        return response
+
+
+def video_ids(n):
+    return [f'v{i:04d}' for i in range(n)]
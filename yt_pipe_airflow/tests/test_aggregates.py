@@ -0,0 +1,28 @@
+import pandas as pd
+import pytest
+
+from aggregates import DAY_ORDER, MEASURES, aggregates_path_for
+from fakes import raw_extract
+from youtube_etl import RAW_SCHEMA, _FrameWriter, transform_youtube_data
+
+
+@pytest.mark.parametrize('chunk_size', [None, 7])
+@pytest.mark.parametrize('column', list(MEASURES))
+def test_day_of_week_means_match_a_groupby(tmp_path, chunk_size, column):
+    raw_path = str(tmp_path / 'raw.parquet')
+    with _FrameWriter(raw_path, RAW_SCHEMA) as writer:
+        writer.write(raw_extract(150))
+    output_path = str(tmp_path / 'transformed.parquet')
+    transform_youtube_data(raw_path, output_path, chunk_size=chunk_size)
+
+    videos = pd.read_parquet(output_path)
+    expected = (
+        videos.groupby(videos['day_of_week'].astype(str))[column].mean()
+        .astype(float).reindex(DAY_ORDER)
+    )
+    cube = pd.read_parquet(aggregates_path_for(output_path))
+    days = cube[cube['dimension'] == 'day_of_week'].sort_values('bucket_order')
+    assert days['bucket'].tolist() == DAY_ORDER
+    assert days['videos'].sum() == len(videos)
+    means = pd.Series(days[f'{MEASURES[column]}_mean'].to_numpy(), index=DAY_ORDER)
+    pd.testing.assert_series_equal(means, expected, check_names=False, check_index_type=False)
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+import youtube_etl
+from fakes import FakeYouTube, video_ids
+from youtube_etl import RAW_SCHEMA, collect_youtube_channel_data
+
+
+@pytest.fixture
+def youtube(monkeypatch):
+    client = FakeYouTube()
+    monkeypatch.setenv('yt_api_key', 'test-key')
+    monkeypatch.setattr(youtube_etl.googleapiclient.discovery, 'build', lambda *args, **kwargs: client)
+    return client
+
+
+def read_extract(path):
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype=str)
+
+
+@pytest.mark.parametrize('extension', ['.parquet', '.csv'])
+def test_full_extract(youtube, tmp_path, extension):
+    youtube.uploads = video_ids(120)
+    output_path = str(tmp_path / f'raw{extension}')
+
+    collect_youtube_channel_data('UCfake', output_path)
+
+    df = read_extract(output_path)
+    assert df['video_id'].tolist() == youtube.uploads
+    assert set(df.columns) == set(RAW_SCHEMA.names)
+
+
+@pytest.mark.parametrize('extension', ['.parquet', '.csv'])
+def test_channel_without_videos_writes_an_empty_extract(youtube, tmp_path, extension):
+    output_path = str(tmp_path / f'raw{extension}')
+
+    collect_youtube_channel_data('UCfake', output_path, incremental=True)
+
+    df = read_extract(output_path)
+    assert df.empty
+    assert list(df.columns) == RAW_SCHEMA.names
+
+    # The next incremental run starts from the empty extract
+    next_path = str(tmp_path / f'next{extension}')
+    collect_youtube_channel_data('UCfake', next_path, incremental=True, previous_path=output_path)
+    assert read_extract(next_path).empty
+
+
+def test_incremental_refreshes_statistics_of_the_previous_weekly_run(youtube, tmp_path):
+    youtube.uploads = video_ids(6)
+    now = datetime.now(timezone.utc)
+    # v0002-v0003 were stamped when last week's run finished its fetch (a bit under 7 days
+    # ago), v0004-v0005 by a manual run yesterday
+    collected_at = [now - timedelta(days=7) + timedelta(minutes=10)] * 2 + [now - timedelta(days=1)] * 2
+    previous = pd.DataFrame({
+        'video_id': youtube.uploads[2:],
+        'viewCount': ['0'] * 4,
+        'data_collected_at': [stamp.isoformat() for stamp in collected_at],
+    })
+    previous_path = str(tmp_path / 'previous.parquet')
+    previous.to_parquet(previous_path, index=False)
+    output_path = str(tmp_path / 'raw.parquet')
+
+    collect_youtube_channel_data('UCfake', output_path, incremental=True, previous_path=previous_path)
+
+    df = read_extract(output_path).set_index('video_id')
+    assert df.index.tolist() == youtube.uploads
+    # New videos, and the statistics collected by last week's run are refreshed
+    assert df.loc[youtube.uploads[:4], 'viewCount'].tolist() == ['1000', '1001', '1002', '1003']
+    assert df.loc[youtube.uploads[4:], 'viewCount'].tolist() == ['0', '0']
+    refreshed = [ids for ids, _ in youtube.calls if ids[0] == youtube.uploads[2]]
+    assert refreshed == [tuple(youtube.uploads[2:4])]
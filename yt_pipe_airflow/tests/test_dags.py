@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+pytest.importorskip('airflow')
+
+import dags
+
+
+@pytest.fixture
+def channels_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(dags.Variable, 'get', lambda *args, **kwargs: None)
+
+    def write(channels):
+        path = tmp_path / 'channels.json'
+        path.write_text(json.dumps(channels))
+        monkeypatch.setattr(dags, 'CHANNELS_CONFIG', str(path))
+    return write
+
+
+def test_load_channels(channels_file):
+    channels = [{'channel_id': 'UC1', 'channel_name': 'one'}, {'channel_id': 'UC2', 'channel_name': 'two'}]
+    channels_file(channels)
+    assert dags.load_channels() == channels
+
+
+@pytest.mark.parametrize('channels', [
+    [{'channel_id': 'UC1', 'channel_name': 'one'}, {'channel_id': 'UC2', 'channel_name': 'one'}],
+    [{'channel_id': 'UC1', 'channel_name': 'one'}, {'channel_id': 'UC1', 'channel_name': 'two'}],
+    [{'channel_id': 'UC1'}],
+])
+def test_load_channels_rejects_invalid_entries(channels_file, channels):
+    channels_file(channels)
+    with pytest.raises(ValueError):
+        dags.load_channels()
@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from history import SNAPSHOTS_DIR, append_snapshot, read_latest, video_history, view_velocity
+
+
+def snapshot(collected_at: str, counts: dict) -> pd.DataFrame:
+    """
+    counts maps a video ID to its (views, likes, comments).
+    """
+    return pd.DataFrame({
+        'video_id': list(counts),
+        'collected_at': pd.Timestamp(collected_at, tz='UTC'),
+        'viewCount': pd.array([views for views, _, _ in counts.values()], dtype='Int64'),
+        'likeCount': pd.array([likes for _, likes, _ in counts.values()], dtype='Int64'),
+        'commentCount': pd.array([comments for _, _, comments in counts.values()], dtype='Int64'),
+    })
+
+
+def partitions(history_dir: str) -> dict:
+    # Partition folder -> number of data files in it
+    snapshots_dir = os.path.join(history_dir, 'demo', SNAPSHOTS_DIR)
+    return {
+        name: len([f for f in os.listdir(os.path.join(snapshots_dir, name)) if f.endswith('.parquet')])
+        for name in sorted(os.listdir(snapshots_dir))
+    }
+
+
+def test_only_changed_rows_are_appended(tmp_path):
+    history_dir = str(tmp_path)
+    first = snapshot('2024-10-06T12:00:00', {'a': (100, 10, 1), 'b': (200, 20, 2), 'c': (300, None, 3)})
+    # b gained views, c still has no likes, d is new
+    second = snapshot('2024-10-13T12:00:00', {'a': (100, 10, 1), 'b': (260, 20, 2), 'c': (300, None, 3),
+                                             'd': (50, 5, 0)})
+
+    assert append_snapshot(first, history_dir, 'demo') == 3
+    assert append_snapshot(second, history_dir, 'demo') == 2
+    # Writing the same snapshot again is a no-op
+    assert append_snapshot(second, history_dir, 'demo') == 0
+
+    assert partitions(history_dir) == {'collected_date=2024-10-06': 1, 'collected_date=2024-10-13': 1}
+    history = video_history(history_dir, 'demo')
+    assert list(zip(history['video_id'], history['viewCount'])) == [
+        ('a', 100), ('b', 200), ('b', 260), ('c', 300), ('d', 50)
+    ]
+    latest = read_latest(history_dir, 'demo').set_index('video_id')
+    assert latest['viewCount'].to_dict() == {'a': 100, 'b': 260, 'c': 300, 'd': 50}
+    assert latest.loc['b', 'collected_at'] == pd.Timestamp('2024-10-13T12:00:00', tz='UTC')
+
+
+def test_video_history_filters(tmp_path):
+    history_dir = str(tmp_path)
+    append_snapshot(snapshot('2024-10-06T12:00:00', {'a': (100, 10, 1), 'b': (200, 20, 2)}), history_dir, 'demo')
+    append_snapshot(snapshot('2024-10-13T12:00:00', {'a': (150, 10, 1), 'b': (210, 20, 2)}), history_dir, 'demo')
+
+    assert video_history(history_dir, 'demo', video_ids=['b'])['viewCount'].tolist() == [200, 210]
+    assert video_history(history_dir, 'demo', start='2024-10-10')['viewCount'].tolist() == [150, 210]
+    assert video_history(history_dir, 'missing').empty
+
+
+def test_view_velocity(tmp_path):
+    history_dir = str(tmp_path)
+    append_snapshot(snapshot('2024-10-06T00:00:00', {'a': (100, 10, 1), 'b': (200, 20, 2)}), history_dir, 'demo')
+    append_snapshot(snapshot('2024-10-13T00:00:00', {'a': (170, 10, 1), 'b': (200, 20, 2)}), history_dir, 'demo')
+    append_snapshot(snapshot('2024-10-15T12:00:00', {'a': (220, 10, 1), 'b': (235, 20, 2)}), history_dir, 'demo')
+
+    velocity = view_velocity(video_history(history_dir, 'demo')).set_index(['video_id', 'collected_at'])
+
+    a = velocity.loc['a']
+    assert np.isnan(a['per_day'].iloc[0])
+    assert a['gained'].tolist()[1:] == [70, 50]
+    assert a['per_day'].tolist()[1:] == [10.0, 20.0]
+    # b didn't change on 2024-10-13, so its gain spans both weeks
+    b = velocity.loc['b']
+    assert b['gained'].tolist()[1:] == [35]
+    assert b['per_day'].tolist()[1:] == [35 / 9.5]
@@ -0,0 +1,57 @@
+import os
+import importlib.util
+
+import pandas as pd
+
+from aggregates import DAY_ORDER
+from fakes import raw_extract
+from youtube_etl import RAW_SCHEMA, _FrameWriter, load_youtube_data, transform_youtube_data
+
+DASHBOARD_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'yt_dashboard', 'data.py')
+
+
+def dashboard_data():
+    # The dashboard's data module, under another name: it reads what the load stage publishes
+    spec = importlib.util.spec_from_file_location('dashboard_data', DASHBOARD_DATA)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def transformed(tmp_path, name: str, n: int) -> str:
+    raw_path = str(tmp_path / f'{name}_raw.parquet')
+    with _FrameWriter(raw_path, RAW_SCHEMA) as writer:
+        writer.write(raw_extract(n))
+    output_path = str(tmp_path / f'{name}.parquet')
+    transform_youtube_data(raw_path, output_path)
+    return output_path
+
+
+def expected_means(path: str) -> pd.Series:
+    videos = pd.read_parquet(path)
+    return videos.groupby(videos['day_of_week'].astype(str))['viewCount'].mean().astype(float).reindex(DAY_ORDER)
+
+
+def no_videos():
+    raise AssertionError('the cube should be used')
+
+
+def test_day_of_week_means_follow_the_dataset_version(tmp_path):
+    data = dashboard_data()
+    dataset_dir = str(tmp_path / 'dataset')
+    path = os.path.join(dataset_dir, 'demo_channel.csv')
+    first, second = transformed(tmp_path, 'first', 80), transformed(tmp_path, 'second', 150)
+
+    load_youtube_data(first, dataset_dir, 'demo')
+    first_version = data.dataset_version(path)
+    load_youtube_data(second, dataset_dir, 'demo')
+    second_version = data.dataset_version(path)
+
+    # A session that resolved the first version before the republish still gets its cube,
+    # although the cube pointer already targets the second one
+    first_means = data.day_of_week_means(path, 'viewCount', no_videos, first_version)
+    second_means = data.day_of_week_means(path, 'viewCount', no_videos, second_version)
+    pd.testing.assert_series_equal(first_means, expected_means(first), check_names=False)
+    pd.testing.assert_series_equal(second_means, expected_means(second), check_names=False)
+    assert not first_means.equals(second_means)
+    pd.testing.assert_series_equal(data.day_of_week_means(path, 'viewCount', no_videos), second_means)
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from publish import (
+    VERSIONS_DIR, activate_version, current_version, list_versions, prune_versions, publish_file, staging_path
+)
+
+NAME = 'demo_channel.csv'
+
+
+def publish(folder, content: str, mtime: int, keep_versions: int = 3) -> str:
+    """
+    Publishes content as NAME; mtime orders the versions without relying on the clock's resolution.
+    """
+    staged = staging_path(folder, NAME)
+    with open(staged, 'w') as f:
+        f.write(content)
+    version = publish_file(staged, folder, NAME, keep_versions)
+    os.utime(os.path.join(folder, VERSIONS_DIR, version), (mtime, mtime))
+    return version
+
+
+def read(path) -> str:
+    with open(path) as f:
+        return f.read()
+
+
+def test_same_content_gets_the_same_version(tmp_path):
+    first = publish(str(tmp_path), 'a,b\n1,2\n', 1)
+    second = publish(str(tmp_path), 'a,b\n1,2\n', 2)
+
+    assert first == second
+    assert list_versions(str(tmp_path), NAME) == [first]
+    assert not [name for name in os.listdir(tmp_path / VERSIONS_DIR) if name.startswith('staging-')]
+
+
+def test_reader_keeps_the_old_version_across_a_swap(tmp_path):
+    old = publish(str(tmp_path), 'old\n', 1)
+    with open(tmp_path / NAME) as reader:
+        new = publish(str(tmp_path), 'new\n', 2)
+        # The open file still reads the version it opened; new readers get the new one
+        assert reader.read() == 'old\n'
+    assert read(tmp_path / NAME) == 'new\n'
+    assert current_version(str(tmp_path), NAME) == new != old
+    assert not os.path.exists(tmp_path / f'{NAME}.tmp')
+
+
+def test_prune_keeps_n_versions_and_the_active_one(tmp_path):
+    folder = str(tmp_path)
+    versions = [publish(folder, f'v{i}\n', i + 1, keep_versions=10) for i in range(5)]
+
+    # Roll back to the oldest, then prune: it stays although it is the oldest
+    activate_version(folder, NAME, versions[0])
+    removed = prune_versions(folder, NAME, keep=2)
+
+    assert sorted(removed) == sorted(versions[1:3])
+    assert sorted(list_versions(folder, NAME)) == sorted([versions[0], versions[3], versions[4]])
+    assert read(tmp_path / NAME) == 'v0\n'
+
+
+def test_publish_prunes_beyond_keep_versions(tmp_path):
+    folder = str(tmp_path)
+    versions = [publish(folder, f'v{i}\n', i + 1, keep_versions=1) for i in range(4)]
+
+    assert len(list_versions(folder, NAME)) == 2
+    assert current_version(folder, NAME) == versions[-1]
+
+
+def test_activate_version_rolls_back(tmp_path):
+    folder = str(tmp_path)
+    first = publish(folder, 'first\n', 1)
+    publish(folder, 'second\n', 2)
+
+    activate_version(folder, NAME, first)
+
+    assert current_version(folder, NAME) == first
+    assert read(tmp_path / NAME) == 'first\n'
+    with pytest.raises(FileNotFoundError):
+        activate_version(folder, NAME, 'demo_channel.0123456789abcdef.csv')
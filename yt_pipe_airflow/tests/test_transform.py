@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from fakes import raw_extract
+from youtube_etl import RAW_SCHEMA, _FrameWriter, transform_youtube_data
+
+
+def write_raw(tmp_path, extension: str, n: int) -> str:
+    path = str(tmp_path / f'raw{extension}')
+    with _FrameWriter(path, RAW_SCHEMA) as writer:
+        writer.write(raw_extract(n))
+    return path
+
+
+def read_transformed(path: str) -> pd.DataFrame:
+    df = pd.read_parquet(path) if path.endswith('.parquet') else pd.read_csv(path, dtype=str)
+    return df.drop(columns='transformed_at')
+
+
+@pytest.mark.parametrize('extension', ['.parquet', '.csv'])
+@pytest.mark.parametrize('chunk_size', [7, 64])
+def test_chunked_transform_matches_the_in_memory_path(tmp_path, extension, chunk_size):
+    raw_path = write_raw(tmp_path, extension, 150)
+    whole_path = str(tmp_path / f'whole{extension}')
+    chunked_path = str(tmp_path / f'chunked{extension}')
+
+    transform_youtube_data(raw_path, whole_path)
+    transform_youtube_data(raw_path, chunked_path, chunk_size=chunk_size)
+
+    whole = read_transformed(whole_path)
+    assert len(whole) == 150
+    pd.testing.assert_frame_equal(read_transformed(chunked_path), whole)
@@ -0,0 +1,200 @@
+import pytest
+from googleapiclient.errors import HttpError
+
+from fakes import FakeClock, FakeYouTube, http_error, video_ids
+from youtube_fetch import TokenBucket, VideoFetcher, execute_with_retry, is_retryable
+
+
+def test_token_bucket_limits_the_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, clock=clock, sleep=clock.sleep)
+    for _ in range(6):
+        bucket.acquire()
+    # Two tokens are available up front, the other four arrive at 2 per second
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_token_bucket_rejects_more_than_capacity():
+    bucket = TokenBucket(rate=2)
+    with pytest.raises(ValueError):
+        bucket.acquire(3)
+
+
+@pytest.mark.parametrize('status, reason, expected', [
+    (429, '', True),
+    (500, '', True),
+    (503, '', True),
+    (403, 'rateLimitExceeded', True),
+    (403, 'quotaExceeded', True),
+    (403, 'forbidden', False),
+    (404, 'notFound', False),
+    (400, 'badRequest', False),
+])
+def test_is_retryable(status, reason, expected):
+    assert is_retryable(http_error(status, reason)) is expected
+
+
+def test_is_retryable_ignores_other_errors():
+    assert not is_retryable(ValueError('boom'))
+
+
+def test_execute_with_retry_backs_off_exponentially():
+    clock = FakeClock()
+    errors = [http_error(503), http_error(429), http_error(403, 'userRateLimitExceeded')]
+
+    def execute():
+        if errors:
+            raise errors.pop(0)
+        return {'items': []}
+
+    assert execute_with_retry(execute, max_retries=5, base_delay=1.0, sleep=clock.sleep) == {'items': []}
+    assert len(clock.sleeps) == 3
+    # Delay of attempt n is base_delay * 2**n, with jitter between half and all of it
+    for attempt, delay in enumerate(clock.sleeps):
+        assert 0.5 * 2 ** attempt <= delay <= 2 ** attempt
+
+
+def test_execute_with_retry_caps_the_delay():
+    clock = FakeClock()
+
+    def execute():
+        raise http_error(500)
+
+    with pytest.raises(HttpError):
+        execute_with_retry(execute, max_retries=8, base_delay=1.0, max_delay=10.0, sleep=clock.sleep)
+    assert len(clock.sleeps) == 8
+    assert max(clock.sleeps) <= 10.0
+
+
+def test_execute_with_retry_does_not_retry_client_errors():
+    clock = FakeClock()
+    calls = []
+
+    def execute():
+        calls.append(1)
+        raise http_error(404, 'notFound')
+
+    with pytest.raises(HttpError):
+        execute_with_retry(execute, sleep=clock.sleep)
+    assert len(calls) == 1
+    assert clock.sleeps == []
+
+
+def make_fetcher(client, clock, **kwargs):
+    return VideoFetcher(lambda: client, sleep=clock.sleep, clock=clock, **kwargs)
+
+
+def test_fetch_keeps_the_requested_order():
+    clock = FakeClock()
+    client = FakeYouTube()
+    ids = video_ids(120)
+    fetcher = make_fetcher(client, clock, max_workers=3)
+
+    items = fetcher.fetch(ids, ['snippet', 'statistics'])
+
+    assert [item['id'] for item in items] == ids
+    # 50 IDs per call
+    assert sorted(len(call_ids) for call_ids, _ in client.calls) == [20, 50, 50]
+    assert fetcher.api_calls == 3
+
+
+def test_fetch_skips_unknown_ids():
+    clock = FakeClock()
+    ids = video_ids(10)
+    client = FakeYouTube(known_ids=set(ids[::2]))
+
+    items = make_fetcher(client, clock).fetch(ids, ['snippet'])
+
+    assert [item['id'] for item in items] == ids[::2]
+
+
+def test_fetch_retries_retryable_errors():
+    clock = FakeClock()
+    ids = video_ids(100)
+    client = FakeYouTube(failures={ids[60]: [http_error(429), http_error(503)]})
+
+    items = make_fetcher(client, clock, max_workers=1).fetch(ids, ['snippet'])
+
+    assert [item['id'] for item in items] == ids
+    # The second chunk failed twice, then succeeded
+    assert len(client.calls) == 4
+    assert len(clock.sleeps) == 2
+
+
+def test_fetch_skips_chunks_that_keep_failing():
+    clock = FakeClock()
+    ids = video_ids(100)
+    client = FakeYouTube(failures={ids[0]: [http_error(404, 'notFound')]})
+
+    items = make_fetcher(client, clock, max_workers=1).fetch(ids, ['snippet'])
+
+    assert [item['id'] for item in items] == ids[50:]
+
+
+def test_fetch_is_rate_limited():
+    clock = FakeClock()
+    client = FakeYouTube()
+    fetcher = make_fetcher(client, clock, max_workers=1, requests_per_second=2)
+
+    fetcher.fetch(video_ids(50 * 6), ['snippet'])
+
+    assert len(client.calls) == 6
+    assert clock.now == pytest.approx(2.0)
+
+
+@pytest.mark.parametrize('requests_per_second', [0.5, 2, 10, 50])
+def test_batch_http_fetch(requests_per_second):
+    clock = FakeClock()
+    client = FakeYouTube()
+    ids = video_ids(50 * 23)
+    fetcher = make_fetcher(client, clock, max_workers=1, requests_per_second=requests_per_second,
+                           use_batch_http=True, calls_per_batch=10)
+
+    items = fetcher.fetch(ids, ['snippet'])
+
+    assert [item['id'] for item in items] == ids
+    assert client.batches == 3
+    assert all(in_batch for _, in_batch in client.calls)
+    assert fetcher.api_calls == 23
+    # Every call of a batch takes a token, even when a batch holds more calls than the bucket
+    capacity = max(requests_per_second, 1)
+    assert clock.now == pytest.approx(max(0, 23 - capacity) / requests_per_second)
+
+
+def test_batch_http_retries_failed_calls_one_by_one():
+    clock = FakeClock()
+    ids = video_ids(50 * 4)
+    client = FakeYouTube(failures={ids[75]: [http_error(503)], ids[120]: [http_error(404, 'notFound')]})
+    fetcher = make_fetcher(client, clock, max_workers=1, use_batch_http=True, calls_per_batch=10)
+
+    items = fetcher.fetch(ids, ['snippet'])
+
+    # The 503 chunk is refetched on its own; the 404 chunk is not retryable and is skipped
+    refetched = [call_ids for call_ids, in_batch in client.calls if not in_batch]
+    assert refetched == [tuple(ids[50:100])]
+    assert [item['id'] for item in items] == ids[:100] + ids[150:]
+
+
+@pytest.mark.parametrize('use_batch_http', [False, True])
+def test_non_retryable_errors_skip_the_chunk_in_both_modes(use_batch_http):
+    clock = FakeClock()
+    ids = video_ids(50 * 3)
+    client = FakeYouTube(failures={ids[60]: [http_error(403, 'forbidden')]})
+    fetcher = make_fetcher(client, clock, max_workers=1, use_batch_http=use_batch_http, calls_per_batch=1)
+
+    items = fetcher.fetch(ids, ['snippet'])
+
+    assert [item['id'] for item in items] == ids[:50] + ids[100:]
+
+
+def test_batch_http_skips_a_batch_request_that_fails():
+    clock = FakeClock()
+    ids = video_ids(50 * 4)
+    client = FakeYouTube(batch_failures=[http_error(400, 'badRequest')])
+    fetcher = make_fetcher(client, clock, max_workers=1, use_batch_http=True, calls_per_batch=2)
+
+    items = fetcher.fetch(ids, ['snippet'])
+
+    # The first batch request is rejected as a whole; the second one still runs
+    assert client.batches == 2
+    assert [item['id'] for item in items] == ids[100:]